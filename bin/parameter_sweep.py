@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+import argparse
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import path_util  # noqa: F401
+
+from hummingbot.client.parameter_sweep import ParameterSweepRunner
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Runs a strategy config for every combination of the parameter values over "
+                                     "recorded order book data, and prints the results.")
+        self.add_argument("config_file_path",
+                          type=str,
+                          help="The strategy config file to use as template.")
+        self.add_argument("--data-dir", "-d",
+                          type=str,
+                          required=True,
+                          help="The order book recorder directory.")
+        self.add_argument("--param",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="The values to try for a config key, e.g. --param bid_spread=0.1,0.2,0.5")
+        self.add_argument("--balance",
+                          type=str,
+                          action="append",
+                          default=[],
+                          help="The starting balance of an asset, e.g. --balance BTC=1")
+        self.add_argument("--start",
+                          type=float,
+                          required=False,
+                          help="The backtest start timestamp. Defaults to the first recorded event.")
+        self.add_argument("--end",
+                          type=float,
+                          required=False,
+                          help="The backtest end timestamp. Defaults to the last recorded event.")
+        self.add_argument("--tick-size",
+                          type=float,
+                          default=1.0,
+                          help="The clock tick size in seconds.")
+        self.add_argument("--workers", "-w",
+                          type=int,
+                          required=False,
+                          help="The number of worker processes. Defaults to the number of CPUs.")
+        self.add_argument("--output", "-o",
+                          type=str,
+                          required=False,
+                          help="Writes the results to this CSV file.")
+
+
+def parse_key_values(arguments: List[str]) -> Dict[str, str]:
+    key_values = {}
+    for argument in arguments:
+        key, separator, value = argument.partition("=")
+        if separator == "" or key == "":
+            raise argparse.ArgumentTypeError(f"Invalid argument {argument}, the format is key=value.")
+        key_values[key.strip()] = value.strip()
+    return key_values
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    parameter_grid: Dict[str, List[Any]] = {key: value.split(",")
+                                            for key, value in parse_key_values(args.param).items()}
+    balances: Dict[str, Decimal] = {asset: Decimal(amount) for asset, amount in parse_key_values(args.balance).items()}
+    runner = ParameterSweepRunner(strategy_file_path=args.config_file_path,
+                                  parameter_grid=parameter_grid,
+                                  data_directory=args.data_dir,
+                                  balances=balances,
+                                  start_timestamp=args.start,
+                                  end_timestamp=args.end,
+                                  tick_size=args.tick_size,
+                                  max_workers=args.workers)
+    results_df = runner.run()
+    print(results_df.to_string(index=False))
+    if args.output is not None:
+        results_df.to_csv(args.output, index=False)
+
+
+if __name__ == "__main__":
+    main()
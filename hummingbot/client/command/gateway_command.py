@@ -13,6 +13,7 @@ from hummingbot.client.settings import AllConnectorSettings, GatewayConnectionSe
 from hummingbot.client.ui.completer import load_completer
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.connector_status import get_connector_status
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.core.gateway import get_gateway_paths
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatus
@@ -60,6 +61,16 @@ class GatewayCommand(GatewayChainApiManager):
     def gateway_list(self):
         safe_ensure_future(self._gateway_list(), loop=self.ev_loop)
 
+    def gateway_quote_cache(self):
+        quote_cache: GatewayQuoteCache = GatewayQuoteCache.get_instance()
+        if quote_cache.stats.lookups == 0:
+            self.notify("\nNo gateway quotes have been requested yet.")
+            return
+        lines = ["    " + line for line in format_df_for_printout(
+            quote_cache.stats_df(),
+            table_format=self.client_config_map.tables_format).split("\n")]
+        self.notify("\n".join(lines))
+
     def gateway_config(self,
                        key: Optional[str] = None,
                        value: str = None):
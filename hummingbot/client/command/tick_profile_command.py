@@ -0,0 +1,71 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.clock_profiler import ClockProfiler
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+SUBCOMMANDS = ['start', 'stop', 'reset']
+
+
+class TickProfileCommand:
+    def tick_profile(self,  # type: HummingbotApplication
+                     option: Optional[str] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.tick_profile, option)
+            return
+        if option is None:
+            self.notify(self.tick_profile_report())
+        else:
+            self.notify(self.set_tick_profiling(option))
+
+    def set_tick_profiling(self,  # type: HummingbotApplication
+                           option: str) -> str:
+        """
+        Starts, stops or resets the clock tick profiling. The profiler is kept in the application, so it is attached
+        to the clock of the strategies started later on.
+        :return: the message describing the result
+        """
+        if option not in SUBCOMMANDS:
+            raise ValueError(f"Invalid tick_profile option {option}, valid options are {', '.join(SUBCOMMANDS)}.")
+        if option == "start":
+            if self.clock_profiler is None:
+                self.clock_profiler = ClockProfiler()
+            if self.clock is not None:
+                self.clock.profiler = self.clock_profiler
+            return "Tick profiling started."
+        if self.clock_profiler is None:
+            return "Tick profiling is not enabled."
+        if option == "stop":
+            if self.clock is not None:
+                self.clock.profiler = None
+            self.clock_profiler = None
+            return "Tick profiling stopped."
+        self.clock_profiler.reset()
+        return "Tick profiling metrics reset."
+
+    def tick_profile_report(self,  # type: HummingbotApplication
+                            ) -> str:
+        profiler: Optional[ClockProfiler] = self.clock_profiler
+        if profiler is None:
+            return "Tick profiling is not enabled, run 'tick_profile start' to enable it."
+        if profiler.ticks == 0:
+            return "No clock ticks profiled yet."
+        tick_lag = profiler.tick_lag
+        tick_latency = profiler.tick_latency
+        lines = [
+            f"  Ticks: {profiler.ticks}    Missed ticks: {profiler.missed_ticks}",
+            f"  Tick time (ms): mean {tick_latency.mean:.3f}  p50 {tick_latency.percentile(50):.3f}  "
+            f"p99 {tick_latency.percentile(99):.3f}  max {tick_latency.max:.3f}",
+            f"  Tick lag (ms): mean {tick_lag.mean:.3f}  p50 {tick_lag.percentile(50):.3f}  "
+            f"p99 {tick_lag.percentile(99):.3f}  max {tick_lag.max:.3f}",
+            "",
+            "  Iterators:",
+        ]
+        iterators_df = profiler.iterators_df().round(3)
+        lines.extend(["    " + line for line in
+                      format_df_for_printout(iterators_df, self.client_config_map.tables_format).split("\n")])
+        return "\n".join(lines)
@@ -878,6 +878,15 @@ class ClientConfigMap(BaseClientModel):
             prompt=lambda cm: f"Select the desired db mode ({'/'.join(list(DB_MODES.keys()))})",
         ),
     )
+    db_write_behind: bool = Field(
+        default=False,
+        description=("Write the orders, trade fills and market states to the database from a background thread,"
+                     "\nso the event loop is not blocked by the database writes. The database then lags the live"
+                     "\nstate until the background writes are done."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to write to the database from a background thread? (Yes/No)",
+        ),
+    )
     pmm_script_mode: Union[tuple(PMM_SCRIPT_MODES.values())] = Field(
         default=PMMScriptDisabledMode(),
         client_data=ClientFieldData(
@@ -31,6 +31,7 @@ from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
+from hummingbot.core.clock_profiler import ClockProfiler
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
@@ -108,6 +109,7 @@ class HummingbotApplication(*commands):
         self._binance_connector = None
         self._shared_client = None
         self._mqtt: MQTTGateway = None
+        self.clock_profiler: Optional[ClockProfiler] = None
 
         # gateway variables and monitor
         self._gateway_monitor = GatewayStatusMonitor(self)
@@ -321,6 +323,7 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            write_behind=self.client_config_map.db_write_behind,
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
@@ -0,0 +1,321 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import (
+    ClientConfigAdapter,
+    get_strategy_config_map,
+    get_strategy_starter_file,
+    parse_cvar_value,
+    read_yml_file,
+)
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map, fee_overrides_dict
+from hummingbot.connector.exchange.paper_trade.replay_exchange import ReplayExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_event_log import load_order_book_events, save_order_book_events
+from hummingbot.core.data_type.order_book_event_recorder import OrderBookEventReader
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+s_decimal_0 = Decimal("0")
+
+
+def parameter_combinations(parameter_grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    :param parameter_grid: the values to try for each strategy config key
+    :return: one dictionary of config values per combination of the grid values
+    """
+    keys = list(parameter_grid.keys())
+    return [dict(zip(keys, values)) for values in itertools.product(*[parameter_grid[key] for key in keys])]
+
+
+@dataclass
+class ParameterSweepTask:
+    config_data: Dict[str, Any]
+    parameters: Dict[str, Any]
+    events_files: Dict[str, str]
+    balances: Dict[str, Decimal]
+    start_timestamp: float
+    end_timestamp: float
+    tick_size: float = 1.0
+
+
+@dataclass
+class ParameterSweepResult:
+    parameters: Dict[str, Any]
+    fills: int = 0
+    buys: int = 0
+    sells: int = 0
+    volume_quote: Decimal = s_decimal_0
+    start_base_balance: Decimal = s_decimal_0
+    end_base_balance: Decimal = s_decimal_0
+    end_base_pct: Decimal = s_decimal_0
+    pnl_quote: Decimal = s_decimal_0
+    return_pct: Decimal = s_decimal_0
+    error: Optional[str] = None
+    notifications: List[str] = field(default_factory=list)
+
+
+class RecordedTradingPairFetcher:
+    """
+    Trading pair fetcher of the sweep worker processes. The swept markets are the recorded trading pairs, so the
+    config validation must not fetch the exchanges trading pairs.
+    """
+
+    def __init__(self):
+        self.ready = True
+        self.trading_pairs: Dict[str, List[str]] = {}
+
+
+class ParameterSweepApplication:
+    """
+    Stand-in for HummingbotApplication in the sweep worker processes. It provides what the strategies start functions
+    use, but the markets are replay exchanges fed with the recorded order books instead of the configured connectors.
+    """
+    _psa_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._psa_logger is None:
+            cls._psa_logger = logging.getLogger(__name__)
+        return cls._psa_logger
+
+    def __init__(self,
+                 strategy_name: str,
+                 strategy_config_map: Union[ClientConfigAdapter, Dict[str, ConfigVar]],
+                 events_files: Dict[str, str],
+                 balances: Dict[str, Decimal]):
+        self.client_config_map: ClientConfigAdapter = ClientConfigAdapter(ClientConfigMap())
+        self.strategy_name: str = strategy_name
+        self.strategy_file_name: str = f"{strategy_name}_parameter_sweep.yml"
+        self.strategy_config_map: Union[ClientConfigAdapter, Dict[str, ConfigVar]] = strategy_config_map
+        self.markets: Dict[str, ReplayExchange] = {}
+        self.market_trading_pairs_map: Dict[str, List[str]] = defaultdict(list)
+        self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
+        self.strategy = None
+        self.trade_fill_db = None
+        self.notifications: List[str] = []
+        self._events_files: Dict[str, str] = events_files
+        self._balances: Dict[str, Decimal] = balances
+
+    def notify(self, msg: str):
+        self.notifications.append(msg)
+
+    @staticmethod
+    def _initialize_market_assets(market_name: str, trading_pairs: List[str]) -> List[Tuple[str, str]]:
+        return [tuple(trading_pair.split("-")) for trading_pair in trading_pairs]
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        for market_name, trading_pairs in market_names:
+            self.market_trading_pairs_map[market_name].extend(trading_pairs)
+
+        for connector_name, trading_pairs in self.market_trading_pairs_map.items():
+            missing_trading_pairs = [trading_pair for trading_pair in trading_pairs
+                                     if trading_pair not in self._events_files]
+            if len(missing_trading_pairs) > 0:
+                raise ValueError(f"No recorded order book events for {', '.join(missing_trading_pairs)}.")
+            connector = ReplayExchange(
+                self.client_config_map,
+                {trading_pair: load_order_book_events(self._events_files[trading_pair])
+                 for trading_pair in trading_pairs},
+                exchange_name=connector_name.replace("_paper_trade", ""),
+            )
+            for asset, balance in self._balances.items():
+                connector.set_balance(asset, balance)
+            self.markets[connector_name] = connector
+
+
+def strategy_config_map_from_data(config_data: Dict[str, Any]) -> Union[ClientConfigAdapter, Dict[str, ConfigVar]]:
+    """
+    Loads the strategy config values (as read from a strategy config file) into the strategy config map, without
+    reading or updating any file.
+    """
+    strategy_name = config_data["strategy"]
+    config_map = get_strategy_config_map(strategy_name)
+    if isinstance(config_map, ClientConfigAdapter):
+        for key in config_map.keys():
+            if key in config_data:
+                config_map.setattr_no_validation(key, config_data[key])
+        errors = config_map.validate_model()
+        if len(errors) > 0:
+            raise ValueError(f"Invalid {strategy_name} config: {'; '.join(errors)}")
+        return config_map
+
+    for key, config_var in config_map.items():
+        value = config_data.get(key)
+        if (value is None or value == "") and config_var.default is not None:
+            config_var.value = config_var.default
+            continue
+        config_var.value = parse_cvar_value(config_var, value)
+        if config_var.value is not None:
+            error = asyncio.get_event_loop().run_until_complete(config_var.validate(str(config_var.value)))
+            if error is not None:
+                raise ValueError(f"Invalid value {value} for {key}: {error}")
+    return config_map
+
+
+def run_parameter_sweep_task(task: ParameterSweepTask) -> ParameterSweepResult:
+    """
+    Runs the strategy with the task parameters over the recorded order books, ticked by a backtest clock.
+    Meant to run in a sweep worker process: the main application and the strategy config maps of the process are
+    replaced.
+    """
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+    result = ParameterSweepResult(parameters=task.parameters)
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    fee_overrides_config_map.update(fee_overrides_dict())
+    TradingPairFetcher._sf_shared_instance = RecordedTradingPairFetcher()
+    try:
+        config_data = dict(task.config_data)
+        config_data.update(task.parameters)
+        strategy_name = config_data["strategy"]
+        config_map = strategy_config_map_from_data(config_data)
+        application = ParameterSweepApplication(strategy_name, config_map, task.events_files, task.balances)
+        HummingbotApplication._main_app = application
+        get_strategy_starter_file(strategy_name)(application)
+        result.notifications = application.notifications
+        if application.strategy is None:
+            raise ValueError(f"The strategy could not be started. {' '.join(application.notifications)}")
+
+        market_info: MarketTradingPairTuple = application.market_trading_pair_tuples[0]
+        fill_logger = EventLogger()
+        market_info.market.add_listener(MarketEvent.OrderFilled, fill_logger)
+        clock = Clock(ClockMode.BACKTEST, task.tick_size, task.start_timestamp, task.end_timestamp)
+        for market in application.markets.values():
+            clock.add_iterator(market)
+        clock.add_iterator(application.strategy)
+        clock.backtest_til(task.end_timestamp)
+
+        _summarize(result, market_info, fill_logger.event_log, task.balances)
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+
+def _summarize(result: ParameterSweepResult,
+               market_info: MarketTradingPairTuple,
+               events: List[Any],
+               start_balances: Dict[str, Decimal]):
+    fills = [event for event in events if isinstance(event, OrderFilledEvent)]
+    result.fills = len(fills)
+    result.buys = len([fill for fill in fills if fill.trade_type is TradeType.BUY])
+    result.sells = result.fills - result.buys
+    result.volume_quote = sum((fill.price * fill.amount for fill in fills), s_decimal_0)
+
+    mid_price = market_info.get_mid_price()
+    start_base = Decimal(str(start_balances.get(market_info.base_asset, s_decimal_0)))
+    start_quote = Decimal(str(start_balances.get(market_info.quote_asset, s_decimal_0)))
+    end_base = market_info.market.get_balance(market_info.base_asset)
+    end_quote = market_info.market.get_balance(market_info.quote_asset)
+    start_value = start_base * mid_price + start_quote
+    end_value = end_base * mid_price + end_quote
+    # Both balances valued at the final price, so the PnL excludes the price change of the starting inventory
+    result.start_base_balance = start_base
+    result.end_base_balance = end_base
+    result.end_base_pct = end_base * mid_price / end_value * Decimal("100") if end_value > 0 else s_decimal_0
+    result.pnl_quote = end_value - start_value
+    result.return_pct = result.pnl_quote / start_value * Decimal("100") if start_value > 0 else s_decimal_0
+
+
+class ParameterSweepRunner:
+    """
+    Runs a strategy config for every combination of a parameter grid over recorded order book data (see
+    `OrderBookEventRecorder`), using replay exchanges ticked by a backtest clock. Each combination runs in its own
+    process, up to `max_workers` (the number of CPUs by default) at the same time.
+
+    The recorded events of the time range are written once per trading pair to a temporary file, that the workers
+    memory map, so all of them share the same copy of the data.
+
+    :param strategy_file_path: the strategy config file used as template
+    :param parameter_grid: the values to try for each config key, overriding the template values
+    :param data_directory: the order book recorder directory
+    :param balances: the starting balance of every asset
+    """
+
+    def __init__(self,
+                 strategy_file_path: str,
+                 parameter_grid: Dict[str, List[Any]],
+                 data_directory: str,
+                 balances: Dict[str, Decimal],
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None,
+                 tick_size: float = 1.0,
+                 max_workers: Optional[int] = None):
+        self._config_data: Dict[str, Any] = read_yml_file(strategy_file_path)
+        self._parameter_grid: Dict[str, List[Any]] = parameter_grid
+        self._data_directory: str = data_directory
+        self._balances: Dict[str, Decimal] = balances
+        self._start_timestamp: Optional[float] = start_timestamp
+        self._end_timestamp: Optional[float] = end_timestamp
+        self._tick_size: float = tick_size
+        self._max_workers: int = max_workers or os.cpu_count()
+
+    def run(self) -> pd.DataFrame:
+        with tempfile.TemporaryDirectory() as shared_directory:
+            events_files, start_timestamp, end_timestamp = self._share_recorded_events(shared_directory)
+            tasks = [
+                ParameterSweepTask(config_data=self._config_data,
+                                   parameters=parameters,
+                                   events_files=events_files,
+                                   balances=self._balances,
+                                   start_timestamp=start_timestamp,
+                                   end_timestamp=end_timestamp,
+                                   tick_size=self._tick_size)
+                for parameters in parameter_combinations(self._parameter_grid)
+            ]
+            with ProcessPoolExecutor(max_workers=min(self._max_workers, len(tasks)),
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                results = list(executor.map(run_parameter_sweep_task, tasks))
+        return self.results_df(results)
+
+    def _share_recorded_events(self, shared_directory: str) -> Tuple[Dict[str, str], float, float]:
+        reader = OrderBookEventReader(self._data_directory)
+        events_files = {}
+        start_timestamps = []
+        end_timestamps = []
+        for trading_pair in reader.trading_pairs:
+            events = reader.read_events(trading_pair, self._start_timestamp, self._end_timestamp)
+            if len(events) == 0:
+                continue
+            file_path = os.path.join(shared_directory, f"{trading_pair}.npy")
+            save_order_book_events(file_path, events)
+            events_files[trading_pair] = file_path
+            start_timestamps.append(float(events["timestamp"][0]))
+            end_timestamps.append(float(events["timestamp"][-1]))
+        if len(events_files) == 0:
+            raise ValueError(f"No recorded order book events found in {self._data_directory}.")
+        start_timestamp = self._start_timestamp if self._start_timestamp is not None else min(start_timestamps)
+        end_timestamp = self._end_timestamp if self._end_timestamp is not None else max(end_timestamps)
+        return events_files, start_timestamp, end_timestamp
+
+    def results_df(self, results: List[ParameterSweepResult]) -> pd.DataFrame:
+        columns = list(self._parameter_grid.keys()) + [
+            "Fills", "Buys", "Sells", "Volume (quote)", "Start base", "End base", "End base %", "PnL (quote)",
+            "Return %", "Error"
+        ]
+        data = [
+            [result.parameters[key] for key in self._parameter_grid.keys()] + [
+                result.fills, result.buys, result.sells, float(result.volume_quote),
+                float(result.start_base_balance), float(result.end_base_balance), float(result.end_base_pct),
+                float(result.pnl_quote), float(result.return_pct), result.error or ""
+            ]
+            for result in results
+        ]
+        return pd.DataFrame(data=data, columns=columns).sort_values(by="PnL (quote)", ascending=False, kind="stable")
@@ -54,7 +54,7 @@ class HummingbotCompleter(Completer):
         self._export_completer = WordCompleter(["keys", "trades"], ignore_case=True)
         self._balance_completer = WordCompleter(["limit", "paper"], ignore_case=True)
         self._history_completer = WordCompleter(["--days", "--verbose", "--precision"], ignore_case=True)
-        self._gateway_completer = WordCompleter(["config", "connect", "connector-tokens", "generate-certs", "status", "test-connection", "list", "approve-tokens"], ignore_case=True)
+        self._gateway_completer = WordCompleter(["config", "connect", "connector-tokens", "generate-certs", "status", "test-connection", "list", "approve-tokens", "quote-cache"], ignore_case=True)
         self._gateway_connect_completer = WordCompleter(GATEWAY_CONNECTORS, ignore_case=True)
         self._gateway_connector_tokens_completer = WordCompleter(
             sorted(
@@ -76,6 +76,7 @@ class HummingbotCompleter(Completer):
         self._script_strategy_completer = WordCompleter(file_name_list(str(SCRIPT_STRATEGIES_PATH), "py"))
         self._rate_oracle_completer = WordCompleter(list(RATE_ORACLE_SOURCES.keys()), ignore_case=True)
         self._mqtt_completer = WordCompleter(["start", "stop", "restart"], ignore_case=True)
+        self._tick_profile_completer = WordCompleter(["start", "stop", "reset"], ignore_case=True)
         self._gateway_chains = []
         self._gateway_networks = []
         self._list_gateway_wallets_parameters = {"wallets": [], "chain": ""}
@@ -253,6 +254,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("mqtt ")
 
+    def _complete_tick_profile_options(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("tick_profile ")
+
     def get_completions(self, document: Document, complete_event: CompleteEvent):
         """
         Get completions for the current scope. This is the defining function for the completer
@@ -397,6 +402,10 @@ class HummingbotCompleter(Completer):
             for c in self._mqtt_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_tick_profile_options(document):
+            for c in self._tick_profile_completer.get_completions(document, complete_event):
+                yield c
+
         else:
             text_before_cursor: str = document.text_before_cursor
             try:
@@ -124,6 +124,9 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     gateway_test_parser = gateway_subparsers.add_parser("test-connection", help="Ping gateway api server")
     gateway_test_parser.set_defaults(func=hummingbot.test_connection)
 
+    gateway_quote_cache_parser = gateway_subparsers.add_parser("quote-cache", help="Show the gateway quote cache statistics")
+    gateway_quote_cache_parser.set_defaults(func=hummingbot.gateway_quote_cache)
+
     exit_parser = subparsers.add_parser("exit", help="Exit and cancel all outstanding orders")
     exit_parser.add_argument("-f", "--force", action="store_true", help="Force exit without canceling outstanding orders",
                              default=False)
@@ -139,6 +142,11 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    tick_profile_parser = subparsers.add_parser("tick_profile", help="Profile the time spent in each clock tick")
+    tick_profile_parser.add_argument("option", nargs="?", choices=("start", "stop", "reset"), default=None,
+                                     help="Start, stop or reset the profiling (shows the report if not provided)")
+    tick_profile_parser.set_defaults(func=hummingbot.tick_profile)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
@@ -2,8 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from cachetools import TTLCache
 
@@ -29,6 +28,109 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class _OrdersCache(TTLCache):
+    """
+    TTLCache that notifies every order added to it, to keep the tracker indexes up to date
+    """
+
+    def __init__(self, maxsize: int, ttl: float, on_order_added: Callable[[InFlightOrder], None]):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_order_added = on_order_added
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._on_order_added(value)
+
+
+class _OrdersView(Mapping):
+    """
+    Read-only live view of the union of several order buckets, keyed by client order ID.
+    The tracker keeps every order in a single bucket, so the view length is the sum of the bucket lengths.
+    Lookups go straight to the buckets. Iteration, `values()` and `items()` work on a snapshot of the buckets taken
+    when they are called, so the callers can change the tracked orders or await inside the loop.
+    """
+
+    def __init__(self, buckets: List[Mapping[str, InFlightOrder]]):
+        self._buckets = buckets
+        self._lookup_buckets = buckets[::-1]
+
+    def __getitem__(self, client_order_id: str) -> InFlightOrder:
+        for bucket in self._lookup_buckets:
+            if client_order_id in bucket:
+                return bucket[client_order_id]
+        raise KeyError(client_order_id)
+
+    def __contains__(self, client_order_id) -> bool:
+        return any(client_order_id in bucket for bucket in self._buckets)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets)
+
+    def keys(self) -> List[str]:
+        return list(self.snapshot())
+
+    def values(self) -> List[InFlightOrder]:
+        return list(self.snapshot().values())
+
+    def items(self) -> List[Tuple[str, InFlightOrder]]:
+        return list(self.snapshot().items())
+
+    def snapshot(self) -> Dict[str, InFlightOrder]:
+        """
+        Returns a dictionary with the orders currently in the view
+        """
+        orders: Dict[str, InFlightOrder] = {}
+        for bucket in self._buckets:
+            orders.update(bucket.items())
+        return orders
+
+
+class _ExchangeOrderIdView(Mapping):
+    """
+    Read-only live view of an _OrdersView keyed by exchange order ID.
+    As in _OrdersView, iteration, `values()` and `items()` work on a snapshot of the orders.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", orders: _OrdersView):
+        self._tracker = tracker
+        self._orders = orders
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker._indexed_order_by_exchange_order_id(exchange_order_id)
+        if order is None or self._orders.get(order.client_order_id) is not order:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        # Only the orders still waiting for their exchange order ID are checked, instead of the whole view
+        pending_orders = self._tracker._orders_pending_exchange_order_id()
+        return len(self._orders) - sum(1 for client_order_id, order in pending_orders.items()
+                                       if self._orders.get(client_order_id) is order)
+
+    def keys(self) -> List[str]:
+        return list(self.snapshot())
+
+    def values(self) -> List[InFlightOrder]:
+        return list(self.snapshot().values())
+
+    def items(self) -> List[Tuple[str, InFlightOrder]]:
+        return list(self.snapshot().items())
+
+    def snapshot(self) -> Dict[str, InFlightOrder]:
+        """
+        Returns a dictionary with the orders currently in the view that have an exchange order ID
+        """
+        return {order.exchange_order_id: order
+                for order in self._orders.values()
+                if order.exchange_order_id is not None}
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -55,9 +157,25 @@ class ClientOrderTracker:
         self._connector: ConnectorBase = connector
         self._lost_order_count_limit = lost_order_count_limit
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
-        self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
+        self._cached_orders: TTLCache = _OrdersCache(
+            maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL, on_order_added=self._index_order)
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        # Secondary index by exchange order ID. Orders get their exchange order ID after being tracked, so the ones
+        # still without it are kept apart and indexed on the next lookup. Entries of orders no longer tracked are
+        # ignored by the views and pruned periodically.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+
+        # Live views over the order buckets, so lookups don't require merging the dictionaries on every access
+        self._cached_orders_view = _OrdersView([self._cached_orders])
+        self._all_orders = _OrdersView([self._in_flight_orders, self._cached_orders])
+        self._all_fillable_orders = _OrdersView([self._in_flight_orders, self._cached_orders, self._lost_orders])
+        self._all_updatable_orders = _OrdersView([self._in_flight_orders, self._lost_orders])
+        self._all_orders_by_exchange_order_id = _ExchangeOrderIdView(self, self._all_orders)
+        self._all_fillable_orders_by_exchange_order_id = _ExchangeOrderIdView(self, self._all_fillable_orders)
+        self._all_updatable_orders_by_exchange_order_id = _ExchangeOrderIdView(self, self._all_updatable_orders)
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -70,53 +188,46 @@ class ClientOrderTracker:
         return self._in_flight_orders
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns orders that are no longer actively tracked.
+        Returns a read-only view of the orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return self._cached_orders_view
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return self._all_orders
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return self._all_fillable_orders
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return self._all_fillable_orders_by_exchange_order_id
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return self._all_updatable_orders
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return self._all_updatable_orders_by_exchange_order_id
 
     @property
     def current_timestamp(self) -> int:
@@ -141,7 +252,10 @@ class ClientOrderTracker:
         self._lost_order_count_limit = value
 
     def start_tracking_order(self, order: InFlightOrder):
+        self._cached_orders.pop(order.client_order_id, None)
+        self._lost_orders.pop(order.client_order_id, None)
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -149,6 +263,7 @@ class ClientOrderTracker:
             del self._in_flight_orders[client_order_id]
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
+            self._prune_exchange_order_id_index()
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -161,7 +276,7 @@ class ClientOrderTracker:
                 self.start_tracking_order(order)
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
-                self._lost_orders[order.client_order_id] = order
+                self._start_tracking_lost_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,28 +287,22 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._all_orders.get(client_order_id)
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._all_orders_by_exchange_order_id.get(exchange_order_id)
 
         return found_order
 
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._lost_orders.get(client_order_id)
 
-        if client_order_id in self._lost_orders:
-            found_order = self._lost_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            order = self._indexed_order_by_exchange_order_id(exchange_order_id)
+            if order is not None and self._lost_orders.get(order.client_order_id) is order:
+                found_order = order
 
         return found_order
 
@@ -203,7 +312,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self._all_fillable_orders.get(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -248,7 +357,7 @@ class ClientOrderTracker:
                     )
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
-                    self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._start_tracking_lost_order(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -304,6 +413,46 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _start_tracking_lost_order(self, order: InFlightOrder):
+        self._in_flight_orders.pop(order.client_order_id, None)
+        self._cached_orders.pop(order.client_order_id, None)
+        self._lost_orders[order.client_order_id] = order
+        self._index_order(order)
+
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is not None:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        else:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+
+    def _indexed_order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        self._orders_pending_exchange_order_id()
+        return self._orders_by_exchange_order_id.get(exchange_order_id)
+
+    def _orders_pending_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+        """
+        Moves to the exchange order ID index the orders that got their exchange order ID since the last lookup,
+        and returns the indexed orders still without it (keyed by client order ID).
+        """
+        if self._orders_without_exchange_order_id:
+            for client_order_id, order in list(self._orders_without_exchange_order_id.items()):
+                if order.exchange_order_id is not None:
+                    del self._orders_without_exchange_order_id[client_order_id]
+                    self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        return self._orders_without_exchange_order_id
+
+    def _prune_exchange_order_id_index(self):
+        """
+        Rebuilds the exchange order ID index when most of its entries belong to orders no longer tracked
+        (i.e. expired from the cache), keeping the cost amortized over the orders that stop being tracked.
+        """
+        indexed_count = len(self._orders_by_exchange_order_id) + len(self._orders_without_exchange_order_id)
+        if indexed_count > 2 * (len(self._in_flight_orders) + len(self._lost_orders) + self.MAX_CACHE_SIZE):
+            self._orders_by_exchange_order_id = {}
+            self._orders_without_exchange_order_id = {}
+            for order in self._all_fillable_orders.values():
+                self._index_order(order)
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -598,9 +598,7 @@ class DydxPerpetualDerivative(PerpetualDerivativePyBase):
 
     def _process_rest_fills(self, fills_data: List) -> List[TradeUpdate]:
         trade_updates = []
-        all_fillable_orders_by_exchange_order_id = {
-            order.exchange_order_id: order for order in self._order_tracker.all_fillable_orders.values()
-        }
+        all_fillable_orders_by_exchange_order_id = self._order_tracker.all_fillable_orders_by_exchange_order_id
         for fill_data in fills_data:
             exchange_order_id: str = fill_data["orderId"]
             order = all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
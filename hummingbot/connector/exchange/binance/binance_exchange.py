@@ -371,9 +371,7 @@ class BinanceExchange(ExchangePyBase):
                 or (self.in_flight_orders and small_interval_current_tick > small_interval_last_tick)):
             query_time = int(self._last_trades_poll_binance_timestamp * 1e3)
             self._last_trades_poll_binance_timestamp = self._time_synchronizer.time()
-            order_by_exchange_id_map = {}
-            for order in self._order_tracker.all_fillable_orders.values():
-                order_by_exchange_id_map[order.exchange_order_id] = order
+            order_by_exchange_id_map = dict(self._order_tracker.all_fillable_orders_by_exchange_order_id)
 
             tasks = []
             trading_pairs = self.trading_pairs
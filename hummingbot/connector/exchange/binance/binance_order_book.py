@@ -4,7 +4,8 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage,
-    OrderBookMessageType
+    OrderBookMessageType,
+    order_book_rows_array,
 )
 
 
@@ -28,7 +29,9 @@ class BinanceOrderBook(OrderBook):
             "trading_pair": msg["trading_pair"],
             "update_id": msg["lastUpdateId"],
             "bids": msg["bids"],
-            "asks": msg["asks"]
+            "asks": msg["asks"],
+            "bids_array": order_book_rows_array(msg["bids"], msg["lastUpdateId"]),
+            "asks_array": order_book_rows_array(msg["asks"], msg["lastUpdateId"]),
         }, timestamp=timestamp)
 
     @classmethod
@@ -50,7 +53,9 @@ class BinanceOrderBook(OrderBook):
             "first_update_id": msg["U"],
             "update_id": msg["u"],
             "bids": msg["b"],
-            "asks": msg["a"]
+            "asks": msg["a"],
+            "bids_array": order_book_rows_array(msg["b"], msg["u"]),
+            "asks_array": order_book_rows_array(msg["a"], msg["u"]),
         }, timestamp=timestamp)
 
     @classmethod
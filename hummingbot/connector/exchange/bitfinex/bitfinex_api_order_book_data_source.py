@@ -82,6 +82,8 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         # Dictionary that maps Order IDs to book enties (i.e. price, amount, and update_id the
         # way it is stored in Hummingbot order book, usually timestamp)
         self._tracked_book_entries: Dict[int, OrderBookRow] = {}
+        # Full depth books receive many updates on existing levels, which the price level index applies in place
+        self._order_book_create_function = lambda: OrderBook(price_level_index=True)
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
@@ -46,7 +46,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._api_factory = api_factory or build_api_factory(throttler=throttler)
         self._rest_assistant = None
         self._ws_assistant = None
-        self._order_book_create_function = lambda: OrderBook()
+        self._order_book_create_function = lambda: OrderBook(price_level_index=True)
 
     @classmethod
     def _get_throttler_instance(cls) -> AsyncThrottler:
@@ -0,0 +1,31 @@
+from libc.stdint cimport int64_t, uint8_t
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+from hummingbot.core.data_type.order_book cimport OrderBook
+
+
+cdef class OrderBookEventsReplay:
+    cdef:
+        str _trading_pair
+        object _events
+        const double[:] _timestamps
+        const int64_t[:] _update_ids
+        const double[:] _prices
+        const double[:] _amounts
+        const uint8_t[:] _types
+        const uint8_t[:] _sides
+        const int64_t[:] _message_starts
+        Py_ssize_t _events_count
+        Py_ssize_t _messages_count
+        Py_ssize_t _next_message
+        int64_t _replayed_events
+
+    cdef int64_t c_replay_until(self, OrderBook order_book, double timestamp) except -1
+
+
+cdef class ReplayExchange(PaperTradeExchange):
+    cdef:
+        dict _replays
+        int64_t _replayed_events
+
+    cdef c_replay_order_books(self, double timestamp)
@@ -0,0 +1,205 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+import math
+from typing import Dict, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from libc.stdint cimport int64_t, uint8_t
+from libcpp.vector cimport vector
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.replay_order_book_tracker import ReplayOrderBookTracker
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_event_log import (
+    BID_SIDE,
+    ORDER_BOOK_EVENT_DTYPE,
+    order_book_message_starts,
+    sort_order_book_events,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+cdef uint8_t SNAPSHOT_EVENT = OrderBookMessageType.SNAPSHOT.value
+cdef uint8_t TRADE_EVENT = OrderBookMessageType.TRADE.value
+cdef uint8_t BID_EVENT_SIDE = BID_SIDE
+cdef uint8_t SELL_TRADE_SIDE = TradeType.SELL.value
+
+
+cdef class OrderBookEventsReplay:
+    """
+    Replays the recorded order book events of a trading pair in timestamp order. The event columns are read in place,
+    so memory mapped event files are not copied.
+    """
+
+    def __init__(self, str trading_pair, object events):
+        if events.dtype != ORDER_BOOK_EVENT_DTYPE:
+            raise ValueError(f"Invalid order book events dtype {events.dtype} for {trading_pair}.")
+        events = sort_order_book_events(events)
+        self._trading_pair = trading_pair
+        self._events = events
+        self._timestamps = events["timestamp"]
+        self._update_ids = events["update_id"]
+        self._prices = events["price"]
+        self._amounts = events["amount"]
+        self._types = events["type"]
+        self._sides = events["side"]
+        self._message_starts = order_book_message_starts(events)
+        self._events_count = len(events)
+        self._messages_count = len(self._message_starts)
+        self._next_message = 0
+        self._replayed_events = 0
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def start_timestamp(self) -> float:
+        return self._timestamps[0] if self._events_count > 0 else float("NaN")
+
+    @property
+    def end_timestamp(self) -> float:
+        return self._timestamps[self._events_count - 1] if self._events_count > 0 else float("NaN")
+
+    @property
+    def replayed_events(self) -> int:
+        return self._replayed_events
+
+    @property
+    def finished(self) -> bool:
+        return self._next_message >= self._messages_count
+
+    cdef int64_t c_replay_until(self, OrderBook order_book, double timestamp) except -1:
+        """
+        Applies to the order book all the messages not replayed yet with a timestamp up to the given one. Snapshots
+        and diffs are applied level by level, trades are applied as trade events, so the order book listeners (the
+        paper trade limit order matching) are notified.
+        :return: the number of events replayed
+        """
+        cdef:
+            Py_ssize_t start
+            Py_ssize_t end
+            Py_ssize_t i
+            uint8_t event_type
+            int64_t replayed = 0
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+
+        while self._next_message < self._messages_count:
+            start = self._message_starts[self._next_message]
+            if self._timestamps[start] > timestamp:
+                break
+            if self._next_message + 1 < self._messages_count:
+                end = self._message_starts[self._next_message + 1]
+            else:
+                end = self._events_count
+            event_type = self._types[start]
+            if event_type == TRADE_EVENT:
+                order_book.c_apply_trade(OrderBookTradeEvent(
+                    trading_pair=self._trading_pair,
+                    timestamp=self._timestamps[start],
+                    type=TradeType.SELL if self._sides[start] == SELL_TRADE_SIDE else TradeType.BUY,
+                    price=self._prices[start],
+                    amount=self._amounts[start],
+                    trade_id=str(self._update_ids[start]),
+                ))
+            else:
+                bids.clear()
+                asks.clear()
+                for i in range(start, end):
+                    if self._sides[i] == BID_EVENT_SIDE:
+                        bids.push_back(OrderBookEntry(self._prices[i], self._amounts[i], self._update_ids[i]))
+                    else:
+                        asks.push_back(OrderBookEntry(self._prices[i], self._amounts[i], self._update_ids[i]))
+                if event_type == SNAPSHOT_EVENT:
+                    order_book.c_apply_snapshot(bids, asks, self._update_ids[start])
+                else:
+                    order_book.c_apply_diffs(bids, asks, self._update_ids[start])
+            replayed += end - start
+            self._next_message += 1
+        self._replayed_events += replayed
+        return replayed
+
+
+cdef class ReplayExchange(PaperTradeExchange):
+    """
+    Paper trade exchange fed with recorded order book events instead of live exchange data. Every clock tick first
+    replays the events up to the tick timestamp into the order books, and then processes the paper trade orders, so
+    strategies run unchanged on the historical data when the exchange is ticked by a backtest clock:
+
+        exchange = ReplayExchange(client_config_map, {"BTC-USDT": load_order_book_events(path)}, "binance")
+        clock = Clock(ClockMode.BACKTEST, start_time=exchange.start_timestamp, end_time=exchange.end_timestamp)
+        clock.add_iterator(exchange)
+        clock.add_iterator(strategy)
+
+    :param order_book_events: the order book event rows (see `order_book_event_log`) of each trading pair
+    :param exchange_name: the name of the exchange the events were recorded from, used to get its trading fees
+    """
+
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 order_book_events: Dict[str, np.ndarray],
+                 exchange_name: str):
+        trading_pairs = list(order_book_events.keys())
+        PaperTradeExchange.__init__(
+            self,
+            client_config_map,
+            ReplayOrderBookTracker(trading_pairs=trading_pairs),
+            ReplayExchange,
+            exchange_name=exchange_name,
+        )
+        self._replays = {}
+        self._replayed_events = 0
+        for trading_pair, events in order_book_events.items():
+            self._replays[trading_pair] = OrderBookEventsReplay(trading_pair, events)
+            self.order_book_tracker.order_books[trading_pair] = CompositeOrderBook()
+        self.init_paper_trade_market()
+        self._paper_trade_market_initialized = True
+
+    @property
+    def display_name(self) -> str:
+        return f"{self._exchange_name}_Replay"
+
+    @property
+    def start_timestamp(self) -> float:
+        timestamps = [replay.start_timestamp for replay in self._replays.values()]
+        return min((timestamp for timestamp in timestamps if not math.isnan(timestamp)), default=float("NaN"))
+
+    @property
+    def end_timestamp(self) -> float:
+        timestamps = [replay.end_timestamp for replay in self._replays.values()]
+        return max((timestamp for timestamp in timestamps if not math.isnan(timestamp)), default=float("NaN"))
+
+    @property
+    def replayed_events(self) -> int:
+        return self._replayed_events
+
+    @property
+    def replay_finished(self) -> bool:
+        return all(replay.finished for replay in self._replays.values())
+
+    def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
+        return split_hb_trading_pair(trading_pair)
+
+    def replay_order_books(self, timestamp: float):
+        self.c_replay_order_books(timestamp)
+
+    cdef c_replay_order_books(self, double timestamp):
+        cdef:
+            OrderBookEventsReplay replay
+            dict order_books = self.order_book_tracker.order_books
+        for trading_pair, replay in self._replays.items():
+            self._replayed_events += replay.c_replay_until(order_books[trading_pair], timestamp)
+
+    cdef c_tick(self, double timestamp):
+        self.c_replay_order_books(timestamp)
+        PaperTradeExchange.c_tick(self, timestamp)
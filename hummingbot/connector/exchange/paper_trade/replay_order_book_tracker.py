@@ -0,0 +1,34 @@
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source without network access. The replay exchange feeds the order books with the recorded events.
+    """
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker holding the order books of a replay exchange. It is ready from the beginning, and it does not
+    start any listening task since the order books are updated by the exchange on every clock tick.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(data_source=ReplayOrderBookTrackerDataSource(trading_pairs=trading_pairs),
+                         trading_pairs=trading_pairs)
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
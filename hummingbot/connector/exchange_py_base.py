@@ -2,9 +2,10 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -45,11 +46,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Max number of order status or trade requests in flight during the orders reconciliation
+    ORDER_UPDATES_MAX_CONCURRENCY = 10
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
 
         self._last_poll_timestamp = 0
+        # Local time of the end of the last status poll, compared with the local time the order updates are applied
+        self._last_poll_local_timestamp = 0
         self._last_timestamp = 0
         self._trading_rules = {}
         self._trading_fees = {}
@@ -730,6 +735,7 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _stop_network(self):
         # Resets timestamps and events for status_polling_loop
         self._last_poll_timestamp = 0
+        self._last_poll_local_timestamp = 0
         self._last_timestamp = 0
         self._poll_notifier = asyncio.Event()
 
@@ -813,6 +819,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
+                self._last_poll_local_timestamp = time.time()
                 self._poll_notifier = asyncio.Event()
             except asyncio.CancelledError:
                 raise
@@ -974,18 +981,37 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._in_flight_orders_snapshot_timestamp = self.current_timestamp
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        if len(orders) == 0:
+            return
+        trade_updates: Optional[List[TradeUpdate]] = None
+        try:
+            trade_updates = await self._all_trade_updates_for_orders(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for all orders, requesting them per order. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+        if trade_updates is not None:
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        else:
+            await self._run_order_requests(self._update_order_fills(order=order) for order in orders)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -1009,19 +1035,68 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
-                self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                await error_handler(order, request_error)
+        if len(orders) == 0:
+            return
+        order_updates: Dict[str, OrderUpdate] = {}
+        try:
+            order_updates = await self._request_orders_status(orders=orders) or {}
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the status of all orders, requesting it per order. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+        for order_update in order_updates.values():
+            self._order_tracker.process_order_update(order_update)
+        await self._run_order_requests(
+            self._update_order_with_error_handler(order=order, error_handler=error_handler)
+            for order in orders
+            if order.client_order_id not in order_updates
+        )
+
+    async def _update_order_with_error_handler(self, order: InFlightOrder, error_handler: Callable):
+        try:
+            order_update = await self._request_order_status(tracked_order=order)
+            self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            await error_handler(order, request_error)
+
+    async def _run_order_requests(self, requests: Iterable[Awaitable]):
+        """
+        Runs the orders reconciliation requests concurrently, with at most ORDER_UPDATES_MAX_CONCURRENCY of them in
+        flight. Each request still waits for the throttler capacity before being sent.
+        """
+        semaphore = asyncio.Semaphore(self.ORDER_UPDATES_MAX_CONCURRENCY)
+
+        async def run_request(request: Awaitable):
+            async with semaphore:
+                await request
+
+        await safe_gather(*[run_request(request) for request in requests])
+
+    def _is_order_confirmed_since_last_poll(self, order: InFlightOrder) -> bool:
+        """
+        Orders that received an order update after the last status poll (from the user stream or the order creation
+        response) already have their state confirmed by the exchange, and don't need to be requested again in this
+        poll. Fills don't confirm the order state, and a fill processed after the last order update (that might have
+        completed the order) requires the status request.
+        Both times are local, the exchange timestamp of the update is not comparable with the local clock.
+        """
+        return (self._last_poll_local_timestamp > 0
+                and order.exchange_order_id is not None
+                and not order.is_pending_create
+                and order.last_state_update_local_timestamp > self._last_poll_local_timestamp)
 
     async def _update_orders(self):
-        orders_to_update = self.in_flight_orders.copy()
+        orders_to_update = [
+            order for order in self.in_flight_orders.values() if not self._is_order_confirmed_since_last_poll(order)
+        ]
         await self._update_orders_with_error_handler(
-            orders=list(orders_to_update.values()), error_handler=self._handle_update_error_for_active_order
+            orders=orders_to_update, error_handler=self._handle_update_error_for_active_order
         )
 
     async def _update_lost_orders(self):
@@ -1039,7 +1114,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         await self._update_lost_orders()
 
     async def _cancel_lost_orders(self):
-        for _, lost_order in self._order_tracker.lost_orders.items():
+        for lost_order in list(self._order_tracker.lost_orders.values()):
             await self._execute_order_cancel(order=lost_order)
 
     # Methods tied to specific API data formats
@@ -1068,6 +1143,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _all_trade_updates_for_orders(self, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        """
+        Connectors able to fetch the recent fills of all the orders in a single request should override this method.
+        :param orders: the orders to get the fills for
+        :return: the trade updates of the orders, or None to request the fills of each order separately
+        """
+        return None
+
+    async def _request_orders_status(self, orders: List[InFlightOrder]) -> Optional[Dict[str, OrderUpdate]]:
+        """
+        Connectors able to fetch the status of many orders in a single request (i.e. all open orders) should override
+        this method. The status of the orders not included in the result is requested per order.
+        :param orders: the orders to get the status for
+        :return: a dictionary of client order id to the order update, or None if not supported
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -14,6 +14,7 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -29,7 +30,6 @@ from hummingbot.core.event.events import (
 from hummingbot.core.gateway import check_transaction_exceptions
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -259,6 +259,7 @@ class GatewayEVMAMM(ConnectorBase):
             )
             if type(self._chain_info) != list:
                 self._native_currency = self._chain_info.get("nativeCurrency", "ETH")
+                self._report_block_number(self._chain_info)
         except asyncio.CancelledError:
             raise
         except Exception as e:
@@ -268,6 +269,27 @@ class GatewayEVMAMM(ConnectorBase):
                 app_warning_msg=str(e)
             )
 
+    async def update_block_number(self):
+        """
+        Reports the current block number of the network to the quote cache, so the quotes of previous blocks are
+        requested again.
+        """
+        try:
+            network_status = await self._get_gateway_instance().get_network_status(
+                chain=self.chain, network=self.network, fail_silently=True
+            )
+            if isinstance(network_status, dict):
+                self._report_block_number(network_status)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().debug(f"Error fetching the block number of {self.chain} {self.network}.", exc_info=True)
+
+    def _report_block_number(self, network_status: Dict[str, Any]):
+        block_number = network_status.get("currentBlockNumber")
+        if isinstance(block_number, int) and block_number > 0:
+            GatewayQuoteCache.get_instance().update_block_number(self.chain, self.network, block_number)
+
     async def get_gas_estimate(self):
         """
         Gets the gas estimates for the connector.
@@ -400,7 +422,6 @@ class GatewayEVMAMM(ConnectorBase):
             return Decimal(str(price))
         return None
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -434,9 +455,7 @@ class GatewayEVMAMM(ConnectorBase):
             if test_price is not None:
                 # Grab the gas price for test net.
                 try:
-                    resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                        self.chain, self.network, self.connector_name, base, quote, amount, side
-                    )
+                    resp: Dict[str, Any] = await self.get_price_response(base, quote, amount, side)
                     gas_price_token: str = resp["gasPriceToken"]
                     gas_cost: Decimal = Decimal(resp["gasCost"])
                     self.network_transaction_fee = TokenAmount(gas_price_token, gas_cost)
@@ -448,9 +467,7 @@ class GatewayEVMAMM(ConnectorBase):
 
         # Pull the price from gateway.
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                self.chain, self.network, self.connector_name, base, quote, amount, side
-            )
+            resp: Dict[str, Any] = await self.get_price_response(base, quote, amount, side)
             return self.parse_price_response(base, quote, amount, side, price_response=resp)
         except asyncio.CancelledError:
             raise
@@ -461,6 +478,15 @@ class GatewayEVMAMM(ConnectorBase):
                 app_warning_msg=str(e)
             )
 
+    async def get_price_response(self, base: str, quote: str, amount: Decimal, side: TradeType) -> Dict[str, Any]:
+        """
+        Gets the price from Gateway through the shared quote cache, so the quotes asked for again shortly after (and
+        the concurrent requests of the same quote) share a single request.
+        """
+        return await GatewayQuoteCache.get_instance().get_price(
+            self._get_gateway_instance(), self.chain, self.network, self.connector_name, base, quote, amount, side
+        )
+
     async def get_order_price(
             self,
             trading_pair: str,
@@ -911,7 +937,8 @@ class GatewayEVMAMM(ConnectorBase):
                     self.update_balances(on_interval=True),
                     self.update_canceling_transactions(self.canceling_orders),
                     self.update_token_approval_status(self.approval_orders),
-                    self.update_order_status(self.amm_orders)
+                    self.update_order_status(self.amm_orders),
+                    self.update_block_number()
                 )
                 self._last_poll_timestamp = self.current_timestamp
             except asyncio.CancelledError:
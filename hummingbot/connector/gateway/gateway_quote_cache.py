@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, NamedTuple, Optional, Tuple, cast
+
+import pandas as pd
+
+from hummingbot.core.clock_profiler import LatencyHistogram
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.logger import HummingbotLogger
+
+# Upper bounds (in milliseconds) of the Gateway price request latency histogram buckets
+PRICE_REQUEST_LATENCY_BUCKETS_MS: Tuple[float, ...] = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class GatewayQuoteCacheKey(NamedTuple):
+    chain: str
+    network: str
+    connector: str
+    trading_pair: str
+    side: TradeType
+    amount_bucket: Decimal
+
+
+@dataclass
+class GatewayQuoteCacheEntry:
+    price_response: Dict[str, Any]
+    timestamp: float
+    block_number: Optional[int]
+
+
+@dataclass
+class GatewayQuoteCacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    block_expirations: int = 0
+    request_latency: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(PRICE_REQUEST_LATENCY_BUCKETS_MS)
+    )
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses + self.coalesced
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of the lookups that did not need their own request to Gateway"""
+        return (self.hits + self.coalesced) / self.lookups if self.lookups else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "block_expirations": self.block_expirations,
+            "hit_rate": self.hit_rate,
+            "request_latency": self.request_latency.to_dict(),
+        }
+
+
+class GatewayQuoteCache:
+    """
+    Shared cache of the Gateway AMM price responses, so the strategies and the status output asking for the same quote
+    within a short time share a single HTTP round trip.
+
+    Quotes are keyed by chain, network, connector, trading pair, side and amount bucket (the amount rounded to
+    `amount_significant_digits` significant digits), and are reused for `ttl` seconds at most. When the block number of
+    a network is reported with `update_block_number`, the quotes fetched on a previous block are not reused anymore.
+    Concurrent lookups of a quote that is not cached wait for the same request.
+    """
+    DEFAULT_TTL = 2.0
+    DEFAULT_AMOUNT_SIGNIFICANT_DIGITS = 4
+    MAX_ENTRIES = 1000
+
+    _gqc_logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["GatewayQuoteCache"] = None
+
+    def __init__(self,
+                 ttl: float = DEFAULT_TTL,
+                 amount_significant_digits: int = DEFAULT_AMOUNT_SIGNIFICANT_DIGITS):
+        self._ttl = ttl
+        self._amount_significant_digits = amount_significant_digits
+        self._entries: Dict[GatewayQuoteCacheKey, GatewayQuoteCacheEntry] = {}
+        self._in_flight_requests: Dict[GatewayQuoteCacheKey, asyncio.Task] = {}
+        self._block_numbers: Dict[Tuple[str, str], int] = {}
+        self._stats = GatewayQuoteCacheStats()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._gqc_logger is None:
+            cls._gqc_logger = cast(HummingbotLogger, logging.getLogger(__name__))
+        return cls._gqc_logger
+
+    @classmethod
+    def get_instance(cls) -> "GatewayQuoteCache":
+        if cls._shared_instance is None:
+            cls._shared_instance = GatewayQuoteCache()
+        return cls._shared_instance
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: float):
+        self._ttl = value
+
+    @property
+    def stats(self) -> GatewayQuoteCacheStats:
+        return self._stats
+
+    def reset_stats(self):
+        self._stats = GatewayQuoteCacheStats()
+
+    def clear(self):
+        self._entries.clear()
+
+    def amount_bucket(self, amount: Decimal) -> Decimal:
+        if amount == 0 or not amount.is_finite():
+            return amount
+        quantum = Decimal(1).scaleb(amount.adjusted() - self._amount_significant_digits + 1)
+        return amount.quantize(quantum, rounding=ROUND_HALF_UP)
+
+    def block_number(self, chain: str, network: str) -> Optional[int]:
+        return self._block_numbers.get((chain, network))
+
+    def update_block_number(self, chain: str, network: str, block_number: int):
+        if block_number > self._block_numbers.get((chain, network), -1):
+            self._block_numbers[(chain, network)] = block_number
+
+    async def get_price(
+            self,
+            gateway_client: GatewayHttpClient,
+            chain: str,
+            network: str,
+            connector: str,
+            base_asset: str,
+            quote_asset: str,
+            amount: Decimal,
+            side: TradeType
+    ) -> Dict[str, Any]:
+        """
+        Returns the cached Gateway price response for the quote, or requests it with `gateway_client.get_price()`.
+        Responses without price are not cached, and request errors are raised to all the callers waiting for them.
+        """
+        key = GatewayQuoteCacheKey(
+            chain=chain,
+            network=network,
+            connector=connector,
+            trading_pair=f"{base_asset}-{quote_asset}",
+            side=side,
+            amount_bucket=self.amount_bucket(amount),
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._is_valid(key, entry):
+                self._stats.hits += 1
+                return entry.price_response
+            del self._entries[key]
+
+        request = self._in_flight_requests.get(key)
+        if request is None:
+            self._stats.misses += 1
+            request = asyncio.ensure_future(
+                self._request_price(gateway_client, key, base_asset, quote_asset, amount, side)
+            )
+            self._in_flight_requests[key] = request
+        else:
+            self._stats.coalesced += 1
+        # A caller being cancelled does not cancel the request of the other callers
+        return await asyncio.shield(request)
+
+    def stats_df(self) -> pd.DataFrame:
+        latency = self._stats.request_latency
+        columns = ["Lookups", "Hits", "Coalesced", "Misses", "Errors", "Hit rate", "Requests mean (ms)",
+                   "Requests p99 (ms)", "Requests max (ms)"]
+        data = [[self._stats.lookups, self._stats.hits, self._stats.coalesced, self._stats.misses, self._stats.errors,
+                 f"{self._stats.hit_rate:.1%}", round(latency.mean, 1), latency.percentile(99), round(latency.max, 1)]]
+        return pd.DataFrame(data=data, columns=columns)
+
+    def _is_valid(self, key: GatewayQuoteCacheKey, entry: GatewayQuoteCacheEntry) -> bool:
+        if time.time() - entry.timestamp > self._ttl:
+            return False
+        if entry.block_number != self._block_numbers.get((key.chain, key.network)):
+            self._stats.block_expirations += 1
+            return False
+        return True
+
+    async def _request_price(
+            self,
+            gateway_client: GatewayHttpClient,
+            key: GatewayQuoteCacheKey,
+            base_asset: str,
+            quote_asset: str,
+            amount: Decimal,
+            side: TradeType
+    ) -> Dict[str, Any]:
+        block_number = self._block_numbers.get((key.chain, key.network))
+        start = time.perf_counter()
+        try:
+            price_response: Dict[str, Any] = await gateway_client.get_price(
+                key.chain, key.network, key.connector, base_asset, quote_asset, amount, side
+            )
+        except Exception:
+            self._stats.errors += 1
+            raise
+        finally:
+            self._stats.request_latency.add((time.perf_counter() - start) * 1e3)
+            del self._in_flight_requests[key]
+
+        if "price" in price_response:
+            self._entries[key] = GatewayQuoteCacheEntry(
+                price_response=price_response,
+                timestamp=time.time(),
+                block_number=block_number,
+            )
+            if len(self._entries) > self.MAX_ENTRIES:
+                self._remove_expired_entries()
+        return price_response
+
+    def _remove_expired_entries(self):
+        now = time.time()
+        self._entries = {key: entry for key, entry in self._entries.items() if now - entry.timestamp <= self._ttl}
+        # Remove the oldest entries if there are still too many
+        while len(self._entries) > self.MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
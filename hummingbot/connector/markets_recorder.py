@@ -1,10 +1,13 @@
 import asyncio
+import csv
+import logging
 import os.path
+import queue
 import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -30,6 +33,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -39,6 +43,11 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
+mr_logger = None
+
+# Writes the event records in the session. It can return a function to run once the transaction is committed.
+WriteOperation = Callable[[Session], Optional[Callable[[], None]]]
+
 
 class MarketsRecorder:
     market_event_tag_map: Dict[int, MarketEvent] = {
@@ -46,11 +55,24 @@ class MarketsRecorder:
         for event_obj in MarketEvent.__members__.values()
     }
 
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global mr_logger
+        if mr_logger is None:
+            mr_logger = logging.getLogger(__name__)
+        return mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = False):
+        """
+        :param write_behind: if True the market events are not written to the database on the event loop. They are
+            queued and committed in batched transactions by a background writer thread, saving the market states
+            once per batch. Pending writes are flushed when the recorder is stopped.
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -59,6 +81,15 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._csv_files: Dict[str, Tuple[TextIO, Any]] = {}
+
+        self._write_behind: bool = write_behind
+        self._pending_writes: List[WriteOperation] = []
+        self._pending_market_states: Dict[str, ConnectorBase] = {}
+        self._pending_writes_submission: Optional[asyncio.Handle] = None
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -114,15 +145,31 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        if self._write_behind and self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_behind_loop,
+                                                   name="MarketsRecorderWriter",
+                                                   daemon=True)
+            self._writer_thread.start()
 
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._writer_thread is not None:
+            # Flush all the pending writes before returning
+            self._submit_pending_writes()
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        self._close_csv_files()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -153,17 +200,25 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._save_market_states(config_file_path, market.display_name, market.tracking_states, session=session)
+
+    def _save_market_states(self, config_file_path: str, market_name: str, saved_state: Dict[str, Any],
+                            session: Session):
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == config_file_path,
+                                MarketState.market == market_name))
+        market_states: Optional[MarketState] = query.one_or_none()
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -184,6 +239,106 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _record(self, write: WriteOperation, market: Optional[ConnectorBase] = None):
+        """
+        Runs the write operation in a database transaction, saving the market states if a market is given.
+        In write behind mode the operation is queued for the writer thread instead.
+        """
+        if self._write_behind:
+            self._pending_writes.append(write)
+            if market is not None:
+                self._pending_market_states[market.display_name] = market
+            if self._pending_writes_submission is None:
+                # All the events processed in this event loop iteration are submitted as a single batch
+                self._pending_writes_submission = self._ev_loop.call_soon(self._submit_pending_writes)
+            return
+
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                on_commit = write(session)
+                if market is not None:
+                    self.save_market_states(self._config_file_path, market, session=session)
+        if on_commit is not None:
+            on_commit()
+        self._flush_csv_files()
+
+    def _submit_pending_writes(self):
+        if self._pending_writes_submission is not None:
+            self._pending_writes_submission.cancel()
+            self._pending_writes_submission = None
+        if len(self._pending_writes) == 0 and len(self._pending_market_states) == 0:
+            return
+        # The tracking states are read on the event loop thread, once per market and batch
+        market_states: Dict[str, Dict[str, Any]] = {market_name: market.tracking_states
+                                                    for market_name, market in self._pending_market_states.items()}
+        self._write_queue.put((self._pending_writes, market_states))
+        self._pending_writes = []
+        self._pending_market_states = {}
+
+    def _write_behind_loop(self):
+        stopped = False
+        while not stopped:
+            batch = self._write_queue.get()
+            writes: List[WriteOperation] = []
+            market_states: Dict[str, Dict[str, Any]] = {}
+            # Coalesce all the batches already queued into a single transaction
+            while True:
+                if batch is None:
+                    stopped = True
+                else:
+                    writes.extend(batch[0])
+                    market_states.update(batch[1])
+                try:
+                    batch = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+            if len(writes) > 0 or len(market_states) > 0:
+                self._write_batch(writes, market_states)
+
+    def _write_batch(self, writes: List[WriteOperation], market_states: Dict[str, Dict[str, Any]]):
+        """
+        Commits the writes and the market states in a single transaction. If it fails, every write is retried in its
+        own transaction, so a failing event does not discard the other events of the batch.
+        """
+        try:
+            on_commit_actions = self._commit_writes(writes, market_states)
+        except Exception:
+            self.logger().warning(f"Error writing {len(writes)} market events to the database in a single "
+                                  f"transaction. Writing them one by one.", exc_info=True)
+            on_commit_actions = []
+            for write in writes:
+                try:
+                    on_commit_actions.extend(self._commit_writes([write], {}))
+                except Exception:
+                    self.logger().error("Unexpected error writing a market event to the database.", exc_info=True)
+            try:
+                self._commit_writes([], market_states)
+            except Exception:
+                self.logger().error("Unexpected error writing the market states to the database.", exc_info=True)
+        try:
+            for on_commit in on_commit_actions:
+                on_commit()
+            self._flush_csv_files()
+        except Exception:
+            self.logger().error("Unexpected error writing the trades CSV file.", exc_info=True)
+
+    def _commit_writes(self,
+                       writes: List[WriteOperation],
+                       market_states: Dict[str, Dict[str, Any]]) -> List[Callable[[], None]]:
+        """
+        :return: the functions returned by the writes, to run now that the transaction is committed
+        """
+        on_commit_actions = []
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for write in writes:
+                    on_commit = write(session)
+                    if on_commit is not None:
+                        on_commit_actions.append(on_commit)
+                for market_name, saved_state in market_states.items():
+                    self._save_market_states(self._config_file_path, market_name, saved_state, session=session)
+        return on_commit_actions
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -195,32 +350,33 @@ class MarketsRecorder:
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        market_name: str = market.display_name
+
+        def write(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._record(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -234,48 +390,50 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        market_name: str = market.display_name
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=Decimal(
+                    evt.price) if evt.price == evt.price else Decimal(0),
+                amount=Decimal(evt.amount),
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=evt.trade_fee.to_json(),
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            # The CSV row is only written if the trade fill is committed
+            csv_path, field_names, field_data = self._trade_fill_csv_row(trade_fill_record)
+            return lambda: self._trades_csv_writer(csv_path, field_names).writerow(field_data)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._record(write, market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -286,27 +444,63 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        market_name: str = market.display_name
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._record(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        with open(file_path, newline="") as csv_file:
+            first_row = next(csv.reader(csv_file), None)
+        return first_row is not None and tuple(first_row) == tuple(str(field) for field in header)
+
+    def _trades_csv_writer(self, csv_path: str, field_names: tuple):
+        """
+        Returns the csv writer of the persistent file handle used to append the trades to the csv file.
+        The header of an existing file is checked only the first time the file is opened.
+        """
+        csv_file_and_writer = self._csv_files.get(csv_path)
+        if csv_file_and_writer is None:
+            if os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names)):
+                move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+            new_file = not os.path.exists(csv_path)
+            csv_file = open(csv_path, mode="a", newline="")
+            csv_file_and_writer = (csv_file, csv.writer(csv_file))
+            if new_file:
+                csv_file_and_writer[1].writerow(field_names)
+            self._csv_files[csv_path] = csv_file_and_writer
+        return csv_file_and_writer[1]
+
+    def _flush_csv_files(self):
+        for csv_file, _ in self._csv_files.values():
+            csv_file.flush()
+
+    def _close_csv_files(self):
+        for csv_file, _ in self._csv_files.values():
+            csv_file.close()
+        self._csv_files = {}
 
     def append_to_csv(self, trade: TradeFill):
+        csv_path, field_names, field_data = self._trade_fill_csv_row(trade)
+        self._trades_csv_writer(csv_path, field_names).writerow(field_data)
+
+    def _trade_fill_csv_row(self, trade: TradeFill) -> Tuple[str, tuple, tuple]:
+        """
+        :return: the path of the trades CSV file, its field names and the row of the trade fill
+        """
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -320,14 +514,7 @@ class MarketsRecorder:
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        return csv_path, field_names, field_data
 
     def _update_order_status(self,
                              event_tag: int,
@@ -344,19 +531,23 @@ class MarketsRecorder:
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        market_name: str = market.display_name
+        # Read on the event loop thread, the market states are only saved if the order is recorded
+        saved_state: Dict[str, Any] = market.tracking_states
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                self._save_market_states(self._config_file_path, market_name, saved_state, session=session)
+
+        self._record(write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -392,15 +583,15 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=evt.trade_fee.to_json())
+            session.add(rp_update)
+
+        self._record(write, connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -410,14 +601,14 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+
+        self._record(write, connector)
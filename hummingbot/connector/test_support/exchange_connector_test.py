@@ -1,6 +1,7 @@
 import asyncio
 import json
 import re
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
@@ -11,10 +12,11 @@ from aioresponses import aioresponses
 from aioresponses.core import RequestCall
 from bidict import bidict
 
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -1322,6 +1324,163 @@ class AbstractExchangeConnectorTests:
                 )
             )
 
+        def _track_open_orders(self, count: int) -> List[InFlightOrder]:
+            for i in range(count):
+                self.exchange.start_tracking_order(
+                    order_id=f"{self.client_order_id_prefix}{i}",
+                    exchange_order_id=f"{self.exchange_order_id_prefix}{i}",
+                    trading_pair=self.trading_pair,
+                    order_type=OrderType.LIMIT,
+                    trade_type=TradeType.BUY,
+                    price=Decimal("10000"),
+                    amount=Decimal("1"),
+                )
+            orders = list(self.exchange.in_flight_orders.values())
+            for order in orders:
+                order.current_state = OrderState.OPEN
+            return orders
+
+        def _patch_order_status_request(self, requested_orders: List[str], in_flight: List[int]):
+            async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+                requested_orders.append(tracked_order.client_order_id)
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[0], in_flight[1])
+                await asyncio.sleep(0.01)
+                in_flight[0] -= 1
+                return OrderUpdate(
+                    client_order_id=tracked_order.client_order_id,
+                    exchange_order_id=tracked_order.exchange_order_id,
+                    trading_pair=tracked_order.trading_pair,
+                    update_timestamp=self.exchange.current_timestamp,
+                    new_state=OrderState.OPEN,
+                )
+
+            return patch.object(self.exchange, "_request_order_status", side_effect=request_order_status)
+
+        def test_update_orders_requests_status_concurrently_with_bounded_concurrency(self):
+            self.exchange._set_current_timestamp(1640780000)
+            self.exchange.ORDER_UPDATES_MAX_CONCURRENCY = 3
+            orders = self._track_open_orders(count=5)
+            requested_orders = []
+            in_flight = [0, 0]
+
+            with self._patch_order_status_request(requested_orders, in_flight):
+                self.async_run_with_timeout(self.exchange._update_orders())
+
+            self.assertEqual(sorted(order.client_order_id for order in orders), sorted(requested_orders))
+            self.assertEqual(3, in_flight[1])
+
+        def test_update_orders_skips_orders_confirmed_since_last_poll(self):
+            self.exchange._set_current_timestamp(1640780000)
+            confirmed_order, polled_order = self._track_open_orders(count=2)
+            self.exchange._last_poll_local_timestamp = time.time() - 1
+            self.exchange._set_current_timestamp(1640780010)
+            confirmed_order.update_with_order_update(OrderUpdate(
+                client_order_id=confirmed_order.client_order_id,
+                trading_pair=confirmed_order.trading_pair,
+                update_timestamp=1640780005,
+                new_state=OrderState.PARTIALLY_FILLED,
+            ))
+            requested_orders = []
+
+            with self._patch_order_status_request(requested_orders, [0, 0]):
+                self.async_run_with_timeout(self.exchange._update_orders())
+
+            self.assertEqual([polled_order.client_order_id], requested_orders)
+
+        def test_update_orders_requests_status_of_orders_updated_before_last_poll_with_exchange_clock_ahead(self):
+            self.exchange._set_current_timestamp(1640780000)
+            order = self._track_open_orders(count=1)[0]
+            # The update is applied before the last poll, with an exchange timestamp after the poll
+            order.update_with_order_update(OrderUpdate(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                update_timestamp=1640780100,
+                new_state=OrderState.OPEN,
+            ))
+            order.last_state_update_local_timestamp = time.time() - 1
+            self.exchange._last_poll_timestamp = 1640780000
+            self.exchange._last_poll_local_timestamp = time.time()
+            self.exchange._set_current_timestamp(1640780010)
+            requested_orders = []
+
+            with self._patch_order_status_request(requested_orders, [0, 0]):
+                self.async_run_with_timeout(self.exchange._update_orders())
+
+            self.assertEqual([order.client_order_id], requested_orders)
+
+        def test_update_orders_requests_status_of_orders_filled_since_last_poll(self):
+            self.exchange._set_current_timestamp(1640780000)
+            filled_order, confirmed_and_filled_order = self._track_open_orders(count=2)
+            self.exchange._last_poll_local_timestamp = time.time() - 1
+            self.exchange._set_current_timestamp(1640780010)
+            confirmed_and_filled_order.update_with_order_update(OrderUpdate(
+                client_order_id=confirmed_and_filled_order.client_order_id,
+                trading_pair=confirmed_and_filled_order.trading_pair,
+                update_timestamp=1640780003,
+                new_state=OrderState.OPEN,
+            ))
+            for order in (filled_order, confirmed_and_filled_order):
+                order.update_with_trade_update(TradeUpdate(
+                    trade_id=f"{order.client_order_id}-1",
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=order.exchange_order_id,
+                    trading_pair=order.trading_pair,
+                    fill_timestamp=1640780005,
+                    fill_price=Decimal("10000"),
+                    fill_base_amount=Decimal("1"),
+                    fill_quote_amount=Decimal("10000"),
+                    fee=self.expected_fill_fee,
+                ))
+            requested_orders = []
+
+            with self._patch_order_status_request(requested_orders, [0, 0]):
+                self.async_run_with_timeout(self.exchange._update_orders())
+
+            # The fills don't confirm the orders state, it is requested to know if they are completed
+            self.assertEqual(sorted([filled_order.client_order_id, confirmed_and_filled_order.client_order_id]),
+                             sorted(requested_orders))
+
+        def test_update_orders_requests_per_order_status_only_for_orders_missing_in_bulk_status(self):
+            self.exchange._set_current_timestamp(1640780000)
+            bulk_order, polled_order = self._track_open_orders(count=2)
+            bulk_update = OrderUpdate(
+                client_order_id=bulk_order.client_order_id,
+                trading_pair=bulk_order.trading_pair,
+                update_timestamp=1640780000,
+                new_state=OrderState.OPEN,
+            )
+            requested_orders = []
+
+            with self._patch_order_status_request(requested_orders, [0, 0]):
+                with patch.object(self.exchange, "_request_orders_status",
+                                  AsyncMock(return_value={bulk_order.client_order_id: bulk_update})):
+                    self.async_run_with_timeout(self.exchange._update_orders())
+
+            self.assertEqual([polled_order.client_order_id], requested_orders)
+
+        def test_update_orders_fills_uses_bulk_trade_updates_when_available(self):
+            self.exchange._set_current_timestamp(1640780000)
+            order = self._track_open_orders(count=1)[0]
+            trade_update = TradeUpdate(
+                trade_id="1",
+                client_order_id=order.client_order_id,
+                exchange_order_id=order.exchange_order_id,
+                trading_pair=order.trading_pair,
+                fill_timestamp=1640780000,
+                fill_price=Decimal("10000"),
+                fill_base_amount=Decimal("0.5"),
+                fill_quote_amount=Decimal("5000"),
+                fee=self.expected_fill_fee,
+            )
+
+            with patch.object(self.exchange, "_all_trade_updates_for_orders", AsyncMock(return_value=[trade_update])):
+                with patch.object(self.exchange, "_all_trade_updates_for_order", AsyncMock()) as per_order_request:
+                    self.async_run_with_timeout(ExchangePyBase._update_orders_fills(self.exchange, orders=[order]))
+
+            per_order_request.assert_not_called()
+            self.assertEqual(Decimal("0.5"), order.executed_amount_base)
+
         def test_user_stream_update_for_new_order(self):
             self.exchange._set_current_timestamp(1640780000)
             self.exchange.start_tracking_order(
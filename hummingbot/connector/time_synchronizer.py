@@ -2,9 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
-
-import numpy
+from typing import Awaitable, Deque, Optional, Tuple
 
 from hummingbot.logger import HummingbotLogger
 
@@ -15,13 +13,28 @@ class TimeSynchronizer:
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+    The offset is calculated once every time the samples change, so `time()` does not need to process the samples.
+    When drift extrapolation is enabled, the offset is also corrected with the rate at which the samples show the
+    local clock drifts from the server's clock.
     """
 
     NaN = float("nan")
+    # Minimum time covered by the samples to estimate the clock drift (seconds)
+    MIN_DRIFT_ESTIMATION_INTERVAL = 10.0
+    # Max clock drift considered valid (ms per local ms), bigger estimations are caused by the network latency jitter
+    MAX_CLOCK_DRIFT = 500e-6
     _logger = None
 
-    def __init__(self):
+    def __init__(self, extrapolate_drift: bool = False):
+        """
+        :param extrapolate_drift: if True the offset is extrapolated with the clock drift estimated from the samples
+        """
+        self._extrapolate_drift = extrapolate_drift
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        self._sample_times: Deque[float] = deque(maxlen=5)
+        self._offset_ms: Optional[float] = None
+        self._offset_reference_time: float = 0
+        self._drift: float = 0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -31,27 +44,46 @@ class TimeSynchronizer:
 
     @property
     def time_offset_ms(self) -> float:
-        if not self._time_offset_ms:
+        if self._offset_ms is None:
             offset = (self._time() - self._current_seconds_counter()) * 1e3
+        elif self._drift == 0:
+            offset = self._offset_ms
         else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
-
+            offset = self._extrapolated_offset_ms(self._current_seconds_counter())
         return offset
 
-    def add_time_offset_ms_sample(self, offset: float):
+    @property
+    def drift(self) -> float:
+        """
+        Returns the estimated clock drift, in ms of offset change per local ms (0 if drift extrapolation is disabled)
+        """
+        return self._drift
+
+    def add_time_offset_ms_sample(self, offset: float, sample_time: Optional[float] = None):
+        """
+        :param offset: the difference between the server's time and the local time in milliseconds
+        :param sample_time: the local seconds counter value when the sample was taken (now if not specified)
+        """
+        if sample_time is None and self._extrapolate_drift:
+            sample_time = self._current_seconds_counter()
         self._time_offset_ms.append(offset)
+        self._sample_times.append(sample_time)
+        self._update_offset()
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._sample_times.clear()
+        self._update_offset()
 
     def time(self) -> float:
         """
         Returns the current time in seconds calculated base on the deviation samples.
         :return: Calculated current time considering the registered deviations
         """
-        return self._current_seconds_counter() + self.time_offset_ms * 1e-3
+        now = self._current_seconds_counter()
+        if self._drift == 0:
+            return now + self.time_offset_ms * 1e-3
+        return now + self._extrapolated_offset_ms(now) * 1e-3
 
     async def update_server_time_offset_with_time_provider(self, time_provider: Awaitable):
         """
@@ -66,7 +98,7 @@ class TimeSynchronizer:
             local_after_ms: float = self._current_seconds_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = server_time_ms - local_server_time_pre_image_ms
-            self.add_time_offset_ms_sample(time_offset_ms)
+            self.add_time_offset_ms_sample(time_offset_ms, sample_time=local_server_time_pre_image_ms * 1e-3)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -86,6 +118,53 @@ class TimeSynchronizer:
             # This is done to avoid the warning message from asyncio framework saying a coroutine was not awaited
             time_provider.close()
 
+    def _extrapolated_offset_ms(self, seconds_counter: float) -> float:
+        return self._offset_ms + self._drift * (seconds_counter - self._offset_reference_time) * 1e3
+
+    def _update_offset(self):
+        samples = self._time_offset_ms
+        if not samples:
+            self._offset_ms = None
+            self._drift = 0
+            return
+
+        # The offset is the mean of the samples median and the average of the samples weighted by recency
+        weights = range(1, len(samples) * 2 + 1, 2)
+        self._offset_ms = (self._median(samples) + self._weighted_average(samples, weights)) / 2
+        self._drift = 0
+        if self._extrapolate_drift:
+            self._offset_reference_time, self._drift = self._estimate_drift(weights)
+
+    def _estimate_drift(self, weights: range) -> Tuple[float, float]:
+        """
+        Estimates the clock drift as the least squares slope of the samples offsets over the time they were taken.
+        :return: the local time the calculated offset corresponds to, and the estimated drift
+        """
+        times = self._sample_times
+        # Same combination used for the offsets, to get the time the offset is representative of
+        reference_time = (self._median(times) + self._weighted_average(times, weights)) / 2
+        if len(times) < 2 or times[-1] - times[0] < self.MIN_DRIFT_ESTIMATION_INTERVAL:
+            return reference_time, 0
+
+        mean_time = sum(times) / len(times)
+        mean_offset = sum(self._time_offset_ms) / len(times)
+        covariance = sum((t - mean_time) * (o - mean_offset) for t, o in zip(times, self._time_offset_ms))
+        variance = sum((t - mean_time) ** 2 for t in times)
+        drift = covariance / variance * 1e-3
+        return reference_time, max(-self.MAX_CLOCK_DRIFT, min(self.MAX_CLOCK_DRIFT, drift))
+
+    @staticmethod
+    def _median(values: Deque[float]) -> float:
+        ordered = sorted(values)
+        middle = len(ordered) // 2
+        if len(ordered) % 2 == 1:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    @staticmethod
+    def _weighted_average(values: Deque[float], weights: range) -> float:
+        return sum(value * weight for value, weight in zip(values, weights)) / sum(weights)
+
     def _current_seconds_counter(self):
         return time.perf_counter()
 
@@ -0,0 +1,340 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+MICROSECONDS_PER_SECOND = 1_000_000
+DEFAULT_PRIORITY = 0
+
+
+def to_microseconds(seconds: float) -> int:
+    return round(seconds * MICROSECONDS_PER_SECOND)
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the tasks logged against a single RateLimit.
+    Keeps the (timestamp, weight) entries in arrival order together with the running sum of their weights, so the
+    used capacity is available without scanning the logs. Timestamps are integer microseconds to keep the window
+    boundaries exact without Decimal arithmetic.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.entries: Deque[Tuple[int, int]] = deque()
+        self.capacity_used: int = 0
+        self.set_rate_limit(rate_limit, safety_margin_pct)
+
+    def set_rate_limit(self, rate_limit: RateLimit, safety_margin_pct: float):
+        """
+        Changes the limit definition of the window. The logged entries are kept, and expire with the new time interval.
+        """
+        self.rate_limit: RateLimit = rate_limit
+        # A task stays in the window while now - timestamp - time_interval * safety_margin <= time_interval
+        self.horizon: int = (to_microseconds(rate_limit.time_interval)
+                             + to_microseconds(rate_limit.time_interval * safety_margin_pct))
+
+    def expire(self, now: int):
+        entries = self.entries
+        while entries and now - entries[0][0] > self.horizon:
+            self.capacity_used -= entries.popleft()[1]
+
+    def append(self, timestamp: int, weight: int):
+        self.entries.append((timestamp, weight))
+        self.capacity_used += weight
+
+    def next_available(self, now: int, weight: int) -> int:
+        """
+        :return: The first timestamp at which a task with the given weight fits in the window
+        """
+        capacity_used = self.capacity_used
+        if capacity_used + weight <= self.rate_limit.limit:
+            return now
+        for timestamp, entry_weight in self.entries:
+            capacity_used -= entry_weight
+            if capacity_used + weight <= self.rate_limit.limit:
+                return timestamp + self.horizon + 1
+        # The weight is above the limit itself, check again once the window is empty
+        return now + self.horizon
+
+
+class WindowedAsyncRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that checks for rate limit and wait for the capacity if needed.
+    Unlike AsyncRequestContext it does not scan the shared task logs: every limit involved in the request keeps its
+    own RateLimitWindow, so a capacity check is O(number of related limits).
+    """
+
+    def __init__(self,
+                 windows: List[Tuple[RateLimitWindow, int]],
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 ):
+        """
+        :param windows: The windows of the request RateLimit and its related limits, with the weight to log in each
+        """
+        super().__init__(task_logs=[],
+                         rate_limit=rate_limit,
+                         related_limits=related_limits,
+                         lock=lock,
+                         safety_margin_pct=safety_margin_pct,
+                         retry_interval=retry_interval)
+        self._windows: List[Tuple[RateLimitWindow, int]] = windows
+
+    def windows(self) -> List[RateLimitWindow]:
+        return [window for window, _ in self._windows]
+
+    def flush(self):
+        """
+        Remove the entries that have passed rate limit periods from the request windows
+        """
+        now: int = to_microseconds(self._time())
+        for window, _ in self._windows:
+            window.expire(now)
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task within the defined RateLimit(s). Logs a warning message if the limit is about to be reached.
+        :return: True if it is within capacity to add a new task
+        """
+        if self._rate_limit is not None:
+            now: float = self._time()
+            now_microseconds: int = to_microseconds(now)
+            for window, weight in self._windows:
+                window.expire(now_microseconds)
+                rate_limit: RateLimit = window.rate_limit
+                if window.capacity_used + weight > rate_limit.limit:
+                    if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                        msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                              f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                              f"is {window.capacity_used} in the last " \
+                              f"{rate_limit.time_interval} seconds"
+                        self.logger().notify(msg)
+                        AsyncRequestContextBase._last_max_cap_warning_ts = now
+                    return False
+        return True
+
+    async def acquire(self):
+        while True:
+            async with self._lock:
+                if self.within_capacity():
+                    # Log the task in the same critical section, so no other request can take the capacity
+                    self.log_task()
+                    break
+            await asyncio.sleep(self._retry_interval)
+
+    def log_task(self):
+        now: int = to_microseconds(self._time())
+        for window, weight in self._windows:
+            window.append(now, weight)
+
+    def time_until_capacity(self) -> float:
+        """
+        :return: The number of seconds until all the request windows have capacity for the task
+        """
+        now: int = to_microseconds(self._time())
+        available: int = max((window.next_available(now, weight) for window, weight in self._windows), default=now)
+        return max(0, available - now) / MICROSECONDS_PER_SECOND
+
+    def _time(self) -> float:
+        return time.time()
+
+
+class WindowedAsyncThrottler(AsyncThrottlerBase):
+    """
+    Drop-in alternative to AsyncThrottler with the same RateLimit, LinkedLimitWeightPair and safety margin semantics,
+    where every RateLimit keeps a running sum of the weights logged in its time window.
+    Admission checks cost O(related limits) instead of O(related limits x task logs).
+    """
+
+    def __init__(self, *args, **kwargs):
+        # Set before the base class initialization, that sets the rate limits
+        self._limit_windows: Dict[str, RateLimitWindow] = {}
+        super().__init__(*args, **kwargs)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        # As AsyncThrottler keeps its task logs, the windows of the limits still defined keep the capacity used
+        limit_windows: Dict[str, RateLimitWindow] = self._limit_windows
+        self._limit_windows = {}
+        for limit_id, window in limit_windows.items():
+            rate_limit = self._id_to_limit_map.get(limit_id)
+            if rate_limit is not None:
+                window.set_rate_limit(rate_limit, self._safety_margin_pct)
+                self._limit_windows[limit_id] = window
+
+    def execute_task(self, limit_id: str) -> WindowedAsyncRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        windows = self._request_windows(rate_limit, related_rate_limits)
+        return WindowedAsyncRequestContext(
+            windows=windows,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+        )
+
+    def _request_windows(self,
+                         rate_limit: Optional[RateLimit],
+                         related_limits: List[Tuple[RateLimit, int]]) -> List[Tuple[RateLimitWindow, int]]:
+        windows = []
+        if rate_limit is not None:
+            windows.append((self._window(rate_limit), rate_limit.weight))
+            windows.extend((self._window(limit), weight) for limit, weight in related_limits)
+        return windows
+
+    def _window(self, rate_limit: RateLimit) -> RateLimitWindow:
+        window = self._limit_windows.get(rate_limit.limit_id)
+        if window is None:
+            window = RateLimitWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            self._limit_windows[rate_limit.limit_id] = window
+        return window
+
+
+class RequestScheduler:
+    """
+    Queue of the requests waiting for rate limit capacity.
+    Waiters are served by descending priority and in arrival (FIFO) order within the same priority among the requests
+    sharing a rate limit window. A blocked waiter only holds back the waiters logging in one of its windows, so requests
+    on unrelated limits are admitted as soon as their own windows have room. Instead of polling, a single timer is armed
+    for the earliest time one of the blocked waiters fits in its windows.
+    """
+
+    def __init__(self):
+        self._waiters: List[Tuple[int, int, "ScheduledAsyncRequestContext", asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def waiting_requests(self) -> int:
+        return len([waiter for waiter in self._waiters if not waiter[3].done()])
+
+    async def acquire(self, context: "ScheduledAsyncRequestContext"):
+        if not self._shares_window_with_waiters(context) and context.within_capacity():
+            context.log_task()
+            return
+        future = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._waiters, (-context.priority, next(self._sequence), context, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The cancelled waiter might have been blocking the waiters of its windows
+            self._dispatch()
+            raise
+
+    def _shares_window_with_waiters(self, context: "ScheduledAsyncRequestContext") -> bool:
+        if not self._waiters:
+            return False
+        windows = set(context.windows())
+        return any(not future.done() and not windows.isdisjoint(waiter_context.windows())
+                   for _, _, waiter_context, future in self._waiters)
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        blocked_windows: Set[RateLimitWindow] = set()
+        remaining: List[Tuple[int, int, "ScheduledAsyncRequestContext", asyncio.Future]] = []
+        next_wake_up: Optional[float] = None
+        for waiter in sorted(self._waiters):
+            _, _, context, future = waiter
+            if future.done():
+                continue
+            windows = context.windows()
+            if not blocked_windows.isdisjoint(windows):
+                # Waits behind an earlier waiter of the same window
+                remaining.append(waiter)
+            elif context.within_capacity():
+                context.log_task()
+                future.set_result(None)
+            else:
+                remaining.append(waiter)
+                blocked_windows.update(windows)
+                delay = context.time_until_capacity()
+                next_wake_up = delay if next_wake_up is None else min(next_wake_up, delay)
+        # A sorted list is a valid heap
+        self._waiters = remaining
+        if next_wake_up is not None:
+            self._timer = asyncio.get_event_loop().call_later(next_wake_up, self._dispatch)
+
+
+class ScheduledAsyncRequestContext(WindowedAsyncRequestContext):
+    """
+    An async context class ('async with' syntax) that waits in the throttler RequestScheduler for the capacity,
+    being woken up as soon as its windows have room for it instead of checking every retry_interval.
+    """
+
+    def __init__(self, scheduler: RequestScheduler, priority: int = DEFAULT_PRIORITY, **kwargs):
+        """
+        :param scheduler: The RequestScheduler shared between all the requests of the throttler
+        :param priority: Requests with higher priority are served before the ones waiting with lower priority
+        """
+        super().__init__(**kwargs)
+        self._scheduler: RequestScheduler = scheduler
+        self.priority: int = priority
+
+    async def acquire(self):
+        if self._rate_limit is not None:
+            await self._scheduler.acquire(self)
+
+
+class ScheduledAsyncThrottler(WindowedAsyncThrottler):
+    """
+    WindowedAsyncThrottler where blocked requests are woken up at the exact time the capacity frees, in FIFO order.
+    Requests can be given a priority (e.g. to let order cancellations jump ahead of balance polls), either per
+    limit id when creating the throttler or per request when calling execute_task.
+    """
+
+    def __init__(self, *args, limit_priorities: Optional[Dict[str, int]] = None, **kwargs):
+        """
+        :param limit_priorities: Default priority of the requests for each limit id
+        """
+        super().__init__(*args, **kwargs)
+        self._limit_priorities: Dict[str, int] = limit_priorities or {}
+        self._scheduler: RequestScheduler = RequestScheduler()
+
+    @property
+    def waiting_requests(self) -> int:
+        return self._scheduler.waiting_requests
+
+    def execute_task(self, limit_id: str, priority: Optional[int] = None) -> ScheduledAsyncRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: overrides the priority configured for the limit_id
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        windows = self._request_windows(rate_limit, related_rate_limits)
+        if priority is None:
+            priority = self._limit_priorities.get(limit_id, DEFAULT_PRIORITY)
+        return ScheduledAsyncRequestContext(
+            scheduler=self._scheduler,
+            priority=priority,
+            windows=windows,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+        )
@@ -3,11 +3,12 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_profiler import ClockProfiler
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -36,6 +37,7 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._profiler = None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +59,17 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def profiler(self) -> Optional[ClockProfiler]:
+        """
+        The profiler collecting the tick metrics in real time mode, None when profiling is disabled
+        """
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: Optional[ClockProfiler]):
+        self._profiler = profiler
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,6 +103,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double previous_tick
+            double tick_start
+            double iterator_tick_start
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -110,18 +126,34 @@ cdef class Clock:
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
+                previous_tick = self._current_tick
                 self._current_tick = next_tick_time
+                profiler = self._profiler
+                if profiler is not None:
+                    tick_start = time.perf_counter()
+                    now = time.time()
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        if profiler is None:
+                            child_iterator.c_tick(self._current_tick)
+                        else:
+                            iterator_tick_start = time.perf_counter()
+                            child_iterator.c_tick(self._current_tick)
+                            profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_tick_start)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+
+                if profiler is not None:
+                    profiler.record_tick(
+                        lag=now - next_tick_time,
+                        elapsed=time.perf_counter() - tick_start,
+                        missed_ticks=max(0, round((next_tick_time - previous_tick) / self._tick_size) - 1))
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -0,0 +1,144 @@
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+# Upper bounds (in milliseconds) of the latency histogram buckets, the last bucket has no upper bound
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+
+class LatencyHistogram:
+    """
+    Fixed buckets histogram of latencies in milliseconds, keeping also the count, sum and max of the values.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets: Tuple[float, ...] = buckets
+        self.bucket_counts: List[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.total: float = 0
+        self.max: float = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    def add(self, value: float):
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :return: the upper bound of the bucket including the percentile (the max value for the last bucket)
+        """
+        if self.count == 0:
+            return 0
+        rank = percentile / 100 * self.count
+        accumulated = 0
+        for bucket, bucket_count in zip(self.buckets, self.bucket_counts):
+            accumulated += bucket_count
+            if accumulated >= rank:
+                return min(bucket, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max,
+            "buckets_ms": list(self.buckets),
+            "bucket_counts": list(self.bucket_counts),
+        }
+
+
+class ClockProfiler:
+    """
+    Collects the Clock tick metrics when profiling is enabled in the Clock: the time each child iterator takes to
+    process the tick, the lag between the scheduled tick time and the time the tick starts, and the ticks missed
+    because the previous tick took longer than the tick size.
+    """
+
+    def __init__(self):
+        self._iterator_names: Dict[int, str] = {}
+        self.reset()
+
+    @property
+    def iterator_latencies(self) -> Dict[str, LatencyHistogram]:
+        return self._iterator_latencies
+
+    @property
+    def tick_latency(self) -> LatencyHistogram:
+        return self._tick_latency
+
+    @property
+    def tick_lag(self) -> LatencyHistogram:
+        return self._tick_lag
+
+    @property
+    def ticks(self) -> int:
+        return self._tick_latency.count
+
+    @property
+    def missed_ticks(self) -> int:
+        return self._missed_ticks
+
+    def reset(self):
+        self._start_timestamp: float = time.time()
+        self._iterator_latencies: Dict[str, LatencyHistogram] = {}
+        self._tick_latency: LatencyHistogram = LatencyHistogram()
+        self._tick_lag: LatencyHistogram = LatencyHistogram()
+        self._missed_ticks: int = 0
+
+    def record_iterator_tick(self, iterator: Any, elapsed: float):
+        """
+        :param iterator: the clock child iterator
+        :param elapsed: the time the iterator took to process the tick, in seconds
+        """
+        name = self._iterator_name(iterator)
+        histogram = self._iterator_latencies.get(name)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._iterator_latencies[name] = histogram
+        histogram.add(elapsed * 1e3)
+
+    def record_tick(self, lag: float, elapsed: float, missed_ticks: int):
+        """
+        :param lag: the time between the scheduled tick time and the tick start, in seconds
+        :param elapsed: the time all the iterators took to process the tick, in seconds
+        :param missed_ticks: the number of ticks skipped since the previous tick
+        """
+        self._tick_lag.add(lag * 1e3)
+        self._tick_latency.add(elapsed * 1e3)
+        self._missed_ticks += missed_ticks
+
+    def iterators_df(self) -> pd.DataFrame:
+        columns = ["Iterator", "Ticks", "Mean (ms)", "P50 (ms)", "P99 (ms)", "Max (ms)", "Total (s)"]
+        data = [
+            [name, histogram.count, histogram.mean, histogram.percentile(50), histogram.percentile(99),
+             histogram.max, histogram.total / 1e3]
+            for name, histogram in sorted(self._iterator_latencies.items(), key=lambda item: -item[1].total)
+        ]
+        return pd.DataFrame(data=data, columns=columns)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "profiling_time": time.time() - self._start_timestamp,
+            "ticks": self.ticks,
+            "missed_ticks": self._missed_ticks,
+            "tick_latency": self._tick_latency.to_dict(),
+            "tick_lag": self._tick_lag.to_dict(),
+            "iterators": {name: histogram.to_dict() for name, histogram in self._iterator_latencies.items()},
+        }
+
+    def _iterator_name(self, iterator: Any) -> str:
+        name = self._iterator_names.get(id(iterator))
+        if name is None:
+            display_name = getattr(iterator, "display_name", None)
+            name = f"{type(iterator).__name__}({display_name})" if display_name else type(iterator).__name__
+            self._iterator_names[id(iterator)] = name
+        return name
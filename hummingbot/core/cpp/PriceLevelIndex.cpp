@@ -0,0 +1,35 @@
+#include "PriceLevelIndex.h"
+
+void rebuildPriceLevelIndex(std::set<OrderBookEntry> &book, PriceLevelIndex &index) {
+    index.clear();
+    index.reserve(book.size());
+    for (std::set<OrderBookEntry>::iterator it = book.begin(); it != book.end(); ++it) {
+        index.emplace((*it).getPrice(), it);
+    }
+}
+
+void syncPriceLevelIndex(std::set<OrderBookEntry> &book, PriceLevelIndex &index) {
+    // Entries are only removed from the book behind the index's back (i.e. by truncateOverlapEntries() or by
+    // clearing the book), so a size mismatch is enough to detect stale iterators.
+    if (index.size() != book.size()) {
+        rebuildPriceLevelIndex(book, index);
+    }
+}
+
+void applyIndexedDiffs(std::set<OrderBookEntry> &book, PriceLevelIndex &index, const std::vector<OrderBookEntry> &diffs) {
+    syncPriceLevelIndex(book, index);
+    for (std::vector<OrderBookEntry>::const_iterator diff = diffs.begin(); diff != diffs.end(); ++diff) {
+        PriceLevelIndex::iterator level = index.find((*diff).getPrice());
+        if (level != index.end()) {
+            if ((*diff).getAmount() > 0) {
+                // The price is the set ordering key and it does not change, so the entry can be updated in place.
+                const_cast<OrderBookEntry &>(*(level->second)) = *diff;
+            } else {
+                book.erase(level->second);
+                index.erase(level);
+            }
+        } else if ((*diff).getAmount() > 0) {
+            index.emplace((*diff).getPrice(), book.insert(*diff).first);
+        }
+    }
+}
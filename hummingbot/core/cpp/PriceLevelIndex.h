@@ -0,0 +1,15 @@
+#ifndef _PRICE_LEVEL_INDEX_H
+#define _PRICE_LEVEL_INDEX_H
+
+#include <set>
+#include <unordered_map>
+#include <vector>
+#include "OrderBookEntry.h"
+
+typedef std::unordered_map<double, std::set<OrderBookEntry>::iterator> PriceLevelIndex;
+
+void syncPriceLevelIndex(std::set<OrderBookEntry> &book, PriceLevelIndex &index);
+void rebuildPriceLevelIndex(std::set<OrderBookEntry> &book, PriceLevelIndex &index);
+void applyIndexedDiffs(std::set<OrderBookEntry> &book, PriceLevelIndex &index, const std::vector<OrderBookEntry> &diffs);
+
+#endif
@@ -0,0 +1,16 @@
+# distutils: language=c++
+
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/PriceLevelIndex.h":
+    cdef cppclass PriceLevelIndex:
+        PriceLevelIndex()
+        void clear()
+        size_t size()
+
+    void syncPriceLevelIndex(set[OrderBookEntry] &book, PriceLevelIndex &index)
+    void rebuildPriceLevelIndex(set[OrderBookEntry] &book, PriceLevelIndex &index)
+    void applyIndexedDiffs(set[OrderBookEntry] &book, PriceLevelIndex &index, const vector[OrderBookEntry] &diffs)
@@ -28,6 +28,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        # The composite top of book moves when filled orders are recorded or cleared
+        self.c_increase_top_of_book_version()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +73,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self.c_increase_top_of_book_version()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
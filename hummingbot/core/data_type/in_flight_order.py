@@ -1,6 +1,7 @@
 import asyncio
 import copy
 import math
+import time
 import typing
 from decimal import Decimal
 from enum import Enum
@@ -117,6 +118,8 @@ class InFlightOrder:
         self.executed_amount_quote = s_decimal_0
 
         self.last_update_timestamp: float = creation_timestamp
+        # Local time (not the exchange time) the last order update was applied, reset when a fill is processed after it
+        self.last_state_update_local_timestamp: float = -1
 
         self.order_fills: Dict[str, TradeUpdate] = {}  # Dict[trade_id, TradeUpdate]
 
@@ -325,6 +328,7 @@ class InFlightOrder:
             self.update_exchange_order_id(order_update.exchange_order_id)
 
         self.current_state = order_update.new_state
+        self.last_state_update_local_timestamp = time.time()
 
         updated: bool = prev_data != (self.exchange_order_id, self.current_state)
 
@@ -351,6 +355,8 @@ class InFlightOrder:
         self.executed_amount_quote += trade_update.fill_quote_amount
 
         self.last_update_timestamp = trade_update.fill_timestamp
+        # The fill might have completed the order, the last order update no longer confirms its state
+        self.last_state_update_local_timestamp = -1
         self.check_filled_condition()
 
         return True
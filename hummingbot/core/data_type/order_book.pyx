@@ -1,5 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp hummingbot/core/cpp/PriceLevelIndex.cpp
 import bisect
 import logging
 import time
@@ -25,9 +25,15 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.data_type.PriceLevelIndex cimport (
+    applyIndexedDiffs,
+    rebuildPriceLevelIndex,
+    syncPriceLevelIndex,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookChangedEvent,
     OrderBookTradeEvent
 )
 
@@ -35,10 +41,13 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+# Shared by all the order books, so a version number is never reused by another order book instance
+cdef int64_t _top_of_book_version_sequence = 0
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -47,7 +56,12 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, price_level_index=False):
+        """
+        :param dex: whether overlapping bids and asks are resolved by size (DEX books) instead of by update id
+        :param price_level_index: keeps a price -> entry hash index next to each side of the book, so diffs for
+            existing price levels are applied in place in O(1). Recommended for connectors tracking deep books.
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -56,6 +70,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._use_price_level_index = price_level_index
+        self.c_increase_top_of_book_version()
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -66,23 +82,32 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
-        for bid in bids:
-            result = self._bid_book.find(bid)
-            if result != bid_book_end:
-                self._bid_book.erase(result)
-            if bid.getAmount() > 0:
-                self._bid_book.insert(bid)
-        for ask in asks:
-            result = self._ask_book.find(ask)
-            if result != ask_book_end:
-                self._ask_book.erase(result)
-            if ask.getAmount() > 0:
-                self._ask_book.insert(ask)
+        if self._use_price_level_index:
+            applyIndexedDiffs(self._bid_book, self._bid_index, bids)
+            applyIndexedDiffs(self._ask_book, self._ask_index, asks)
+        else:
+            for bid in bids:
+                result = self._bid_book.find(bid)
+                if result != bid_book_end:
+                    self._bid_book.erase(result)
+                if bid.getAmount() > 0:
+                    self._bid_book.insert(bid)
+            for ask in asks:
+                result = self._ask_book.find(ask)
+                if result != ask_book_end:
+                    self._ask_book.erase(result)
+                if ask.getAmount() > 0:
+                    self._ask_book.insert(ask)
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if self._use_price_level_index:
+            syncPriceLevelIndex(self._bid_book, self._bid_index)
+            syncPriceLevelIndex(self._ask_book, self._ask_index)
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -97,6 +122,8 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        self.c_check_top_of_book_change(previous_best_bid, previous_best_ask)
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -105,6 +132,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
@@ -130,6 +159,10 @@ cdef class OrderBook(PubSub):
                 top_ask = deref(ask_iterator)
                 best_ask_price = top_ask.getPrice()
 
+        if self._use_price_level_index:
+            rebuildPriceLevelIndex(self._bid_book, self._bid_index)
+            rebuildPriceLevelIndex(self._ask_book, self._ask_index)
+
         # Record the current best prices, for faster c_get_price() calls.
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
@@ -137,6 +170,33 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self.c_check_top_of_book_change(previous_best_bid, previous_best_ask)
+
+    cdef c_check_top_of_book_change(self, double previous_best_bid, double previous_best_ask):
+        """
+        Increases the top of book version, and notifies the listeners, if the best bid or the best ask changed.
+        NaN prices (empty side) are considered equal to each other.
+        """
+        cdef:
+            bint bid_unchanged = (previous_best_bid == self._best_bid
+                                  or (previous_best_bid != previous_best_bid and self._best_bid != self._best_bid))
+            bint ask_unchanged = (previous_best_ask == self._best_ask
+                                  or (previous_best_ask != previous_best_ask and self._best_ask != self._best_ask))
+        if bid_unchanged and ask_unchanged:
+            return
+        self.c_increase_top_of_book_version()
+        # Avoid creating the event object when nobody is listening
+        if self._events.count(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG) > 0:
+            self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                 OrderBookTopOfBookChangedEvent(best_bid=self._best_bid,
+                                                                best_ask=self._best_ask,
+                                                                top_of_book_version=self._top_of_book_version))
+
+    cdef c_increase_top_of_book_version(self):
+        global _top_of_book_version_sequence
+        _top_of_book_version_sequence += 1
+        self._top_of_book_version = _top_of_book_version_sequence
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -162,6 +222,19 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def top_of_book_version(self) -> int:
+        """
+        A number increased every time the best bid or the best ask price changes. Versions are unique across order
+        book instances, so consumers can keep the version they last processed to skip work that only depends on the
+        top of the book, even if the order book gets replaced.
+        """
+        return self._top_of_book_version
+
+    @property
+    def uses_price_level_index(self) -> bool:
+        return self._use_price_level_index
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -209,16 +282,18 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = -1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If no update_id is given, the largest update id in the rows is used.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -228,24 +303,22 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(c_numpy_rows_to_entries(bids_array, cpp_bids),
+                             c_numpy_rows_to_entries(asks_array, cpp_asks))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = -1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If no update_id is given, the largest update id in the rows is used.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -255,13 +328,9 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(c_numpy_rows_to_entries(bids_array, cpp_bids),
+                             c_numpy_rows_to_entries(asks_array, cpp_asks))
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -484,9 +553,48 @@ cdef class OrderBook(PubSub):
     def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
 
+    def apply_diffs_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, using its pre-parsed rows arrays when the data source provided them.
+        """
+        if message.has_rows_array:
+            self.c_apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, using its pre-parsed rows arrays when the data source provided them.
+        """
+        if message.has_rows_array:
+            self.c_apply_numpy_snapshot(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diffs_message(diff)
+
+
+cdef int64_t c_numpy_rows_to_entries(np.ndarray[np.float64_t, ndim=2] rows_array,
+                                     vector[OrderBookEntry] &entries):
+    """
+    Appends one OrderBookEntry per [price, amount, update_id] row, reading the array buffer directly.
+    :return: the largest update id found in the rows (0 if there are no rows)
+    """
+    cdef:
+        Py_ssize_t i
+        Py_ssize_t rows_count = rows_array.shape[0]
+        int64_t row_update_id
+        int64_t last_update_id = 0
+
+    entries.reserve(entries.size() + rows_count)
+    for i in range(rows_count):
+        row_update_id = <int64_t>rows_array[i, 2]
+        entries.push_back(OrderBookEntry(rows_array[i, 0], rows_array[i, 1], row_update_id))
+        if row_update_id > last_update_id:
+            last_update_id = row_update_id
+    return last_update_id
@@ -0,0 +1,148 @@
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+# One row per order book level (snapshots and diffs) or per trade. The rows of a message are stored contiguously
+# and share the timestamp, type and update id (the trade id for trades). The side is the TradeType value: BUY for
+# bids and buy trades, SELL for asks and sell trades. The dtype is aligned, so the columns of a memory mapped file can
+# be read in place.
+ORDER_BOOK_EVENT_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("update_id", np.int64),
+    ("price", np.float64),
+    ("amount", np.float64),
+    ("type", np.uint8),
+    ("side", np.uint8),
+], align=True)
+
+BID_SIDE = TradeType.BUY.value
+ASK_SIDE = TradeType.SELL.value
+
+
+def order_book_message_to_events(message: OrderBookMessage) -> np.ndarray:
+    """
+    Converts a snapshot, diff or trade message into order book event rows.
+    Snapshots and diffs without any level produce no rows.
+    """
+    if message.type is OrderBookMessageType.TRADE:
+        events = np.empty(1, dtype=ORDER_BOOK_EVENT_DTYPE)
+        events["update_id"] = _int_or_default(message.trade_id)
+        events["price"] = float(message.content["price"])
+        events["amount"] = float(message.content["amount"])
+        events["side"] = int(float(message.content["trade_type"]))
+    else:
+        bids = message.bids_array
+        asks = message.asks_array
+        bids_count = bids.shape[0]
+        events = np.empty(bids_count + asks.shape[0], dtype=ORDER_BOOK_EVENT_DTYPE)
+        events["update_id"] = message.update_id
+        events["price"][:bids_count] = bids[:, 0]
+        events["price"][bids_count:] = asks[:, 0]
+        events["amount"][:bids_count] = bids[:, 1]
+        events["amount"][bids_count:] = asks[:, 1]
+        events["side"][:bids_count] = BID_SIDE
+        events["side"][bids_count:] = ASK_SIDE
+    events["timestamp"] = message.timestamp
+    events["type"] = message.type.value
+    return events
+
+
+def order_book_messages_to_events(messages: Iterable[OrderBookMessage]) -> np.ndarray:
+    event_arrays = [order_book_message_to_events(message) for message in messages]
+    if len(event_arrays) == 0:
+        return np.empty(0, dtype=ORDER_BOOK_EVENT_DTYPE)
+    return np.concatenate(event_arrays)
+
+
+def order_book_message_starts(events: np.ndarray) -> np.ndarray:
+    """
+    :return: the index of the first row of every message in the events array
+    """
+    if len(events) == 0:
+        return np.empty(0, dtype=np.int64)
+    timestamps = events["timestamp"]
+    types = events["type"]
+    update_ids = events["update_id"]
+    new_message = np.empty(len(events), dtype=bool)
+    new_message[0] = True
+    new_message[1:] = ((timestamps[1:] != timestamps[:-1])
+                       | (types[1:] != types[:-1])
+                       | (update_ids[1:] != update_ids[:-1])
+                       | (types[1:] == OrderBookMessageType.TRADE.value))
+    return np.flatnonzero(new_message)
+
+
+def sort_order_book_events(events: np.ndarray) -> np.ndarray:
+    """
+    Sorts the events by timestamp, keeping the recorded order of the events with the same timestamp.
+    The events are returned as they are when they are already sorted.
+    """
+    timestamps = events["timestamp"]
+    if len(events) < 2 or np.all(timestamps[1:] >= timestamps[:-1]):
+        return events
+    return events[np.argsort(timestamps, kind="stable")]
+
+
+def order_book_events_to_messages(events: np.ndarray, trading_pair: str) -> Iterator[OrderBookMessage]:
+    """
+    Rebuilds the order book messages from the event rows. Snapshot and diff messages carry their levels as rows
+    arrays, so they can be applied to an order book without parsing.
+    """
+    starts = order_book_message_starts(events).tolist()
+    ends = starts[1:] + [len(events)]
+    for start, end in zip(starts, ends):
+        rows = events[start:end]
+        message_type = OrderBookMessageType(int(rows["type"][0]))
+        update_id = int(rows["update_id"][0])
+        timestamp = float(rows["timestamp"][0])
+        if message_type is OrderBookMessageType.TRADE:
+            content = {
+                "trading_pair": trading_pair,
+                "trade_type": float(rows["side"][0]),
+                "trade_id": update_id,
+                "update_id": update_id,
+                "price": float(rows["price"][0]),
+                "amount": float(rows["amount"][0]),
+            }
+        else:
+            is_bid = rows["side"] == BID_SIDE
+            content = {
+                "trading_pair": trading_pair,
+                "update_id": update_id,
+                "bids_array": _rows_array(rows[is_bid], update_id),
+                "asks_array": _rows_array(rows[~is_bid], update_id),
+            }
+        yield OrderBookMessage(message_type, content, timestamp)
+
+
+def save_order_book_events(file_path: str, events: np.ndarray):
+    np.save(file_path, np.ascontiguousarray(events, dtype=ORDER_BOOK_EVENT_DTYPE))
+
+
+def load_order_book_events(file_path: str, memory_map: bool = True) -> np.ndarray:
+    """
+    :param memory_map: maps the file in read only mode instead of loading it, so the pages are read on demand and
+    shared between processes
+    """
+    events = np.load(file_path, mmap_mode="r" if memory_map else None)
+    if events.dtype != ORDER_BOOK_EVENT_DTYPE:
+        raise ValueError(f"{file_path} does not contain order book events (found dtype {events.dtype}).")
+    return events
+
+
+def _rows_array(rows: np.ndarray, update_id: int) -> np.ndarray:
+    rows_array = np.empty((len(rows), 3), dtype=np.float64)
+    rows_array[:, 0] = rows["price"]
+    rows_array[:, 1] = rows["amount"]
+    rows_array[:, 2] = update_id
+    return rows_array
+
+
+def _int_or_default(value: Union[int, str], default: int = -1) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,274 @@
+import logging
+import os
+import queue
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Set
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_event_log import (
+    ORDER_BOOK_EVENT_DTYPE,
+    load_order_book_events,
+    order_book_events_to_messages,
+    order_book_message_to_events,
+    order_book_messages_to_events,
+    sort_order_book_events,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+
+def order_book_snapshot_message(trading_pair: str, order_book: OrderBook, timestamp: float) -> OrderBookMessage:
+    """
+    Builds a snapshot message with the current levels of the order book.
+    """
+    bids_df, asks_df = order_book.snapshot
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": trading_pair,
+        "update_id": max(order_book.snapshot_uid, order_book.last_diff_uid),
+        "bids_array": bids_df[["price", "amount", "update_id"]].to_numpy(dtype=np.float64),
+        "asks_array": asks_df[["price", "amount", "update_id"]].to_numpy(dtype=np.float64),
+    }, timestamp)
+
+
+class OrderBookEventRecorder:
+    """
+    Records the order book messages of an OrderBookTracker into chunk files of order book event rows (see
+    `order_book_event_log`), in a directory per trading pair. The files are named after the first timestamp of the
+    chunk, so the chunks covering a time range can be found without reading them.
+
+    Recording a message only appends it to the trading pair buffer. Full buffers (`chunk_messages` messages, or
+    `chunk_duration` seconds of messages) are converted and written by a background writer thread. At most
+    `max_pending_chunks` chunks wait for the writer, the chunks exceeding the limit are dropped, so the memory used
+    is bounded if the disk can not keep up.
+
+    The writer keeps a copy of every recorded order book, and starts each chunk with a snapshot of it. Any chunk can
+    then be replayed on its own, without the previous ones. When a chunk of a trading pair is dropped, the copy misses
+    its diffs, so the following chunks of the trading pair start without snapshot until a recorded snapshot arrives.
+    """
+    _obr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obr_logger is None:
+            cls._obr_logger = logging.getLogger(__name__)
+        return cls._obr_logger
+
+    def __init__(self,
+                 directory: str,
+                 chunk_messages: int = 10000,
+                 chunk_duration: float = 300.0,
+                 max_pending_chunks: int = 32):
+        self._directory: str = directory
+        self._chunk_messages: int = chunk_messages
+        self._chunk_duration: float = chunk_duration
+        self._buffers: Dict[str, List[OrderBookMessage]] = defaultdict(list)
+        # Trading pairs with dropped chunks, the writer is notified with the next chunk submitted
+        self._desynced_trading_pairs: Set[str] = set()
+        self._write_queue: queue.Queue = queue.Queue(maxsize=max_pending_chunks)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._recorded_messages: int = 0
+        self._dropped_messages: int = 0
+        self._written_chunks: int = 0
+
+        # Only used by the writer thread
+        self._order_books: Dict[str, OrderBook] = {}
+        self._synced_trading_pairs: Set[str] = set()
+        self._chunk_sequences: Dict[str, int] = defaultdict(int)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def recorded_messages(self) -> int:
+        return self._recorded_messages
+
+    @property
+    def dropped_messages(self) -> int:
+        return self._dropped_messages
+
+    @property
+    def written_chunks(self) -> int:
+        return self._written_chunks
+
+    @property
+    def pending_chunks(self) -> int:
+        return self._write_queue.qsize()
+
+    def start(self):
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_loop,
+                                                   name="OrderBookEventRecorderWriter",
+                                                   daemon=True)
+            self._writer_thread.start()
+
+    def stop(self):
+        """
+        Writes the buffered messages and waits for the writer thread to finish.
+        """
+        self.flush()
+        if self._writer_thread is not None:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def flush(self):
+        """
+        Submits the buffered messages of every trading pair to the writer, even if the chunks are not full.
+        """
+        for trading_pair in list(self._buffers.keys()):
+            self._submit_chunk(trading_pair)
+
+    def record_message(self, message: OrderBookMessage):
+        trading_pair = message.trading_pair
+        buffer = self._buffers[trading_pair]
+        buffer.append(message)
+        self._recorded_messages += 1
+        if len(buffer) >= self._chunk_messages or message.timestamp - buffer[0].timestamp >= self._chunk_duration:
+            self._submit_chunk(trading_pair)
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, timestamp: float):
+        """
+        Records the current state of the order book as a snapshot message (used for the order books initialized from
+        the exchange REST API, and for the order books restored from a snapshot message and the past diffs).
+        """
+        self.record_message(order_book_snapshot_message(trading_pair, order_book, timestamp))
+
+    def _submit_chunk(self, trading_pair: str):
+        messages = self._buffers.pop(trading_pair, [])
+        if len(messages) == 0:
+            return
+        desynced = trading_pair in self._desynced_trading_pairs
+        try:
+            self._write_queue.put_nowait((trading_pair, messages, desynced))
+            self._desynced_trading_pairs.discard(trading_pair)
+        except queue.Full:
+            self._dropped_messages += len(messages)
+            self._desynced_trading_pairs.add(trading_pair)
+            self.logger().warning(f"The order book recorder writer is falling behind. Dropped {len(messages)} "
+                                  f"{trading_pair} messages.")
+
+    def _write_loop(self):
+        while True:
+            chunk = self._write_queue.get()
+            if chunk is None:
+                break
+            trading_pair, messages, desynced = chunk
+            try:
+                self._write_chunk(trading_pair, messages, desynced)
+            except Exception:
+                self.logger().error(f"Unexpected error writing {trading_pair} order book events.", exc_info=True)
+
+    def _write_chunk(self, trading_pair: str, messages: List[OrderBookMessage], desynced: bool = False):
+        """
+        :param desynced: True if previous chunks of the trading pair were dropped, the order book copy is then not
+        used until the next snapshot
+        """
+        if desynced:
+            self._synced_trading_pairs.discard(trading_pair)
+            self._order_books.pop(trading_pair, None)
+        events = order_book_messages_to_events(messages)
+        if len(events) == 0:
+            return
+        start_timestamp = float(events["timestamp"].min())
+        order_book = self._order_books.get(trading_pair)
+        if order_book is None:
+            order_book = OrderBook()
+            self._order_books[trading_pair] = order_book
+        if trading_pair in self._synced_trading_pairs:
+            snapshot = order_book_snapshot_message(trading_pair, order_book, start_timestamp)
+            events = np.concatenate([order_book_message_to_events(snapshot), events])
+        for message in messages:
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.apply_snapshot_message(message)
+                self._synced_trading_pairs.add(trading_pair)
+            elif message.type is OrderBookMessageType.DIFF:
+                order_book.apply_diffs_message(message)
+
+        pair_directory = os.path.join(self._directory, trading_pair)
+        os.makedirs(pair_directory, exist_ok=True)
+        file_name = f"{int(start_timestamp * 1e3):015d}-{self._chunk_sequences[trading_pair]:06d}.npy"
+        file_path = os.path.join(pair_directory, file_name)
+        temp_file_path = f"{file_path}.tmp"
+        # Written under a temporary name, so readers never find partially written chunks
+        with open(temp_file_path, "wb") as file:
+            np.save(file, events)
+        os.replace(temp_file_path, file_path)
+        self._chunk_sequences[trading_pair] += 1
+        self._written_chunks += 1
+
+
+class OrderBookEventReader:
+    """
+    Reads the chunk files written by OrderBookEventRecorder.
+    """
+
+    def __init__(self, directory: str):
+        self._directory: str = directory
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        if not os.path.isdir(self._directory):
+            return []
+        return sorted(name for name in os.listdir(self._directory)
+                      if os.path.isdir(os.path.join(self._directory, name)))
+
+    def chunk_files(self, trading_pair: str) -> List[str]:
+        pair_directory = os.path.join(self._directory, trading_pair)
+        if not os.path.isdir(pair_directory):
+            return []
+        return [os.path.join(pair_directory, name) for name in sorted(os.listdir(pair_directory))
+                if name.endswith(".npy")]
+
+    @staticmethod
+    def chunk_start_timestamp(file_path: str) -> float:
+        return int(os.path.basename(file_path).split("-")[0]) / 1e3
+
+    def iter_chunks(self,
+                    trading_pair: str,
+                    start_timestamp: Optional[float] = None,
+                    end_timestamp: Optional[float] = None,
+                    memory_map: bool = True) -> Iterator[np.ndarray]:
+        """
+        Yields the event chunks covering the time range. The first chunk is the last one starting before
+        `start_timestamp`, so the order book can be rebuilt from its initial snapshot.
+        """
+        files = self.chunk_files(trading_pair)
+        start_timestamps = [self.chunk_start_timestamp(file_path) for file_path in files]
+        first_chunk = 0
+        if start_timestamp is not None:
+            first_chunk = max(bisect_right(start_timestamps, start_timestamp) - 1, 0)
+        for file_path, chunk_start_timestamp in zip(files[first_chunk:], start_timestamps[first_chunk:]):
+            if end_timestamp is not None and chunk_start_timestamp > end_timestamp:
+                break
+            yield load_order_book_events(file_path, memory_map=memory_map)
+
+    def read_events(self,
+                    trading_pair: str,
+                    start_timestamp: Optional[float] = None,
+                    end_timestamp: Optional[float] = None) -> np.ndarray:
+        """
+        :return: the events up to `end_timestamp` sorted by timestamp, starting from the beginning of the chunk
+        including `start_timestamp` (see `iter_chunks`)
+        """
+        chunks = list(self.iter_chunks(trading_pair, start_timestamp, end_timestamp))
+        if len(chunks) == 0:
+            return np.empty(0, dtype=ORDER_BOOK_EVENT_DTYPE)
+        events = sort_order_book_events(np.concatenate(chunks))
+        if end_timestamp is not None:
+            events = events[events["timestamp"] <= end_timestamp]
+        return events
+
+    def iter_messages(self,
+                      trading_pair: str,
+                      start_timestamp: Optional[float] = None,
+                      end_timestamp: Optional[float] = None) -> Iterator[OrderBookMessage]:
+        for chunk in self.iter_chunks(trading_pair, start_timestamp, end_timestamp):
+            chunk = sort_order_book_events(chunk)
+            if end_timestamp is not None:
+                chunk = chunk[chunk["timestamp"] <= end_timestamp]
+            yield from order_book_events_to_messages(chunk, trading_pair)
@@ -1,11 +1,28 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
+def order_book_rows_array(entries: List[Any], update_id: int) -> np.ndarray:
+    """
+    Parses the raw order book entries of an exchange message into the float64 array accepted by
+    `OrderBook.apply_numpy_diffs` and `OrderBook.apply_numpy_snapshot`.
+    :param entries: the list of [price, amount, ...] entries (numbers or numeric strings)
+    :param update_id: the update id of the message, stored in the third column of every row
+    :return: an array with one [price, amount, update_id] row per entry
+    """
+    rows = np.empty((len(entries), 3), dtype=np.float64)
+    if len(entries) > 0:
+        rows[:, :2] = np.asarray([entry[:2] for entry in entries], dtype=np.float64)
+    rows[:, 2] = update_id
+    return rows
+
+
 class OrderBookMessageType(Enum):
     SNAPSHOT = 1
     DIFF = 2
@@ -54,16 +71,40 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def asks(self) -> List[OrderBookRow]:
+        if "asks" not in self.content and "asks_array" in self.content:
+            return self._rows_from_array(self.content["asks_array"])
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
         ]
 
     @property
     def bids(self) -> List[OrderBookRow]:
+        if "bids" not in self.content and "bids_array" in self.content:
+            return self._rows_from_array(self.content["bids_array"])
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def asks_array(self) -> np.ndarray:
+        """
+        The asks as a float64 array of [price, amount, update_id] rows. Data sources can provide it pre-parsed in the
+        "asks_array" content entry, otherwise it is built from `asks` the first time it is requested.
+        """
+        return self._rows_array("asks")
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bids as a float64 array of [price, amount, update_id] rows. Data sources can provide it pre-parsed in the
+        "bids_array" content entry, otherwise it is built from `bids` the first time it is requested.
+        """
+        return self._rows_array("bids")
+
+    @property
+    def has_rows_array(self) -> bool:
+        return "bids_array" in self.content and "asks_array" in self.content
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -72,6 +113,21 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def has_trade_id(self) -> bool:
         return self.type == OrderBookMessageType.TRADE
 
+    def _rows_array(self, side: str) -> np.ndarray:
+        key = f"{side}_array"
+        rows = self.content.get(key)
+        if rows is None:
+            rows = self.__dict__.get(key)
+            if rows is None:
+                rows = np.array([(row.price, row.amount, row.update_id) for row in getattr(self, side)],
+                                dtype=np.float64).reshape(-1, 3)
+                self.__dict__[key] = rows
+        return rows
+
+    @staticmethod
+    def _rows_from_array(rows: np.ndarray) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, int(update_id)) for price, amount, update_id in rows.tolist()]
+
     def __eq__(self, other: "OrderBookMessage") -> bool:
         eq = (
             (self.type == other.type)
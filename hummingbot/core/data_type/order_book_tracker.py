@@ -9,7 +9,9 @@ import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_event_recorder import OrderBookEventRecorder
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -23,6 +25,7 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_COALESCED_DIFFS: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,8 +34,13 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 coalesce_diffs: bool = False):
         self._domain: Optional[str] = domain
+        self._coalesce_diffs: bool = coalesce_diffs
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -45,6 +53,9 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._coalesced_diff_messages: Dict[str, int] = defaultdict(int)
+        self._coalesced_diff_batches: Dict[str, int] = defaultdict(int)
+        self._recorder: Optional[OrderBookEventRecorder] = None
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +79,38 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def coalesce_diffs(self) -> bool:
+        return self._coalesce_diffs
+
+    @property
+    def coalesced_diff_messages(self) -> Dict[str, int]:
+        """
+        Number of diff messages per trading pair that were merged into a batch instead of being applied individually
+        """
+        return dict(self._coalesced_diff_messages)
+
+    @property
+    def coalesced_diff_batches(self) -> Dict[str, int]:
+        """
+        Number of merged diff batches applied per trading pair
+        """
+        return dict(self._coalesced_diff_batches)
+
+    @property
+    def recorder(self) -> Optional[OrderBookEventRecorder]:
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[OrderBookEventRecorder]):
+        """
+        Sets the recorder the snapshot, diff and trade messages are written to, or None to stop recording.
+        Messages are recorded when they are applied to the order books, and the snapshots are recorded with the
+        order book state after restoring the past diffs, so replaying the recording reproduces the tracked order books.
+        It has to be set before starting the tracker.
+        """
+        self._recorder = recorder
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -77,6 +120,8 @@ class OrderBookTracker:
 
     def start(self):
         self.stop()
+        if self._recorder is not None:
+            self._recorder.start()
         self._init_order_books_task = safe_ensure_future(
             self._init_order_books()
         )
@@ -138,6 +183,8 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        if self._recorder is not None:
+            self._recorder.flush()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
@@ -177,7 +224,19 @@ class OrderBookTracker:
         Initialize order books
         """
         for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+            self._order_books[trading_pair] = order_book
+            saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+            if self._recorder is not None:
+                # As in the diff router, the diffs older than the order book snapshot are already included in it, so
+                # they are not recorded (and not applied) after the recorded initial order book
+                valid_messages = [message for message in saved_messages
+                                  if order_book.snapshot_uid <= message.update_id]
+                saved_messages.clear()
+                saved_messages.extend(valid_messages)
+                # The saved diffs are applied after the initial order book, so it is recorded before them
+                timestamp = min([time.time()] + [message.timestamp for message in saved_messages])
+                self._recorder.record_order_book(trading_pair, order_book, timestamp)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -261,6 +320,8 @@ class OrderBookTracker:
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
+        pending_message: Optional[OrderBookMessage] = None
+
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
@@ -268,13 +329,28 @@ class OrderBookTracker:
                 # Process saved messages first if there are any
                 if len(saved_messages) > 0:
                     message = saved_messages.popleft()
+                elif pending_message is not None:
+                    message = pending_message
+                    pending_message = None
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    diff_messages: List[OrderBookMessage] = [message]
+                    if self._coalesce_diffs and len(saved_messages) == 0:
+                        pending_message = self._drain_diff_messages(message_queue, diff_messages)
+
+                    if len(diff_messages) > 1:
+                        bids, asks = self._coalesce_diff_messages(diff_messages)
+                        order_book.apply_diffs(bids, asks, diff_messages[-1].update_id)
+                        self._coalesced_diff_messages[trading_pair] += len(diff_messages)
+                        self._coalesced_diff_batches[trading_pair] += 1
+                    else:
+                        order_book.apply_diffs_message(message)
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
+                    for diff_message in diff_messages:
+                        self._record_message(diff_message)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -285,6 +361,8 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if self._recorder is not None:
+                        self._recorder.record_order_book(trading_pair, order_book, message.timestamp)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +373,39 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _drain_diff_messages(self, message_queue: asyncio.Queue, diff_messages: List[OrderBookMessage]
+                             ) -> Optional[OrderBookMessage]:
+        """
+        Moves the diff messages already waiting in the queue into `diff_messages`, without awaiting.
+
+        :param message_queue: the tracking queue of the trading pair
+        :param diff_messages: the list of diff messages to extend, in arrival order
+
+        :return: the first non-diff message found in the queue (it has to be processed after the drained diffs),
+        or None if the queue was emptied or the batch size limit was reached
+        """
+        while not message_queue.empty() and len(diff_messages) < self.MAX_COALESCED_DIFFS:
+            next_message: OrderBookMessage = message_queue.get_nowait()
+            if next_message.type is not OrderBookMessageType.DIFF:
+                return next_message
+            diff_messages.append(next_message)
+        return None
+
+    @staticmethod
+    def _coalesce_diff_messages(diff_messages: List[OrderBookMessage]) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Merges several diff messages into a single set of bid and ask rows. For each price level only the last
+        update is kept, so applying the result is equivalent to applying the diffs one by one.
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        for diff_message in diff_messages:
+            for row in diff_message.bids:
+                bids[row.price] = row
+            for row in diff_message.asks:
+                asks[row.price] = row
+        return list(bids.values()), list(asks.values())
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -309,6 +420,7 @@ class OrderBookTracker:
                     messages_rejected += 1
                     continue
 
+                self._record_message(trade_message)
                 order_book: OrderBook = self._order_books[trading_pair]
                 order_book.apply_trade(OrderBookTradeEvent(
                     trading_pair=trade_message.trading_pair,
@@ -339,6 +451,10 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _record_message(self, message: OrderBookMessage):
+        if self._recorder is not None:
+            self._recorder.record_message(message)
+
     @staticmethod
     async def _sleep(delay: float):
         await asyncio.sleep(delay=delay)
@@ -36,6 +36,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookChangedEvent = 902
 
 
 class OrderBookDataSourceEvent(int, Enum):
@@ -147,6 +148,12 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookTopOfBookChangedEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+    top_of_book_version: int
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -13,7 +13,7 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import TokenGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -30,7 +30,8 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair, using a TokenGraph index of the stored
+    prices that is refreshed together with them.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -51,6 +52,7 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._token_graph: Optional[TokenGraph] = None
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -153,7 +155,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return find_rate(self._prices, pair, token_graph=self._get_token_graph())
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -184,7 +186,10 @@ class RateOracle(NetworkBase):
     async def _fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self._source.get_prices(quote_token=self._quote_token)
+                prices = await self._source.get_prices(quote_token=self._quote_token)
+                self._token_graph = (TokenGraph(prices) if self._token_graph is None
+                                     else self._token_graph.update_prices(prices))
+                self._prices = prices
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
@@ -193,3 +198,8 @@ class RateOracle(NetworkBase):
                 self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
             await asyncio.sleep(1)
+
+    def _get_token_graph(self) -> TokenGraph:
+        if self._token_graph is None or not self._token_graph.indexes(self._prices):
+            self._token_graph = TokenGraph(self._prices)
+        return self._token_graph
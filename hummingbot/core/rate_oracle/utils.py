@@ -1,11 +1,113 @@
+from collections import deque
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
 
+MAX_CONVERSION_HOPS = 4
 
-def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
+# (price key, True if the price has to be inverted to convert from the edge origin token to its destination)
+ConversionStep = Tuple[str, bool]
+
+
+class TokenGraph:
+    """
+    Index of a dictionary of prices where every token is a node, linked to the tokens it has a price with.
+    Conversion paths are searched with a breadth first search (so the route with the fewest conversions is used) and
+    cached per requested trading pair, so repeated lookups only multiply the prices along the cached path.
+    The graph depends only on the price keys, it can be kept when the prices are refreshed with the same pairs.
+    """
+
+    def __init__(self, prices: Dict[str, Decimal]):
+        self._prices: Dict[str, Decimal] = prices
+        self._pairs: FrozenSet[str] = frozenset(prices)
+        self._adjacency: Dict[str, Dict[str, ConversionStep]] = {}
+        self._paths: Dict[str, Optional[List[ConversionStep]]] = {}
+        for pair in prices:
+            try:
+                base, quote = split_hb_trading_pair(trading_pair=pair)
+            except ValueError:
+                continue
+            # Direct prices take precedence over inverted ones for the same pair of tokens
+            self._adjacency.setdefault(base, {})[quote] = (pair, False)
+            self._adjacency.setdefault(quote, {}).setdefault(base, (pair, True))
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices
+
+    def neighbors(self, token: str) -> List[str]:
+        return list(self._adjacency.get(token, {}))
+
+    def indexes(self, prices: Dict[str, Decimal]) -> bool:
+        """
+        Checks if the graph was built for the prices dictionary (and no pairs were added to it since then)
+        """
+        return prices is self._prices and len(prices) == len(self._pairs)
+
+    def update_prices(self, prices: Dict[str, Decimal]) -> "TokenGraph":
+        """
+        Returns a graph for the new prices, reusing this graph (and its cached paths) if the trading pairs are the same.
+        """
+        if prices.keys() == self._pairs:
+            self._prices = prices
+            return self
+        return TokenGraph(prices)
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the exchange rate for a trading pair, see find_rate
+        """
+        if pair in self._prices:
+            return self._prices[pair]
+        if pair in self._paths:
+            path = self._paths[pair]
+        else:
+            path = self._find_path(pair)
+            self._paths[pair] = path
+        if path is None:
+            return None
+        rate = Decimal("1")
+        for step_pair, inverted in path:
+            price = self._prices[step_pair]
+            if inverted:
+                if price == 0:
+                    return None
+                rate /= price
+            else:
+                rate *= price
+        return rate
+
+    def _find_path(self, pair: str) -> Optional[List[ConversionStep]]:
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return []
+        if base not in self._adjacency or quote not in self._adjacency:
+            return None
+        previous: Dict[str, Optional[Tuple[str, ConversionStep]]] = {base: None}
+        to_visit = deque([(base, 0)])
+        while to_visit:
+            token, hops = to_visit.popleft()
+            if hops == MAX_CONVERSION_HOPS:
+                continue
+            for neighbor, step in self._adjacency[token].items():
+                if neighbor in previous:
+                    continue
+                previous[neighbor] = (token, step)
+                if neighbor == quote:
+                    path = []
+                    while neighbor != base:
+                        neighbor, step = previous[neighbor]
+                        path.append(step)
+                    return path[::-1]
+                to_visit.append((neighbor, hops + 1))
+        return None
+
+
+def find_rate(prices: Dict[str, Decimal], pair: str, token_graph: Optional[TokenGraph] = None) -> Decimal:
     '''
     Finds exchange rate for a given trading pair from a dictionary of prices
     For example, given prices of {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
@@ -13,25 +115,22 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Indirect rates can be found through up to MAX_CONVERSION_HOPS conversions.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
+    :param token_graph: A TokenGraph built for the prices, to reuse its index and cached paths between calls (without
+    it, a one-off graph is built only when the rate needs a conversion path)
     '''
     if pair in prices:
         return prices[pair]
-    base, quote = split_hb_trading_pair(trading_pair=pair)
-    base = unwrap_token_symbol(base)
-    quote = unwrap_token_symbol(quote)
-    if base == quote:
-        return Decimal("1")
-    reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
-    if reverse_pair in prices:
-        return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = split_hb_trading_pair(base_pair)[1]
-        link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    if token_graph is None:
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
+        if reverse_pair in prices:
+            return Decimal("1") / prices[reverse_pair]
+        token_graph = TokenGraph(prices)
+    return token_graph.find_rate(pair)
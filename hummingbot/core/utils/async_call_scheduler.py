@@ -1,13 +1,17 @@
 #!/usr/bin/env python
 
 import asyncio
+import time
 from async_timeout import timeout
 import logging
 from typing import (
+    Dict,
+    List,
     Optional,
     Coroutine,
     NamedTuple,
-    Callable
+    Callable,
+    Set
 )
 
 import hummingbot
@@ -20,9 +24,80 @@ class AsyncCallSchedulerItem(NamedTuple):
     coroutine: Coroutine
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    enqueue_timestamp: float = 0
+
+
+class AsyncCallSchedulerLaneMetrics(NamedTuple):
+    queue_depth: int
+    in_flight_calls: int
+    completed_calls: int
+    failed_calls: int
+    average_wait_time: float
+    max_wait_time: float
+    average_call_time: float
+    max_call_time: float
+
+
+class AsyncCallSchedulerLane:
+    """
+    Queue of calls executed by up to `concurrency` workers, each one waiting `call_interval` after every call.
+    """
+
+    def __init__(self, name: str, concurrency: int = 1, call_interval: float = 0.01):
+        self.name: str = name
+        self.concurrency: int = concurrency
+        self.call_interval: float = call_interval
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.worker_tasks: List[asyncio.Task] = []
+        # Workers executing a call, and the worker generation (the workers of older generations exit after their call)
+        self.busy_workers: Set[asyncio.Task] = set()
+        self.generation: int = 0
+
+        self.in_flight_calls: int = 0
+        self.completed_calls: int = 0
+        self.failed_calls: int = 0
+        self.total_wait_time: float = 0
+        self.max_wait_time: float = 0
+        self.total_call_time: float = 0
+        self.max_call_time: float = 0
+
+    @property
+    def metrics(self) -> AsyncCallSchedulerLaneMetrics:
+        finished_calls = self.completed_calls + self.failed_calls
+        return AsyncCallSchedulerLaneMetrics(
+            queue_depth=self.queue.qsize(),
+            in_flight_calls=self.in_flight_calls,
+            completed_calls=self.completed_calls,
+            failed_calls=self.failed_calls,
+            average_wait_time=self.total_wait_time / finished_calls if finished_calls else 0,
+            max_wait_time=self.max_wait_time,
+            average_call_time=self.total_call_time / finished_calls if finished_calls else 0,
+            max_call_time=self.max_call_time,
+        )
+
+    def record_call_start(self, wait_time: float):
+        self.in_flight_calls += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def record_call_end(self, call_time: float, success: bool):
+        self.in_flight_calls -= 1
+        if success:
+            self.completed_calls += 1
+        else:
+            self.failed_calls += 1
+        self.total_call_time += call_time
+        self.max_call_time = max(self.max_call_time, call_time)
 
 
 class AsyncCallScheduler:
+    """
+    Executes the scheduled calls in named lanes. The calls of each lane are executed in order, with the lane
+    concurrency and pacing, so a slow call only delays the calls waiting in its own lane.
+    Calls scheduled without a lane go to the default lane, which executes one call at a time.
+    """
+    DEFAULT_LANE = "default"
+
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
@@ -39,45 +114,107 @@ class AsyncCallScheduler:
         return cls._acs_logger
 
     def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
-        self._coro_scheduler_task: Optional[asyncio.Task] = None
         self._call_interval: float = call_interval
+        self._lanes: Dict[str, AsyncCallSchedulerLane] = {}
+        self._started: bool = False
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.configure_lane(self.DEFAULT_LANE)
 
     @property
     def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+        return self._lanes[self.DEFAULT_LANE].queue
 
     @property
     def coro_scheduler_task(self) -> Optional[asyncio.Task]:
-        return self._coro_scheduler_task
+        worker_tasks = self._lanes[self.DEFAULT_LANE].worker_tasks
+        return worker_tasks[0] if worker_tasks else None
 
     @property
     def started(self) -> bool:
-        return self._coro_scheduler_task is not None
+        return self._started
+
+    @property
+    def lanes(self) -> List[str]:
+        return list(self._lanes.keys())
+
+    @property
+    def lane_metrics(self) -> Dict[str, AsyncCallSchedulerLaneMetrics]:
+        """
+        Returns the queue depth and latency metrics of every lane
+        """
+        return {name: lane.metrics for name, lane in self._lanes.items()}
+
+    def configure_lane(self, name: str, concurrency: int = 1, call_interval: Optional[float] = None):
+        """
+        Creates a lane, or updates its configuration if it already exists.
+        :param name: the lane name
+        :param concurrency: the max number of calls of the lane executed at the same time
+        :param call_interval: the time each lane worker waits after a call (the scheduler call_interval by default)
+        """
+        if concurrency < 1:
+            raise ValueError(f"The lane concurrency should be at least 1 ({concurrency} was provided).")
+        lane = self._lanes.get(name)
+        if lane is None:
+            lane = AsyncCallSchedulerLane(name=name)
+            self._lanes[name] = lane
+        lane.concurrency = concurrency
+        lane.call_interval = self._call_interval if call_interval is None else call_interval
+        if self._started:
+            # The calls in flight are not cancelled, the workers executing them exit once they are done
+            self._retire_lane_workers(lane)
+            self._start_lane(lane)
 
     def start(self):
-        if self._coro_scheduler_task is not None:
+        if self._started:
             self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
-        )
+        self._started = True
+        for lane in self._lanes.values():
+            self._start_lane(lane)
 
     def stop(self):
-        if self._coro_scheduler_task is not None:
-            self._coro_scheduler_task.cancel()
-            self._coro_scheduler_task = None
+        self._started = False
+        for lane in self._lanes.values():
+            self._stop_lane(lane)
+
+    def _start_lane(self, lane: AsyncCallSchedulerLane):
+        lane.worker_tasks = [
+            safe_ensure_future(self._coro_scheduler(lane.queue, lane.call_interval, lane, lane.generation))
+            for _ in range(lane.concurrency)
+        ]
+
+    @staticmethod
+    def _retire_lane_workers(lane: AsyncCallSchedulerLane):
+        lane.generation += 1
+        for task in lane.worker_tasks:
+            if task not in lane.busy_workers:
+                task.cancel()
+        lane.worker_tasks = []
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
-        while True:
+    @staticmethod
+    def _stop_lane(lane: AsyncCallSchedulerLane):
+        for task in set(lane.worker_tasks) | lane.busy_workers:
+            task.cancel()
+        lane.worker_tasks = []
+        lane.generation += 1
+
+    async def _coro_scheduler(self,
+                              coro_queue: asyncio.Queue,
+                              interval: float = 0.01,
+                              lane: Optional[AsyncCallSchedulerLane] = None,
+                              generation: int = 0):
+        while lane is None or generation == lane.generation:
             app_warning_msg = "API call error."
+            call_start = None
+            success = False
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
+                fut, coro, timeout_seconds, app_warning_msg, enqueue_timestamp = await coro_queue.get()
+                call_start = time.perf_counter()
+                if lane is not None:
+                    lane.busy_workers.add(asyncio.current_task())
+                    lane.record_call_start(call_start - (enqueue_timestamp or call_start))
                 async with timeout(timeout_seconds):
                     fut.set_result(await coro)
+                success = True
             except asyncio.CancelledError:
                 try:
                     fut.cancel()
@@ -97,6 +234,13 @@ class AsyncCallScheduler:
                     fut.set_exception(e)
                 except Exception:
                     pass
+            finally:
+                if lane is not None and call_start is not None:
+                    lane.busy_workers.discard(asyncio.current_task())
+                    lane.record_call_end(time.perf_counter() - call_start, success)
+
+            if lane is not None and generation != lane.generation:
+                break
 
             try:
                 await asyncio.sleep(interval)
@@ -108,21 +252,30 @@ class AsyncCallScheduler:
     async def schedule_async_call(self,
                                   coro: Coroutine,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  lane: str = DEFAULT_LANE) -> any:
+        """
+        :param lane: the name of the lane to execute the call in, it is created with the default configuration if
+        it does not exist
+        """
+        if lane not in self._lanes:
+            self.configure_lane(lane)
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
-        if self._coro_scheduler_task is None:
+        self._lanes[lane].queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
+                                                                  app_warning_msg=app_warning_msg,
+                                                                  enqueue_timestamp=time.perf_counter()))
+        if not self._started:
             self.start()
         return await fut
 
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
+                         app_warning_msg: str = "API call error.",
+                         lane: str = DEFAULT_LANE) -> any:
         coro: Coroutine = self._ev_loop.run_in_executor(
             hummingbot.get_executor(),
             func,
             *args,
         )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg, lane=lane)
@@ -1,7 +1,7 @@
 import asyncio
-from collections import deque
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
@@ -10,12 +10,14 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a preallocated ring buffer (CandlesBuffer)
+    to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -26,7 +28,9 @@ class CandlesBase(NetworkBase):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(maxlen=max_records, n_columns=len(self.columns))
+        self._candles_df: Optional[pd.DataFrame] = None
+        self._candles_df_version: int = -1
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -54,7 +58,7 @@ class CandlesBase(NetworkBase):
     @property
     def is_ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -92,9 +96,35 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is built only when the candles change and is shared by all the callers until then, so it must be
+        copied before adding indicator columns or modifying it. To compute indicators on every tick use candles_array
+        (or CandlesIndicators), which do not build any DataFrame.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_version != self._candles.version:
+            self._candles_df = pd.DataFrame(self._candles.array, columns=self.columns, copy=True)
+            self._candles_df_version = self._candles.version
+        return self._candles_df
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read only view of the candles ordered from the oldest to the newest, without copying
+        them. The columns are in the order of the columns attribute. The view is only valid until the next update.
+        """
+        return self._candles.array
+
+    @property
+    def candles_version(self) -> int:
+        """
+        This property returns a number incremented every time the candles are updated, so the users of candles_array
+        can check if the candles changed since they last read them.
+        """
+        return self._candles.version
+
+    @property
+    def max_records(self) -> int:
+        return self._candles.maxlen
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -114,7 +144,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This is an abstract method that must be implemented by a subclass to fill the _candles buffer with historical candles.
         """
         raise NotImplementedError
 
@@ -0,0 +1,103 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Preallocated, fixed capacity ring buffer of candles, stored as rows of float64 columns.
+    It implements the subset of the deque interface used by the candles feeds (append, appendleft, extendleft, pop,
+    clear, indexing and maxlen), plus an O(1) update of the last candle.
+    Every row is written twice, at its position and at its position + maxlen, so the candles are always available in
+    order as a contiguous view of the storage (see `array`) without copying them.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        self._maxlen: int = maxlen
+        self._storage: np.ndarray = np.zeros((2 * maxlen, n_columns), dtype=np.float64)
+        self._start: int = 0
+        self._length: int = 0
+        self._version: int = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        Number of modifications done to the buffer, to invalidate data derived from its content
+        """
+        return self._version
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Read only view of the candles in order, from the oldest to the newest one
+        """
+        view = self._storage[self._start:self._start + self._length]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("CandlesBuffer index out of range")
+        return self._storage[self._start + index].copy()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(self._length):
+            yield self[index]
+
+    def append(self, candle: Iterable):
+        """
+        Adds a candle as the newest one, dropping the oldest candle if the buffer is full
+        """
+        if self._length == self._maxlen:
+            self._start = (self._start + 1) % self._maxlen
+        else:
+            self._length += 1
+        self._write(self._length - 1, candle)
+
+    def appendleft(self, candle: Iterable):
+        """
+        Adds a candle as the oldest one, dropping the newest candle if the buffer is full
+        """
+        self._start = (self._start - 1) % self._maxlen
+        if self._length < self._maxlen:
+            self._length += 1
+        self._write(0, candle)
+
+    def extendleft(self, candles: Iterable[Iterable]):
+        for candle in candles:
+            self.appendleft(candle)
+
+    def update_last(self, candle: Iterable):
+        """
+        Replaces the newest candle (the candle still open)
+        """
+        if self._length == 0:
+            raise IndexError("update_last on an empty CandlesBuffer")
+        self._write(self._length - 1, candle)
+
+    def pop(self) -> np.ndarray:
+        candle = self[-1]
+        self._length -= 1
+        self._version += 1
+        return candle
+
+    def clear(self):
+        self._start = 0
+        self._length = 0
+        self._version += 1
+
+    def _write(self, index: int, candle: Iterable):
+        position = (self._start + index) % self._maxlen
+        row = np.asarray(candle, dtype=np.float64)
+        self._storage[position] = row
+        self._storage[position + self._maxlen] = row
+        self._version += 1
@@ -0,0 +1,405 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
+
+HIGH_INDEX = CandlesBase.columns.index("high")
+LOW_INDEX = CandlesBase.columns.index("low")
+CLOSE_INDEX = CandlesBase.columns.index("close")
+
+
+class ExponentialAverage:
+    """
+    Exponential moving average of a series of values, seeded with the simple average of the first `length` values
+    (as pandas_ta ema: ewm with adjust=False after the seed).
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.total = 0.0
+        self.value = math.nan
+
+    def next(self, x: float) -> Tuple[Tuple[int, float, float], float]:
+        """
+        :return: the state after adding the value, and the average including it
+        """
+        count = self.count + 1
+        if count < self.length:
+            return (count, self.total + x, math.nan), math.nan
+        if count == self.length:
+            value = (self.total + x) / self.length
+        else:
+            value = self.alpha * x + (1 - self.alpha) * self.value
+        return (count, 0.0, value), value
+
+    def commit(self, state: Tuple[int, float, float]):
+        self.count, self.total, self.value = state
+
+
+class RunningMovingAverage:
+    """
+    Wilder's moving average (alpha = 1 / length) as computed by pandas_ta rma: an adjusted exponentially weighted
+    average, undefined until `length` values were added. NaN values at the start of the series are skipped.
+    """
+
+    def __init__(self, length: int):
+        self.length = length
+        self.decay = 1 - 1 / length
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.numerator = 0.0
+        self.denominator = 0.0
+
+    def next(self, x: float) -> Tuple[Tuple[int, float, float], float]:
+        if math.isnan(x):
+            return (self.count, self.numerator, self.denominator), math.nan
+        count = self.count + 1
+        numerator = x + self.decay * self.numerator
+        denominator = 1 + self.decay * self.denominator
+        value = numerator / denominator if count >= self.length else math.nan
+        return (count, numerator, denominator), value
+
+    def commit(self, state: Tuple[int, float, float]):
+        self.count, self.numerator, self.denominator = state
+
+
+class IncrementalIndicator(ABC):
+    """
+    Indicator computed from the candles one by one.
+    The closed candles are committed to the indicator state, while the values for the candle still open are computed
+    from the committed state without modifying it, so every candle update is O(1).
+    """
+
+    @property
+    @abstractmethod
+    def names(self) -> List[str]:
+        """
+        The names of the values calculated by the indicator, following pandas_ta column names
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _next(self, candle: np.ndarray) -> Tuple[object, Tuple[float, ...]]:
+        """
+        :return: the indicator state after the candle, and the indicator values including the candle
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _commit(self, state: object):
+        raise NotImplementedError
+
+    def commit(self, candle: np.ndarray) -> Tuple[float, ...]:
+        state, values = self._next(candle)
+        self._commit(state)
+        return values
+
+    def values(self, candle: np.ndarray) -> Tuple[float, ...]:
+        return self._next(candle)[1]
+
+
+class EMA(IncrementalIndicator):
+
+    def __init__(self, length: int = 10):
+        self._average = ExponentialAverage(length)
+
+    @property
+    def names(self) -> List[str]:
+        return [f"EMA_{self._average.length}"]
+
+    def reset(self):
+        self._average.reset()
+
+    def _next(self, candle: np.ndarray):
+        state, value = self._average.next(candle[CLOSE_INDEX])
+        return state, (value,)
+
+    def _commit(self, state):
+        self._average.commit(state)
+
+
+class RSI(IncrementalIndicator):
+
+    def __init__(self, length: int = 14):
+        self._length = length
+        self._gains = RunningMovingAverage(length)
+        self._losses = RunningMovingAverage(length)
+        self._previous_close = math.nan
+
+    @property
+    def names(self) -> List[str]:
+        return [f"RSI_{self._length}"]
+
+    def reset(self):
+        self._gains.reset()
+        self._losses.reset()
+        self._previous_close = math.nan
+
+    def _next(self, candle: np.ndarray):
+        close = candle[CLOSE_INDEX]
+        change = close - self._previous_close
+        gains_state, gains = self._gains.next(max(change, 0.0) if not math.isnan(change) else change)
+        losses_state, losses = self._losses.next(-min(change, 0.0) if not math.isnan(change) else change)
+        total = gains + losses
+        value = 100 * gains / total if total > 0 else math.nan
+        return (gains_state, losses_state, close), (value,)
+
+    def _commit(self, state):
+        gains_state, losses_state, self._previous_close = state
+        self._gains.commit(gains_state)
+        self._losses.commit(losses_state)
+
+
+class ATR(IncrementalIndicator):
+
+    def __init__(self, length: int = 14):
+        self._length = length
+        self._average = RunningMovingAverage(length)
+        self._previous_close = math.nan
+
+    @property
+    def names(self) -> List[str]:
+        return [f"ATRr_{self._length}"]
+
+    def reset(self):
+        self._average.reset()
+        self._previous_close = math.nan
+
+    def _next(self, candle: np.ndarray):
+        high = candle[HIGH_INDEX]
+        low = candle[LOW_INDEX]
+        if math.isnan(self._previous_close):
+            true_range = math.nan
+        else:
+            true_range = max(high - low, abs(high - self._previous_close), abs(self._previous_close - low))
+        state, value = self._average.next(true_range)
+        return (state, candle[CLOSE_INDEX]), (value,)
+
+    def _commit(self, state):
+        average_state, self._previous_close = state
+        self._average.commit(average_state)
+
+
+class BollingerBands(IncrementalIndicator):
+
+    def __init__(self, length: int = 5, std: float = 2.0):
+        self._length = length
+        self._std = float(std)
+        # Window of the closed candles, the open candle completes it
+        self._window = RingBuffer(length - 1) if length > 1 else None
+        self._count = 0
+
+    @property
+    def names(self) -> List[str]:
+        suffix = f"{self._length}_{self._std}"
+        return [f"BBL_{suffix}", f"BBM_{suffix}", f"BBU_{suffix}", f"BBB_{suffix}", f"BBP_{suffix}"]
+
+    def reset(self):
+        if self._window is not None:
+            self._window = RingBuffer(self._length - 1)
+        self._count = 0
+
+    def _next(self, candle: np.ndarray):
+        close = candle[CLOSE_INDEX]
+        count = self._count + 1
+        if count < self._length:
+            return (count, close), (math.nan,) * 5
+        if self._window is None:
+            mean, variance = close, 0.0
+        else:
+            mean, variance = self._stats_with(close)
+        deviation = self._std * math.sqrt(variance)
+        lower = mean - deviation
+        upper = mean + deviation
+        bandwidth = 100 * (upper - lower) / mean if mean != 0 else math.nan
+        percent = (close - lower) / (upper - lower) if upper != lower else math.nan
+        return (count, close), (lower, mean, upper, bandwidth, percent)
+
+    def _stats_with(self, close: float) -> Tuple[float, float]:
+        """
+        :return: mean and population variance of the closes in the window and the open candle close, from the window
+            running statistics (without adding the close to the window)
+        """
+        window_size = self._window.size
+        window_mean = self._window.window_mean
+        count = window_size + 1
+        mean = (window_size * window_mean + close) / count
+        sum_of_squared_deviations = window_size * self._window.window_variance + (close - window_mean) * (close - mean)
+        return mean, max(0.0, sum_of_squared_deviations / count)
+
+    def _commit(self, state):
+        self._count, close = state
+        if self._window is not None:
+            self._window.add_value(close)
+
+
+class MACD(IncrementalIndicator):
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = ExponentialAverage(fast)
+        self._slow = ExponentialAverage(slow)
+        self._signal = ExponentialAverage(signal)
+
+    @property
+    def names(self) -> List[str]:
+        suffix = f"{self._fast.length}_{self._slow.length}_{self._signal.length}"
+        return [f"MACD_{suffix}", f"MACDh_{suffix}", f"MACDs_{suffix}"]
+
+    def reset(self):
+        self._fast.reset()
+        self._slow.reset()
+        self._signal.reset()
+
+    def _next(self, candle: np.ndarray):
+        close = candle[CLOSE_INDEX]
+        fast_state, fast = self._fast.next(close)
+        slow_state, slow = self._slow.next(close)
+        macd = fast - slow
+        if math.isnan(macd):
+            signal_state, signal = None, math.nan
+        else:
+            # The signal line starts with the first valid MACD value
+            signal_state, signal = self._signal.next(macd)
+        return (fast_state, slow_state, signal_state), (macd, macd - signal, signal)
+
+    def _commit(self, state):
+        fast_state, slow_state, signal_state = state
+        self._fast.commit(fast_state)
+        self._slow.commit(slow_state)
+        if signal_state is not None:
+            self._signal.commit(signal_state)
+
+
+class CandlesIndicators:
+    """
+    Keeps a set of incremental indicators up to date with a candles feed.
+    Every time the values are requested, only the candles that changed since the previous request are processed: the
+    candles closed since then are committed to the indicators, and the values of the open candle are recalculated in
+    O(1). The indicator values of every candle are stored in a buffer aligned with the candles buffer.
+    If the candles are reloaded (e.g. when the historical candles are filled or after a reconnection) the
+    indicators are recalculated from the stored candles.
+    """
+
+    def __init__(self, candles: CandlesBase, indicators: List[IncrementalIndicator]):
+        self._candles: CandlesBase = candles
+        self._indicators: List[IncrementalIndicator] = indicators
+        self._names: List[str] = [name for indicator in indicators for name in indicator.names]
+        self._values: CandlesBuffer = CandlesBuffer(maxlen=candles.max_records, n_columns=len(self._names))
+        self._candles_version: int = -1
+        self._open_timestamp: Optional[float] = None
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    @property
+    def current_values(self) -> Dict[str, float]:
+        """
+        The indicator values of the last candle
+        """
+        self.update()
+        if len(self._values) == 0:
+            return {name: math.nan for name in self._names}
+        return dict(zip(self._names, self._values.array[-1].tolist()))
+
+    @property
+    def values_array(self) -> np.ndarray:
+        """
+        Read only view of the indicator values of every candle, with the columns in the order of names
+        """
+        self.update()
+        return self._values.array
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        """
+        The candles DataFrame with a column for every indicator value
+        """
+        self.update()
+        candles_df = self._candles.candles_df.copy()
+        candles_df[self._names] = self._values.array
+        return candles_df
+
+    def update(self):
+        if self._candles.candles_version == self._candles_version:
+            return
+        self._candles_version = self._candles.candles_version
+        candles = self._candles.candles_array
+        if len(candles) == 0:
+            self._reset()
+            return
+
+        open_position = self._open_candle_position(candles)
+        if open_position is None:
+            self._recalculate(candles)
+            return
+        if open_position < len(candles) - 1:
+            # The candle that was open and the next ones up to the new open candle are closed
+            self._values.update_last(self._commit(candles[open_position]))
+            for candle in candles[open_position + 1:-1]:
+                self._values.append(self._commit(candle))
+            self._values.append(self._open_candle_values(candles[-1]))
+            self._open_timestamp = candles[-1][0]
+        else:
+            self._values.update_last(self._open_candle_values(candles[-1]))
+
+    def _open_candle_position(self, candles: np.ndarray) -> Optional[int]:
+        """
+        :return: The position of the candle that was open in the last update, if the candles are a continuation of
+            the ones already processed
+        """
+        if self._open_timestamp is None:
+            return None
+        for position in range(len(candles) - 1, -1, -1):
+            timestamp = candles[position][0]
+            if timestamp == self._open_timestamp:
+                # Candles can only be added at the end (dropping the oldest ones), otherwise the indicator values
+                # are no longer aligned with the candles
+                new_candles = len(candles) - 1 - position
+                aligned = min(self._values.maxlen, len(self._values) + new_candles) == len(candles)
+                return position if aligned else None
+            if timestamp < self._open_timestamp:
+                break
+        return None
+
+    def _commit(self, candle: np.ndarray) -> List[float]:
+        values = []
+        for indicator in self._indicators:
+            values.extend(indicator.commit(candle))
+        return values
+
+    def _open_candle_values(self, candle: np.ndarray) -> List[float]:
+        values = []
+        for indicator in self._indicators:
+            values.extend(indicator.values(candle))
+        return values
+
+    def _reset(self):
+        for indicator in self._indicators:
+            indicator.reset()
+        self._values.clear()
+        self._open_timestamp = None
+
+    def _recalculate(self, candles: np.ndarray):
+        self._reset()
+        for candle in candles[:-1]:
+            self._values.append(self._commit(candle))
+        self._values.append(self._open_candle_values(candles[-1]))
+        self._open_timestamp = candles[-1][0]
@@ -31,6 +31,9 @@ DISABLED_COMMANDS = {
 # Telegram does not allow sending messages longer than 4096 characters
 TELEGRAM_MSG_LENGTH_LIMIT = 3000
 
+# Messages are sent in their own AsyncCallScheduler lane, so a slow Telegram API doesn't delay other scheduled calls
+TELEGRAM_CALLS_LANE = "telegram"
+
 
 def authorized_only(handler: Callable[[Any, Bot, Update], None]) -> Callable[..., Any]:
     """ Decorator to check if the message comes from the correct chat_id """
@@ -180,7 +183,7 @@ class TelegramNotifier(NotifierBase):
                     text=formatted_msg,
                     parse_mode=ParseMode.HTML,
                     reply_markup=reply_markup
-                ))
+                ), lane=TELEGRAM_CALLS_LANE)
             except NetworkError as network_err:
                 # Sometimes the telegram server resets the current connection,
                 # if this is the case we send the message again.
@@ -191,7 +194,7 @@ class TelegramNotifier(NotifierBase):
                     text=msg,
                     parse_mode=ParseMode.MARKDOWN,
                     reply_markup=reply_markup
-                ))
+                ), lane=TELEGRAM_CALLS_LANE)
         except TelegramError as telegram_err:
             self.logger().network(f"TelegramError: {telegram_err.message}! Giving up on that message.",
                                   exc_info=True)
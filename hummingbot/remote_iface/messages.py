@@ -109,6 +109,26 @@ class HistoryCommandMessage(RPCMessage):
         trades: Optional[List[Any]] = []
 
 
+class TickProfileCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        action: Optional[str] = None
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        data: Optional[Dict[str, Any]] = {}
+
+
+class StrategyLatencyCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        pass
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        data: Optional[Dict[str, Any]] = {}
+
+
 class BalanceLimitCommandMessage(RPCMessage):
     class Request(RPCMessage.Request):
         exchange: str
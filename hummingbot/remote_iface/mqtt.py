@@ -43,6 +43,8 @@ from hummingbot.remote_iface.messages import (
     StartCommandMessage,
     StatusCommandMessage,
     StopCommandMessage,
+    StrategyLatencyCommandMessage,
+    TickProfileCommandMessage,
 )
 
 mqtts_logger: HummingbotLogger = None
@@ -58,6 +60,8 @@ class CommandTopicSpecs:
     BALANCE_LIMIT: str = '/balance/limit'
     BALANCE_PAPER: str = '/balance/paper'
     COMMAND_SHORTCUT: str = '/command_shortcuts'
+    TICK_PROFILE: str = '/tick_profile'
+    STRATEGY_LATENCY: str = '/strategy_latency'
 
 
 class TopicSpecs:
@@ -96,6 +100,8 @@ class MQTTCommands:
         self._balance_limit_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_LIMIT}'
         self._balance_paper_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_PAPER}'
         self._shortcuts_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.COMMAND_SHORTCUT}'
+        self._tick_profile_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.TICK_PROFILE}'
+        self._strategy_latency_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.STRATEGY_LATENCY}'
 
         self._init_commands()
 
@@ -145,6 +151,16 @@ class MQTTCommands:
             msg_type=CommandShortcutMessage,
             on_request=self._on_cmd_command_shortcut
         )
+        self._node.create_rpc(
+            rpc_name=self._tick_profile_uri,
+            msg_type=TickProfileCommandMessage,
+            on_request=self._on_cmd_tick_profile
+        )
+        self._node.create_rpc(
+            rpc_name=self._strategy_latency_uri,
+            msg_type=StrategyLatencyCommandMessage,
+            on_request=self._on_cmd_strategy_latency
+        )
 
     def _on_cmd_start(self, msg: StartCommandMessage.Request):
         response = StartCommandMessage.Response()
@@ -321,6 +337,60 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    def _on_cmd_tick_profile(self, msg: TickProfileCommandMessage.Request):
+        response = TickProfileCommandMessage.Response()
+        timeout = 30  # seconds
+        try:
+            if msg.action is not None:
+                # The profiler is attached to the clock on the event loop thread, as in the tick_profile command
+                res = call_sync(
+                    self._set_tick_profiling(msg.action),
+                    loop=self._ev_loop,
+                    timeout=timeout
+                )
+                response.msg = res if res is not None else ''
+                if msg.action == 'stop':
+                    return response
+            if self._hb_app.clock_profiler is None:
+                raise Exception('Tick profiling is not enabled - please run "tick_profile start" first')
+            response.data = self._hb_app.clock_profiler.report()
+        except asyncio.exceptions.TimeoutError:
+            response.msg = f'Hummingbot tick_profile command timed out after {timeout} seconds'
+            response.status = MQTT_STATUS_CODE.ERROR
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
+    async def _set_tick_profiling(self, action: str) -> str:
+        return self._hb_app.set_tick_profiling(action)
+
+    def _on_cmd_strategy_latency(self, msg: StrategyLatencyCommandMessage.Request):
+        response = StrategyLatencyCommandMessage.Response()
+        timeout = 30  # seconds
+        try:
+            strategy = self._hb_app.strategy
+            if strategy is None:
+                raise Exception('No strategy is currently running!')
+            if not hasattr(strategy, "latency_report"):
+                raise Exception(f'The {self._hb_app.strategy_name} strategy does not report latencies')
+            # The latency histograms are updated on the event loop thread, the report is built there too
+            response.data = call_sync(
+                self._strategy_latency_report(strategy),
+                loop=self._ev_loop,
+                timeout=timeout
+            )
+        except asyncio.exceptions.TimeoutError:
+            response.msg = f'Hummingbot strategy_latency command timed out after {timeout} seconds'
+            response.status = MQTT_STATUS_CODE.ERROR
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
+    async def _strategy_latency_report(self, strategy) -> Dict[str, Any]:
+        return strategy.latency_report()
+
 
 class MQTTMarketEventForwarder:
     @classmethod
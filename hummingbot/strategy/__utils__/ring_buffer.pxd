@@ -8,13 +8,24 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        double _sum
+        double _m2
+        int64_t _finite_count
+        int64_t _non_finite_count
+        int64_t _added_values
 
-    cdef void c_add_value(self, float val)
+    cdef void c_reset(self, int64_t length)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_delimiter(self)
+    cdef void c_recalculate_stats(self)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
+    cdef int64_t c_size(self)
+    cdef double c_window_mean(self)
+    cdef double c_window_variance(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef np.ndarray c_get_ordered_view(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
@@ -1,11 +1,25 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt
 
 
 pmm_logger = None
 
+# Number of full buffer rotations between two recalculations of the running statistics from the values, to discard
+# the accumulated rounding errors
+cdef int64_t STATS_RECALCULATION_ROTATIONS = 100
+
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last added values.
+
+    Every value is written twice, at its position and at its position + length, so the values in insertion order are
+    always a contiguous slice of the underlying array (see `get_ordered_view`). The sum and the sum of squared
+    deviations (Welford) of the values are updated as values are added and replaced, so the mean, variance and
+    standard deviation are O(1). Non finite values are left out of the running statistics, and make them NaN while
+    they are in the buffer.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -14,67 +28,142 @@ cdef class RingBuffer:
         return pmm_logger
 
     def __cinit__(self, int length):
+        self.c_reset(length)
+
+    def __dealloc__(self):
+        self._buffer = None
+
+    cdef void c_reset(self, int64_t length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._sum = 0
+        self._m2 = 0
+        self._finite_count = 0
+        self._non_finite_count = 0
+        self._added_values = 0
+
+    cdef void c_add_value(self, double val):
+        cdef:
+            double removed
+            double previous_mean
+            double mean
+            bint removed_is_finite = True
 
-    def __dealloc__(self):
-        self._buffer = None
+        if self._is_full:
+            removed = self._buffer[self._delimiter]
+            removed_is_finite = isfinite(removed)
+            if not removed_is_finite:
+                self._non_finite_count -= 1
+
+        if self._is_full and removed_is_finite and isfinite(val):
+            # Replacement of a value, the count does not change
+            previous_mean = self._sum / self._finite_count
+            self._sum += val - removed
+            mean = self._sum / self._finite_count
+            self._m2 += (val - removed) * (val - mean + removed - previous_mean)
+        else:
+            if self._is_full and removed_is_finite:
+                if self._finite_count == 1:
+                    self._sum = 0
+                    self._m2 = 0
+                else:
+                    previous_mean = self._sum / self._finite_count
+                    self._sum -= removed
+                    mean = self._sum / (self._finite_count - 1)
+                    self._m2 -= (removed - previous_mean) * (removed - mean)
+                self._finite_count -= 1
+            if isfinite(val):
+                previous_mean = self._sum / self._finite_count if self._finite_count > 0 else 0
+                self._sum += val
+                mean = self._sum / (self._finite_count + 1)
+                self._m2 += (val - previous_mean) * (val - mean)
+                self._finite_count += 1
+            else:
+                self._non_finite_count += 1
 
-    cdef void c_add_value(self, float val):
         self._buffer[self._delimiter] = val
+        self._buffer[self._delimiter + self._length] = val
         self.c_increment_delimiter()
 
+        self._added_values += 1
+        if self._delimiter == 0 and (self._added_values == self._length
+                                     or self._added_values % (self._length * STATS_RECALCULATION_ROTATIONS) == 0):
+            self.c_recalculate_stats()
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_recalculate_stats(self):
+        values = self.c_get_ordered_view()
+        finite_values = values[np.isfinite(values)]
+        self._finite_count = finite_values.size
+        self._non_finite_count = values.size - finite_values.size
+        self._sum = np.sum(finite_values)
+        if self._finite_count > 0:
+            self._m2 = np.sum(np.square(finite_values - self._sum / self._finite_count))
+        else:
+            self._m2 = 0
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[self._delimiter + self._length - 1]
 
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_window_mean(self):
+        if self._finite_count == 0 or self._non_finite_count > 0:
+            return np.nan
+        return self._sum / self._finite_count
+
+    cdef double c_window_variance(self):
+        if self._finite_count == 0 or self._non_finite_count > 0:
+            return np.nan
+        return max(self._m2, 0) / self._finite_count
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_window_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_window_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_window_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
-
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+    cdef np.ndarray c_get_ordered_view(self):
+        cdef np.ndarray view
+        if self._is_full:
+            view = np.asarray(self._buffer[self._delimiter:self._delimiter + self._length])
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            view = np.asarray(self._buffer[:self._delimiter])
+        view.flags.writeable = False
+        return view
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return np.array(self.c_get_ordered_view())
 
     def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(length)
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +171,13 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_ordered_view(self) -> np.ndarray:
+        """
+        :return: a read only array of the values from the oldest to the newest, sharing the memory of the buffer.
+        It is only valid until the next value is added, copy it (or use `get_as_numpy_array`) to keep the values.
+        """
+        return self.c_get_ordered_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +185,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -101,6 +201,16 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def window_mean(self) -> float:
+        """The mean of the values in the buffer, even if it is not full (NaN when empty)"""
+        return self.c_window_mean()
+
+    @property
+    def window_variance(self) -> float:
+        """The population variance of the values in the buffer, even if it is not full (NaN when empty)"""
+        return self.c_window_variance()
+
     @property
     def length(self) -> int:
         return self._length
@@ -109,10 +219,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
@@ -1,12 +1,14 @@
 import logging
 from abc import ABC, abstractmethod
 
-import numpy as np
-
 from ..ring_buffer import RingBuffer
 
 pmm_logger = None
 
+# Number of sampling buffer rotations between two recalculations of the incrementally updated values from the samples,
+# to discard the accumulated rounding errors
+SAMPLING_STATS_RECALCULATION_ROTATIONS = 100
+
 
 class BaseTrailingIndicator(ABC):
     @classmethod
@@ -20,9 +22,13 @@ class BaseTrailingIndicator(ABC):
         self._sampling_buffer = RingBuffer(sampling_length)
         self._processing_buffer = RingBuffer(processing_length)
         self._samples_length = 0
+        self._samples_added = 0
 
     def add_sample(self, value: float):
         self._sampling_buffer.add_value(value)
+        self._samples_added += 1
+        if self._samples_added % (self._sampling_buffer.length * SAMPLING_STATS_RECALCULATION_ROTATIONS) == 0:
+            self._recalculate_sampling_stats()
         indicator_value = self._indicator_calculation()
         self._processing_buffer.add_value(indicator_value)
 
@@ -30,12 +36,19 @@ class BaseTrailingIndicator(ABC):
     def _indicator_calculation(self) -> float:
         raise NotImplementedError
 
+    def _recalculate_sampling_stats(self):
+        """
+        Recalculates the values the indicator updates as samples are added from the sampling buffer. Called when the
+        sampling buffer length changes, and from time to time to discard the accumulated rounding errors.
+        """
+        pass
+
     def _processing_calculation(self) -> float:
         """
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        return self._processing_buffer.window_mean
 
     @property
     def current_value(self) -> float:
@@ -51,7 +64,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.size
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -63,6 +76,7 @@ class BaseTrailingIndicator(ABC):
     @sampling_length.setter
     def sampling_length(self, value):
         self._sampling_buffer.length = value
+        self._recalculate_sampling_stats()
 
     @property
     def processing_length(self) -> int:
@@ -1,17 +1,56 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+import math
+
+import numpy as np
+
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Exponential moving average of the samples in the sampling buffer, with a span of the sampling length (the same as
+    pandas `ewm(span=sampling_length, adjust=True).mean()` over the buffer). The weighted sums are updated as samples
+    are added and dropped, instead of recalculated over the whole buffer.
+    """
+
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+
+    @property
+    def _decay(self) -> float:
+        return 1 - 2 / (self._sampling_buffer.length + 1)
+
+    def add_sample(self, value: float):
+        value = float(value)
+        decay = self._decay
+        self._weighted_sum *= decay
+        self._weights_sum *= decay
+        if self._sampling_buffer.is_full:
+            dropped_value = self._sampling_buffer.get_ordered_view()[0]
+            if math.isfinite(dropped_value):
+                dropped_weight = decay ** self._sampling_buffer.length
+                self._weighted_sum -= dropped_weight * dropped_value
+                self._weights_sum -= dropped_weight
+        # Like pandas, the non finite samples are ignored but still age the other samples
+        if math.isfinite(value):
+            self._weighted_sum += value
+            self._weights_sum += 1
+        super().add_sample(value)
+
+    def _recalculate_sampling_stats(self):
+        samples = self._sampling_buffer.get_ordered_view()
+        weights = self._decay ** np.arange(samples.size - 1, -1, -1, dtype=np.float64)
+        weights[~np.isfinite(samples)] = 0
+        self._weighted_sum = float(np.dot(weights, np.nan_to_num(samples, nan=0.0, posinf=0.0, neginf=0.0)))
+        self._weights_sum = float(np.sum(weights))
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        if self._weights_sum <= 0:
+            return np.nan
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
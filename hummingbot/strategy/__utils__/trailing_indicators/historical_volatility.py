@@ -1,18 +1,31 @@
-from .base_trailing_indicator import BaseTrailingIndicator
 import numpy as np
 
+from ..ring_buffer import RingBuffer
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The log returns between the consecutive samples of the sampling buffer
+        self._log_returns = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        value = float(value)
+        if self._sampling_buffer.length > 1 and self._sampling_buffer.size > 0:
+            self._log_returns.add_value(np.log(value) - np.log(self._sampling_buffer.get_last_value()))
+        super().add_sample(value)
+
+    def _recalculate_sampling_stats(self):
+        self._log_returns = RingBuffer(max(self._sampling_buffer.length - 1, 1))
+        for log_return in np.diff(np.log(self._sampling_buffer.get_ordered_view())):
+            self._log_returns.add_value(log_return)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if self._sampling_buffer.size > 0:
+            # No returns yet, or non finite ones, count as no volatility
+            return np.nan_to_num(self._log_returns.window_variance)
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if self._processing_buffer.size > 0:
+            return np.sqrt(self._processing_buffer.window_mean)
@@ -1,17 +1,47 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+import math
+
 import numpy as np
 
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Sum of the squared changes between consecutive samples of the sampling buffer
+        self._squared_changes_sum = 0.0
+        self._non_finite_changes = 0
+
+    def add_sample(self, value: float):
+        value = float(value)
+        sampling_buffer = self._sampling_buffer
+        if sampling_buffer.length > 1:
+            if sampling_buffer.is_full:
+                oldest_values = sampling_buffer.get_ordered_view()[:2]
+                self._update_squared_changes(oldest_values[1] - oldest_values[0], -1)
+            if sampling_buffer.size > 0:
+                self._update_squared_changes(value - sampling_buffer.get_last_value(), 1)
+        super().add_sample(value)
+
+    def _update_squared_changes(self, change: float, sign: int):
+        if math.isfinite(change):
+            self._squared_changes_sum += sign * change * change
+        else:
+            self._non_finite_changes += sign
+
+    def _recalculate_sampling_stats(self):
+        changes = np.diff(self._sampling_buffer.get_ordered_view())
+        finite_changes = changes[np.isfinite(changes)]
+        self._squared_changes_sum = float(np.dot(finite_changes, finite_changes))
+        self._non_finite_changes = changes.size - finite_changes.size
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        if self._non_finite_changes > 0:
+            return np.nan
+        vol = np.sqrt(max(self._squared_changes_sum, 0.0) / self._sampling_buffer.size)
         return vol
 
     def _processing_calculation(self) -> float:
@@ -2,6 +2,7 @@
 
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
+from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book cimport OrderBook
@@ -13,16 +14,28 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
-        list _current_trade_sample
+        list _trade_sample_timestamps
+        dict _level_amounts
+        dict _level_counts
+        vector[double] _quote_timestamps
+        vector[double] _quote_prices
+        vector[double] _trade_timestamps
+        vector[double] _trade_prices
+        vector[double] _trade_amounts
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
         int _sampling_length
         int _samples_length
+        int _estimation_interval
+        int _calculations_since_estimation
+        bint _samples_changed
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_quote(self, double timestamp, double price)
+    cdef c_add_trade_sample(self, double sample_timestamp, double price_level, double amount)
+    cdef c_remove_trade_sample(self, double sample_timestamp)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -1,8 +1,8 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+import bisect
 import warnings
-from decimal import Decimal
 from typing import Tuple
 
 import numpy as np
@@ -17,6 +17,26 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+
+def intensity_curve(t, a, b):
+    return a * np.exp(-b * t)
+
+
+def intensity_curve_jacobian(t, a, b):
+    exp_bt = np.exp(-b * t)
+    return np.column_stack((exp_bt, -a * t * exp_bt))
+
+
+def log_linear_intensity_fit(price_levels: np.ndarray, lambdas: np.ndarray) -> Tuple[float, float]:
+    """
+    Closed form fit of lambda = alpha * exp(-kappa * price_level) as a line through the log of the intensities.
+    Residuals are weighted by the intensity, so the fit is close to the least squares fit of the curve, and is used
+    as its initial guess.
+    """
+    slope, intercept = np.polyfit(price_levels, np.log(lambdas), 1, w=lambdas)
+    return float(np.exp(intercept)), max(float(-slope), 0.0)
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,19 +46,36 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the trading intensity parameters alpha and kappa, fitting lambda = alpha * exp(-kappa * price_level) to
+    the traded amounts by distance from the mid price.
+
+    Quotes and trades are kept in arrays sorted by timestamp, and every trade is matched to the last quote before it
+    with a binary search. The traded amount of every price level is maintained as samples enter and leave the
+    sampling buffer, so estimating only fits the curve, warm started from the previous estimate. With
+    `estimation_interval` > 1 the curve is fitted at most once every `estimation_interval` calculations.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 estimation_interval: int = 1):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
-        self._current_trade_sample = []
+        self._trade_sample_timestamps = []
+        self._level_amounts = {}
+        self._level_counts = {}
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
         self._order_book.c_add_listener(OrderBookEvent.TradeEvent, self._trades_forwarder)
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._estimation_interval = estimation_interval
+        self._calculations_since_estimation = 0
+        self._samples_changed = False
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +85,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -64,103 +101,155 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def estimation_interval(self) -> int:
+        return self._estimation_interval
+
+    @estimation_interval.setter
+    def estimation_interval(self, value: int):
+        self._estimation_interval = value
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": self._quote_timestamps[i], "price": self._quote_prices[i]}
+                for i in reversed(range(self._quote_timestamps.size()))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quote_timestamps.clear()
+        self._quote_prices.clear()
+        # The quotes are listed in descending timestamp order
+        for quote in reversed(value):
+            self.c_add_quote(float(quote["timestamp"]), float(quote["price"]))
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
-        price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
-
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+        cdef:
+            size_t trade_index
+            size_t low
+            size_t high
+            size_t middle
+            double trade_timestamp
+            double quote_timestamp
+            int64_t quote_index
+            int64_t latest_processed_quote_index = -1
 
-        # THere are no trades left to process
-        self._current_trade_sample = []
+        price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
+        self.c_add_quote(timestamp, float(price))
+
+        for trade_index in range(self._trade_timestamps.size()):
+            trade_timestamp = self._trade_timestamps[trade_index]
+            # The last quote before the trade
+            low = 0
+            high = self._quote_timestamps.size()
+            while low < high:
+                middle = (low + high) // 2
+                if self._quote_timestamps[middle] < trade_timestamp:
+                    low = middle + 1
+                else:
+                    high = middle
+            quote_index = <int64_t>low - 1
+            if quote_index < 0:
+                continue
+            latest_processed_quote_index = max(latest_processed_quote_index, quote_index)
+            quote_timestamp = self._quote_timestamps[quote_index]
+            self.c_add_trade_sample(quote_timestamp + 1,
+                                    abs(self._trade_prices[trade_index] - self._quote_prices[quote_index]),
+                                    self._trade_amounts[trade_index])
+
+        # There are no trades left to process
+        self._trade_timestamps.clear()
+        self._trade_prices.clear()
+        self._trade_amounts.clear()
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        if latest_processed_quote_index > 0:
+            self._quote_timestamps.erase(self._quote_timestamps.begin(),
+                                         self._quote_timestamps.begin() + latest_processed_quote_index)
+            self._quote_prices.erase(self._quote_prices.begin(),
+                                     self._quote_prices.begin() + latest_processed_quote_index)
+
+        while len(self._trade_sample_timestamps) > self._sampling_length:
+            self.c_remove_trade_sample(self._trade_sample_timestamps[0])
+
+        self._calculations_since_estimation += 1
+        if (self.is_sampling_buffer_full
+                and self._samples_changed
+                and self._calculations_since_estimation >= self._estimation_interval):
             self.c_estimate_intensity()
+            self._samples_changed = False
+            self._calculations_since_estimation = 0
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
         self.c_register_trade(trade)
 
     cdef c_register_trade(self, object trade):
-        self._current_trade_sample.append(trade)
+        self._trade_timestamps.push_back(trade.timestamp)
+        self._trade_prices.push_back(trade.price)
+        self._trade_amounts.push_back(trade.amount)
+
+    cdef c_add_quote(self, double timestamp, double price):
+        self._quote_timestamps.push_back(timestamp)
+        self._quote_prices.push_back(price)
+
+    cdef c_add_trade_sample(self, double sample_timestamp, double price_level, double amount):
+        sample = self._trade_samples.get(sample_timestamp)
+        if sample is None:
+            sample = []
+            self._trade_samples[sample_timestamp] = sample
+            bisect.insort(self._trade_sample_timestamps, sample_timestamp)
+        sample.append((price_level, amount))
+        self._level_amounts[price_level] = self._level_amounts.get(price_level, 0.0) + amount
+        self._level_counts[price_level] = self._level_counts.get(price_level, 0) + 1
+        self._samples_changed = True
+
+    cdef c_remove_trade_sample(self, double sample_timestamp):
+        sample = self._trade_samples.pop(sample_timestamp)
+        self._trade_sample_timestamps.remove(sample_timestamp)
+        for price_level, amount in sample:
+            count = self._level_counts[price_level] - 1
+            if count == 0:
+                del self._level_counts[price_level]
+                del self._level_amounts[price_level]
+            else:
+                self._level_counts[price_level] = count
+                self._level_amounts[price_level] -= amount
+        self._samples_changed = True
 
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
+            int levels_count = len(self._level_amounts)
 
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        price_levels = np.fromiter(self._level_amounts.keys(), dtype=np.float64, count=levels_count)
+        lambdas = np.fromiter(self._level_amounts.values(), dtype=np.float64, count=levels_count)
+        descending_order = np.argsort(price_levels)[::-1]
+        price_levels = price_levels[descending_order]
+        lambdas = lambdas[descending_order]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas[lambdas == 0] = 10**-10
+
+        # Reuse previously calculated parameters as initial values, or the log linear fit for the first estimation
+        initial_values = (self._alpha, self._kappa)
+        if (self._alpha == 0 or self._kappa == 0) and levels_count > 1 and np.all(lambdas > 0):
+            initial_values = log_linear_intensity_fit(price_levels, lambdas)
 
-        # Fit the probability density function; reuse previously calculated parameters as initial values
+        # Fit the probability density function
         try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+            params = curve_fit(intensity_curve,
                                price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
+                               lambdas,
+                               p0=initial_values,
+                               jac=intensity_curve_jacobian,
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
 
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
+            self._alpha = params[0][0]
+            self._kappa = params[0][1]
+        except (RuntimeError, ValueError):
             pass
@@ -467,11 +467,11 @@ cdef class AroonOscillatorStrategy(StrategyBase):
 
     @property
     def active_buys(self) -> List[LimitOrder]:
-        return [o for o in self.active_orders if o.is_buy]
+        return self._sb_order_tracker.market_pair_to_active_bids.get(self._market_info, [])
 
     @property
     def active_sells(self) -> List[LimitOrder]:
-        return [o for o in self.active_orders if not o.is_buy]
+        return self._sb_order_tracker.market_pair_to_active_asks.get(self._market_info, [])
 
     @property
     def active_non_hanging_orders(self) -> List[LimitOrder]:
@@ -573,7 +573,7 @@ cdef class AroonOscillatorStrategy(StrategyBase):
         price = self.get_price()
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id not in self._hanging_order_ids])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from typing import Optional
 
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.common import PriceType
@@ -23,3 +24,11 @@ cdef class AssetPriceDelegate:
     @property
     def market(self) -> ExchangeBase:
         raise NotImplementedError
+
+    @property
+    def top_of_book_version(self) -> Optional[int]:
+        """
+        The version of the order book the prices come from (see OrderBook.top_of_book_version), or None if the
+        prices do not depend only on the top of an order book.
+        """
+        return None
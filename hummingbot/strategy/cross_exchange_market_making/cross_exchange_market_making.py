@@ -1,10 +1,12 @@
+import asyncio
 import logging
+import time
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -13,6 +15,7 @@ from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock import Clock
+from hummingbot.core.clock_profiler import LatencyHistogram
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount
@@ -25,7 +28,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -70,6 +73,9 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION = 60.0 * 15
     CANCEL_EXPIRY_DURATION = 60.0
 
+    # Upper bounds (in milliseconds) of the hedge latency histogram buckets
+    HEDGE_LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 250, 500, 1000, 5000)
+
     @classmethod
     def logger(cls):
         global s_logger
@@ -124,6 +130,26 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         self._cancel_outdated_orders_task = None
         self._hedge_maker_order_tasks = []
 
+        # Orders the processing of every market pair, and the number of hedges waiting for the lock of the pair
+        self._market_pair_locks = {}
+        self._pending_hedges = defaultdict(int)
+        # Time each market pair takes to be processed in main(), in milliseconds
+        self._market_pair_cycle_latencies = {}
+
+        # Taker price to hedge the active maker orders of every market pair and side, computed every tick as
+        # (timestamp, taker amount, price) for the fast hedges
+        self._taker_hedge_prices = {}
+        # Time the maker fills were received by exchange trade id, until their first hedge attempt, and the time the
+        # hedges were submitted by taker order id, until the taker order is acknowledged or fails
+        self._maker_fill_times = {}
+        self._hedge_submit_times = {}
+        # Times of the hedge being placed, the taker order can be acknowledged before its placement returns
+        self._placing_hedge_times = None
+        self._hedge_latencies = {
+            stage: LatencyHistogram(self.HEDGE_LATENCY_BUCKETS_MS)
+            for stage in ("fill_to_submit", "submit_to_ack", "fill_to_ack")
+        }
+
         self._last_conv_rates_logged = 0
         self._hb_app_notification = hb_app_notification
 
@@ -229,6 +255,22 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def gateway_transaction_cancel_interval(self):
         return self._config_map.gateway_transaction_cancel_interval
 
+    @property
+    def concurrent_market_pairs(self) -> bool:
+        return self._config_map.concurrent_market_pairs
+
+    @property
+    def market_pair_cycle_latencies(self) -> Dict[MakerTakerMarketPair, LatencyHistogram]:
+        return self._market_pair_cycle_latencies
+
+    @property
+    def fast_hedge_enabled(self) -> bool:
+        return self._config_map.fast_hedge_enabled
+
+    @property
+    def hedge_latencies(self) -> Dict[str, LatencyHistogram]:
+        return self._hedge_latencies
+
     @property
     def logging_options(self) -> int:
         return self._logging_options
@@ -352,13 +394,46 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             else:
                 lines.extend(["", "  No active maker market orders."])
 
+            cycle_latencies = self._market_pair_cycle_latencies.get(market_pair)
+            if cycle_latencies is not None:
+                lines.extend(["", f"  Cycle latency: mean {cycle_latencies.mean:.2f} ms, "
+                                  f"p99 {cycle_latencies.percentile(99):.2f} ms, max {cycle_latencies.max:.2f} ms "
+                                  f"({cycle_latencies.count} cycles)"])
+
             warning_lines.extend(self.balance_warning([market_pair.maker, market_pair.taker]))
 
+        if self._hedge_latencies["fill_to_submit"].count > 0:
+            lines.extend(["", "  Hedge latency:"] +
+                         ["    " + line for line in str(self.hedge_latency_df()).split("\n")])
+
         if len(warning_lines) > 0:
             lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
 
         return "\n".join(lines)
 
+    def hedge_latency_df(self) -> pd.DataFrame:
+        columns = ["Stage", "Hedges", "Mean (ms)", "P50 (ms)", "P99 (ms)", "Max (ms)"]
+        data = [
+            [stage, latencies.count, round(latencies.mean, 2), latencies.percentile(50), latencies.percentile(99),
+             round(latencies.max, 2)]
+            for stage, latencies in (("Fill to submit", self._hedge_latencies["fill_to_submit"]),
+                                     ("Submit to ack", self._hedge_latencies["submit_to_ack"]),
+                                     ("Fill to ack", self._hedge_latencies["fill_to_ack"]))
+        ]
+        return pd.DataFrame(data=data, columns=columns)
+
+    def latency_report(self) -> Dict[str, Any]:
+        """
+        :return: the latency histograms of the strategy, the cycle latencies are keyed by maker market and trading pair
+        """
+        return {
+            "market_pair_cycles": {
+                f"{market_pair.maker.market.display_name}:{market_pair.maker.trading_pair}": latencies.to_dict()
+                for market_pair, latencies in self._market_pair_cycle_latencies.items()
+            },
+            "hedges": {stage: latencies.to_dict() for stage, latencies in self._hedge_latencies.items()},
+        }
+
     def start(self, clock: Clock, timestamp: float):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
@@ -415,6 +490,9 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         if self._gateway_quotes_task is None or self._gateway_quotes_task.done():
             self._gateway_quotes_task = safe_ensure_future(self.get_gateway_quotes())
 
+        if self.fast_hedge_enabled:
+            self.update_taker_hedge_prices(timestamp)
+
         if self.ready_for_new_trades():
             if self._main_task is None or self._main_task.done():
                 self._main_task = safe_ensure_future(self.main(timestamp))
@@ -440,8 +518,24 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     market_pair_to_active_orders[market_pair].append(limit_order)
 
             # Process each market pair independently.
-            for market_pair in self._market_pairs.values():
-                await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+            if self.concurrent_market_pairs:
+                market_pairs = list(self._market_pairs.values())
+                results = await safe_gather(
+                    *[self.process_market_pair_cycle(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+                      for market_pair in market_pairs],
+                    return_exceptions=True
+                )
+                for market_pair, result in zip(market_pairs, results):
+                    if isinstance(result, Exception):
+                        self.log_with_clock(logging.ERROR,
+                                            f"({market_pair.maker.trading_pair}) Unexpected error processing the "
+                                            f"market pair.",
+                                            exc_info=result)
+            else:
+                for market_pair in self._market_pairs.values():
+                    await self.process_market_pair_cycle(timestamp,
+                                                         market_pair,
+                                                         market_pair_to_active_orders[market_pair])
 
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < timestamp:
@@ -451,22 +545,35 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self._last_timestamp = timestamp
 
     async def get_gateway_quotes(self):
-        for market_pair in self._market_pairs.values():
-            if self.is_gateway_market(market_pair.taker):
-                _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
-                order_amount = self._config_map.order_amount * base_rate
-                order_price = await market_pair.taker.market.get_order_price(
-                    market_pair.taker.trading_pair,
-                    True,
-                    order_amount
-                )
-                self._last_taker_buy_price = order_price
-                order_price = await market_pair.taker.market.get_order_price(
-                    market_pair.taker.trading_pair,
-                    False,
-                    order_amount
-                )
-                self._last_taker_sell_price = order_price
+        gateway_market_pairs = [market_pair for market_pair in self._market_pairs.values()
+                                if self.is_gateway_market(market_pair.taker)]
+        if self.concurrent_market_pairs:
+            await safe_gather(*[self.get_gateway_quote(market_pair) for market_pair in gateway_market_pairs])
+        else:
+            for market_pair in gateway_market_pairs:
+                await self.get_gateway_quote(market_pair)
+
+    async def get_gateway_quote(self, market_pair: MakerTakerMarketPair):
+        _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
+        order_amount = self._config_map.order_amount * base_rate
+        if self.concurrent_market_pairs:
+            self._last_taker_buy_price, self._last_taker_sell_price = await safe_gather(
+                market_pair.taker.market.get_order_price(market_pair.taker.trading_pair, True, order_amount),
+                market_pair.taker.market.get_order_price(market_pair.taker.trading_pair, False, order_amount),
+            )
+        else:
+            order_price = await market_pair.taker.market.get_order_price(
+                market_pair.taker.trading_pair,
+                True,
+                order_amount
+            )
+            self._last_taker_buy_price = order_price
+            order_price = await market_pair.taker.market.get_order_price(
+                market_pair.taker.trading_pair,
+                False,
+                order_amount
+            )
+            self._last_taker_sell_price = order_price
 
     def ready_for_new_trades(self) -> bool:
         """
@@ -494,6 +601,36 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 return True
         return False
 
+    def market_pair_lock(self, market_pair: MakerTakerMarketPair) -> asyncio.Lock:
+        lock = self._market_pair_locks.get(market_pair)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._market_pair_locks[market_pair] = lock
+        return lock
+
+    async def process_market_pair_cycle(self,
+                                        timestamp: float,
+                                        market_pair: MakerTakerMarketPair,
+                                        active_orders: List[LimitOrder]):
+        """
+        Runs process_market_pair() holding the lock of the market pair, and records the time it takes.
+
+        Hedges go first: the cycle is skipped when fills of the market pair are waiting to be hedged, their quotes are
+        refreshed in the next cycle.
+        """
+        async with self.market_pair_lock(market_pair):
+            if self._pending_hedges[market_pair] > 0:
+                return
+            start = time.perf_counter()
+            try:
+                await self.process_market_pair(timestamp, market_pair, active_orders)
+            finally:
+                latencies = self._market_pair_cycle_latencies.get(market_pair)
+                if latencies is None:
+                    latencies = LatencyHistogram()
+                    self._market_pair_cycle_latencies[market_pair] = latencies
+                latencies.add((time.perf_counter() - start) * 1e3)
+
     async def process_market_pair(self, timestamp: float, market_pair: MarketTradingPairTuple, active_orders: List):
         """
         For market pair being managed by this strategy object, do the following:
@@ -579,6 +716,22 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         If a limit order previously made to the maker side has been filled, hedge it on the taker side.
         :param order_filled_event: event object
         """
+        market_pair = self.record_maker_fill(order_filled_event)
+        if market_pair is not None:
+            # Call check_and_hedge_orders() to emit the orders on the taker side.
+            try:
+                await self.hedge_market_pair(market_pair)
+            except Exception:
+                self.log_with_clock(logging.ERROR, "Unexpected error.", exc_info=True)
+        # Only the first hedge attempt of a maker fill is measured
+        self._maker_fill_times.pop(order_filled_event.exchange_trade_id, None)
+
+    def record_maker_fill(self, order_filled_event: OrderFilledEvent) -> Optional[MakerTakerMarketPair]:
+        """
+        Stores the fill of a limit order previously made to the maker side, to be hedged.
+        :param order_filled_event: event object
+        :return: the market pair of the filled order, None if the order is not a maker order of the strategy
+        """
         order_id = order_filled_event.order_id
         market_pair = self._market_pair_tracker.get_market_pair_from_order_id(order_id)
 
@@ -615,11 +768,134 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                         f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
                     )
 
-            # Call check_and_hedge_orders() to emit the orders on the taker side.
-            try:
+            return market_pair
+        return None
+
+    async def hedge_market_pair(self, market_pair: MakerTakerMarketPair):
+        """
+        Runs check_and_hedge_orders() holding the lock of the market pair. The cycles of the market pair waiting for
+        the lock meanwhile are skipped, so the hedge is not delayed by them.
+        """
+        self._pending_hedges[market_pair] += 1
+        try:
+            async with self.market_pair_lock(market_pair):
                 await self.check_and_hedge_orders(market_pair)
-            except Exception:
-                self.log_with_clock(logging.ERROR, "Unexpected error.", exc_info=True)
+        finally:
+            self._pending_hedges[market_pair] -= 1
+
+    def update_taker_hedge_prices(self, timestamp: float):
+        """
+        Computes the taker price to hedge the active maker orders of every market pair from the taker order book, for
+        the fast hedges of the fills received until the next tick.
+        """
+        maker_amounts = defaultdict(lambda: s_decimal_zero)
+        for maker_market, limit_order, order_id in self.active_maker_limit_orders:
+            market_pair = self._market_pairs.get((maker_market, limit_order.trading_pair))
+            if market_pair is None or self.is_gateway_market(market_pair.taker):
+                continue
+            # A maker buy is hedged with a taker sell, and a maker sell with a taker buy
+            key = (market_pair, not limit_order.is_buy)
+            maker_amounts[key] = max(maker_amounts[key], limit_order.quantity)
+
+        taker_hedge_prices = {}
+        for (market_pair, is_buy), maker_amount in maker_amounts.items():
+            _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
+            taker_amount = maker_amount / base_rate
+            taker_price = market_pair.taker.market.get_price_for_volume(
+                market_pair.taker.trading_pair,
+                is_buy,
+                taker_amount
+            ).result_price
+            taker_hedge_prices[(market_pair, is_buy)] = (timestamp, taker_amount, taker_price)
+        self._taker_hedge_prices = taker_hedge_prices
+
+    def get_taker_hedge_price(self, market_pair: MakerTakerMarketPair, is_buy: bool, taker_amount: Decimal) -> Decimal:
+        """
+        Returns the taker price computed in this tick when it covers the amount (the average price of a larger amount
+        is a worse price), else the price for the amount from the taker order book.
+        """
+        timestamp, computed_amount, taker_price = self._taker_hedge_prices.get((market_pair, is_buy),
+                                                                               (None, s_decimal_zero, s_decimal_nan))
+        if timestamp != self.current_timestamp or taker_amount > computed_amount:
+            taker_price = market_pair.taker.market.get_price_for_volume(
+                market_pair.taker.trading_pair,
+                is_buy,
+                taker_amount
+            ).result_price
+        return taker_price
+
+    def fast_hedge_filled_maker_order(self, order_filled_event: OrderFilledEvent) -> bool:
+        """
+        Hedges a maker fill directly from the fill event, placing the taker order at the taker hedge price.
+
+        Hedges on gateway taker markets, hedges of market pairs with hedges waiting in hedge_market_pair() and hedges
+        without taker price are left to hedge_filled_maker_order().
+
+        :param order_filled_event: event object
+        :return: True if the fill was handled
+        """
+        market_pair = self._market_pair_tracker.get_market_pair_from_order_id(order_filled_event.order_id)
+        if (market_pair is None
+                or self.is_gateway_market(market_pair.taker)
+                or self._pending_hedges[market_pair] > 0):
+            return False
+
+        taker_market = market_pair.taker.market
+        taker_trading_pair = market_pair.taker.trading_pair
+        is_buy = order_filled_event.trade_type is TradeType.SELL
+        _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
+        hedge_amount = order_filled_event.amount / base_rate
+        taker_price = self.get_taker_hedge_price(market_pair, is_buy, hedge_amount)
+        if taker_price.is_nan() or taker_price <= s_decimal_zero:
+            return False
+
+        if self.record_maker_fill(order_filled_event) is None:
+            return False
+
+        if is_buy:
+            hedge_amount = min(
+                hedge_amount,
+                taker_market.get_available_balance(market_pair.taker.quote_asset) /
+                taker_price * self.order_size_taker_balance_factor
+            )
+            order_price = taker_price * (Decimal("1") + self.slippage_buffer)
+        else:
+            hedge_amount = min(
+                hedge_amount,
+                taker_market.get_available_balance(market_pair.taker.base_asset) *
+                self.order_size_taker_balance_factor
+            )
+            order_price = taker_price * (Decimal("1") - self.slippage_buffer)
+        quantized_hedge_amount = taker_market.quantize_order_amount(taker_trading_pair, Decimal(hedge_amount))
+        order_price = taker_market.quantize_order_price(taker_trading_pair, order_price)
+        maker_side = "sell" if is_buy else "buy"
+
+        if quantized_hedge_amount > s_decimal_zero:
+            self.place_order(
+                market_pair,
+                is_buy,
+                False,
+                quantized_hedge_amount,
+                order_price,
+                order_filled_event.order_id,
+                order_filled_event.exchange_trade_id
+            )
+
+            if LogOption.MAKER_ORDER_HEDGED in self.logging_options:
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_pair.maker.trading_pair}) Hedged maker {maker_side} order(s) of "
+                    f"{order_filled_event.amount} {market_pair.maker.base_asset} on taker market to lock in profits. "
+                    f"(maker price={order_filled_event.price}, taker price={taker_price})"
+                )
+        else:
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_pair.maker.trading_pair}) Current maker {maker_side} fill amount of "
+                f"{order_filled_event.amount} {market_pair.maker.base_asset} is less than the minimum order amount "
+                f"allowed on the taker market. No hedging possible yet."
+            )
+        return True
 
     def hedge_tasks_cleanup(self):
         hedge_maker_order_tasks = []
@@ -635,7 +911,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         # Resubmit hedging order
         self.hedge_tasks_cleanup()
         self._hedge_maker_order_tasks += [safe_ensure_future(
-            self.check_and_hedge_orders(market_pair)
+            self.hedge_market_pair(market_pair)
         )]
 
         # Remove the cancelled, failed or expired taker order
@@ -655,21 +931,30 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 self._ongoing_hedging[order_filled_event.exchange_trade_id] = order_filled_event.exchange_trade_id
 
                 self._maker_to_hedging_trades[order_id] += [exchange_trade_id]
+                self._maker_fill_times[exchange_trade_id] = time.perf_counter()
+
+                if self.fast_hedge_enabled and self.fast_hedge_filled_maker_order(order_filled_event):
+                    # Only the first hedge attempt of a maker fill is measured
+                    self._maker_fill_times.pop(exchange_trade_id, None)
+                    return
 
                 self.hedge_tasks_cleanup()
-                self._hedge_maker_order_task = safe_ensure_future(
+                self._hedge_maker_order_tasks += [safe_ensure_future(
                     self.hedge_filled_maker_order(order_filled_event)
-                )
+                )]
 
     def did_cancel_order(self, order_canceled_event: OrderCancelledEvent):
+        self._hedge_submit_times.pop(order_canceled_event.order_id, None)
         if order_canceled_event.order_id in self._taker_to_maker_order_ids.keys():
             self.handle_unfilled_taker_order(order_canceled_event)
 
     def did_fail_order(self, order_failed_event: MarketOrderFailureEvent):
+        self._hedge_submit_times.pop(order_failed_event.order_id, None)
         if order_failed_event.order_id in self._taker_to_maker_order_ids.keys():
             self.handle_unfilled_taker_order(order_failed_event)
 
     def did_expire_order(self, order_expired_event: OrderExpiredEvent):
+        self._hedge_submit_times.pop(order_expired_event.order_id, None)
         if order_expired_event.order_id in self._taker_to_maker_order_ids.keys():
             self.handle_unfilled_taker_order(order_expired_event)
 
@@ -1741,6 +2026,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             price = s_decimal_nan
         expiration_seconds = self._config_map.order_refresh_mode.get_expiration_seconds()
         order_id = None
+        if not is_maker:
+            self.start_hedge_submit(maker_exchange_trade_id)
         if is_buy:
             try:
                 order_id = self.buy_with_specific_market(market_info, amount,
@@ -1757,6 +2044,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             except ValueError as e:
                 self.logger().warning(f"Placing an order on market {str(market_info.market.name)} "
                                       f"failed with the following error: {str(e)}")
+        if not is_maker:
+            self.record_hedge_submit(order_id)
         if order_id is None:
             return
         self._sb_order_tracker.add_create_order_pending(order_id)
@@ -1769,6 +2058,33 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self._ongoing_hedging[maker_exchange_trade_id] = order_id
         return order_id
 
+    def start_hedge_submit(self, maker_exchange_trade_id: str):
+        # Only the first hedge of a maker fill is measured, the resubmissions start from a taker order event
+        fill_time = self._maker_fill_times.pop(maker_exchange_trade_id, None)
+        if fill_time is not None:
+            submit_time = time.perf_counter()
+            self._hedge_latencies["fill_to_submit"].add((submit_time - fill_time) * 1e3)
+            self._placing_hedge_times = (fill_time, submit_time)
+
+    def record_hedge_submit(self, taker_order_id: Optional[str]):
+        """
+        Called once the hedge placement returns, with the taker order id (None if the placement failed).
+        """
+        placing_hedge_times, self._placing_hedge_times = self._placing_hedge_times, None
+        if placing_hedge_times is not None and taker_order_id is not None:
+            self._hedge_submit_times[taker_order_id] = placing_hedge_times
+
+    def record_hedge_ack(self, taker_order_id: str):
+        submit_times = self._hedge_submit_times.pop(taker_order_id, None)
+        if submit_times is None and self._placing_hedge_times is not None:
+            # The taker order is acknowledged before its placement returns
+            submit_times, self._placing_hedge_times = self._placing_hedge_times, None
+        if submit_times is not None:
+            fill_time, submit_time = submit_times
+            ack_time = time.perf_counter()
+            self._hedge_latencies["submit_to_ack"].add((ack_time - submit_time) * 1e3)
+            self._hedge_latencies["fill_to_ack"].add((ack_time - fill_time) * 1e3)
+
     def cancel_maker_order(self, market_pair: MakerTakerMarketPair, order_id: str):
         market_trading_pair_tuple = self._market_pair_tracker.get_market_pair_from_order_id(order_id)
         super().cancel_order(market_trading_pair_tuple.maker, order_id)
@@ -1792,10 +2108,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def did_create_buy_order(self, order_created_event):
         order_id = order_created_event.order_id
         self._sb_order_tracker.remove_create_order_pending(order_id)
+        self.record_hedge_ack(order_id)
 
     def did_create_sell_order(self, order_created_event):
         order_id = order_created_event.order_id
         self._sb_order_tracker.remove_create_order_pending(order_id)
+        self.record_hedge_ack(order_id)
 
     def notify_hb_app(self, msg: str):
         if self._hb_app_notification:
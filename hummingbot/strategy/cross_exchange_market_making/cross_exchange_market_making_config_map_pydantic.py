@@ -359,6 +359,26 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
             prompt_on_new=True,
         ),
     )
+    concurrent_market_pairs: bool = Field(
+        default=False,
+        description="Process the market pairs concurrently instead of one after another.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "Do you want to process the market pairs concurrently? (Yes/No) Recommended when trading many pairs, "
+                "so the quotes of the last pairs are not refreshed late"
+            ),
+        ),
+    )
+    fast_hedge_enabled: bool = Field(
+        default=False,
+        description="Place the hedge of a maker fill from the fill event, using the taker prices computed every tick.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "Do you want to place the taker orders directly from the maker fill events? (Yes/No) "
+                "(this only affects centralized taker exchanges)"
+            ),
+        ),
+    )
     taker_market: ClientConfigEnum(
         value="TakerMarkets",  # noqa: F821
         names={e: e for e in
@@ -418,6 +438,8 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
 
     @validator(
         "adjust_order_enabled",
+        "concurrent_market_pairs",
+        "fast_hedge_enabled",
         pre=True,
     )
     def validate_bool(cls, v: str):
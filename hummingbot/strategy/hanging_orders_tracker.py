@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -41,6 +41,60 @@ class CreatedPairOfOrders:
                 return self.sell_order
 
 
+class HangingOrdersSet(set):
+    """
+    Set of hanging orders indexed by order id. Hanging orders are equal when they have the same trading pair, side,
+    price and amount, so the index keeps the order id of the order actually stored in the set.
+    """
+
+    def __init__(self, orders: Iterable[HangingOrder] = ()):
+        super().__init__()
+        self._orders_by_id: Dict[str, HangingOrder] = {}
+        self._orders_by_key: Dict[HangingOrder, HangingOrder] = {}
+        self.update(orders)
+
+    def add(self, order: HangingOrder):
+        if order not in self._orders_by_key:
+            super().add(order)
+            self._orders_by_key[order] = order
+            if order.order_id is not None:
+                self._orders_by_id[order.order_id] = order
+
+    def update(self, *orders_groups: Iterable[HangingOrder]):
+        for orders in orders_groups:
+            for order in orders:
+                self.add(order)
+
+    def remove(self, order: HangingOrder):
+        super().remove(order)
+        self._unindex(order)
+
+    def discard(self, order: HangingOrder):
+        if order in self._orders_by_key:
+            self.remove(order)
+
+    def pop(self) -> HangingOrder:
+        order = super().pop()
+        self._unindex(order)
+        return order
+
+    def clear(self):
+        super().clear()
+        self._orders_by_id.clear()
+        self._orders_by_key.clear()
+
+    def get_by_order_id(self, order_id: str) -> Optional[HangingOrder]:
+        return self._orders_by_id.get(order_id)
+
+    def contains_order_id(self, order_id: str) -> bool:
+        return order_id in self._orders_by_id
+
+    def _unindex(self, order: HangingOrder):
+        stored_order = self._orders_by_key.pop(order, None)
+        if stored_order is not None and stored_order.order_id is not None:
+            self._orders_by_id.pop(stored_order.order_id, None)
+
+
 class HangingOrdersTracker:
 
     @classmethod
@@ -62,8 +116,10 @@ class HangingOrdersTracker:
         self.orders_being_cancelled: Set[str] = set()
         self.current_created_pairs_of_orders: List[CreatedPairOfOrders] = list()
         self.original_orders: Set[LimitOrder] = orders or set()
-        self.strategy_current_hanging_orders: Set[HangingOrder] = set()
-        self.completed_hanging_orders: Set[HangingOrder] = set()
+        self._original_orders_by_id: Dict[str, LimitOrder] = {
+            order.client_order_id: order for order in self.original_orders}
+        self._strategy_current_hanging_orders: HangingOrdersSet = HangingOrdersSet()
+        self._completed_hanging_orders: HangingOrdersSet = HangingOrdersSet()
 
         self._cancel_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
         self._complete_buy_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
@@ -75,6 +131,22 @@ class HangingOrdersTracker:
             (MarketEvent.BuyOrderCompleted, self._complete_buy_order_forwarder),
             (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder)]
 
+    @property
+    def strategy_current_hanging_orders(self) -> HangingOrdersSet:
+        return self._strategy_current_hanging_orders
+
+    @strategy_current_hanging_orders.setter
+    def strategy_current_hanging_orders(self, orders: Set[HangingOrder]):
+        self._strategy_current_hanging_orders = HangingOrdersSet(orders)
+
+    @property
+    def completed_hanging_orders(self) -> HangingOrdersSet:
+        return self._completed_hanging_orders
+
+    @completed_hanging_orders.setter
+    def completed_hanging_orders(self, orders: Set[HangingOrder]):
+        self._completed_hanging_orders = HangingOrdersSet(orders)
+
     @property
     def hanging_orders_cancel_pct(self):
         return self._hanging_orders_cancel_pct
@@ -103,14 +175,12 @@ class HangingOrdersTracker:
         self._process_cancel_as_part_of_renew(event)
 
         self.orders_being_cancelled.discard(event.order_id)
-        order_to_be_removed = next((order for order in self.strategy_current_hanging_orders
-                                    if order.order_id == event.order_id), None)
+        order_to_be_removed = self.strategy_current_hanging_orders.get_by_order_id(event.order_id)
         if order_to_be_removed:
             self.strategy_current_hanging_orders.remove(order_to_be_removed)
             self.logger().notify(f"({self.trading_pair}) Hanging order {event.order_id} canceled.")
 
-        limit_order_to_be_removed = next((order for order in self.original_orders
-                                          if order.client_order_id == event.order_id), None)
+        limit_order_to_be_removed = self._original_orders_by_id.get(event.order_id)
         if limit_order_to_be_removed:
             self.remove_order(limit_order_to_be_removed)
 
@@ -129,8 +199,7 @@ class HangingOrdersTracker:
     def _did_complete_order(self,
                             event: Union[BuyOrderCompletedEvent, SellOrderCompletedEvent],
                             is_buy: bool):
-        hanging_order = next((hanging_order for hanging_order in self.strategy_current_hanging_orders
-                              if hanging_order.order_id == event.order_id), None)
+        hanging_order = self.strategy_current_hanging_orders.get_by_order_id(event.order_id)
 
         if hanging_order:
             self._did_complete_hanging_order(hanging_order)
@@ -152,8 +221,7 @@ class HangingOrdersTracker:
                 f"{order.price}) has been completely filled."
             )
 
-            limit_order_to_be_removed = next((original_order for original_order in self.original_orders
-                                              if original_order.client_order_id == order.order_id), None)
+            limit_order_to_be_removed = self._original_orders_by_id.get(order.order_id)
             if limit_order_to_be_removed:
                 self.remove_order(limit_order_to_be_removed)
 
@@ -185,15 +253,16 @@ class HangingOrdersTracker:
                                                self.strategy.current_timestamp)
 
             executed_orders = self._execute_orders_in_strategy([order_to_be_created])
-            self.strategy_current_hanging_orders = self.strategy_current_hanging_orders.union(executed_orders)
+            self.strategy_current_hanging_orders.update(executed_orders)
+            active_orders_by_id = {o.client_order_id: o for o in self.strategy.active_orders}
             for new_hanging_order in executed_orders:
-                limit_order_from_hanging_order = next((o for o in self.strategy.active_orders
-                                                       if o.client_order_id == new_hanging_order.order_id), None)
+                limit_order_from_hanging_order = active_orders_by_id.get(new_hanging_order.order_id)
                 if limit_order_from_hanging_order:
                     self.add_order(limit_order_from_hanging_order)
 
     def add_order(self, order: LimitOrder):
         self.original_orders.add(order)
+        self._original_orders_by_id[order.client_order_id] = order
 
     def add_as_hanging_order(self, order: LimitOrder):
         self.strategy_current_hanging_orders.add(self._get_hanging_order_from_limit_order(order))
@@ -202,9 +271,12 @@ class HangingOrdersTracker:
     def remove_order(self, order: LimitOrder):
         if order in self.original_orders:
             self.original_orders.remove(order)
+            if self._original_orders_by_id.get(order.client_order_id) is order:
+                del self._original_orders_by_id[order.client_order_id]
 
     def remove_all_orders(self):
         self.original_orders.clear()
+        self._original_orders_by_id.clear()
 
     def remove_all_buys(self):
         to_be_removed = []
@@ -212,7 +284,7 @@ class HangingOrdersTracker:
             if order.is_buy:
                 to_be_removed.append(order)
         for order in to_be_removed:
-            self.original_orders.remove(order)
+            self.remove_order(order)
 
     def remove_all_sells(self):
         to_be_removed = []
@@ -220,7 +292,7 @@ class HangingOrdersTracker:
             if not order.is_buy:
                 to_be_removed.append(order)
         for order in to_be_removed:
-            self.original_orders.remove(order)
+            self.remove_order(order)
 
     def hanging_order_age(self, hanging_order: HangingOrder) -> float:
         """
@@ -240,7 +312,7 @@ class HangingOrdersTracker:
                     to_be_cancelled.add(order)
 
             self._cancel_multiple_orders_in_strategy([o.order_id for o in to_be_cancelled if o.order_id])
-            self.orders_being_renewed = self.orders_being_renewed.union(to_be_cancelled)
+            self.orders_being_renewed.update(to_be_cancelled)
 
     def remove_orders_far_from_price(self):
         current_price = self.strategy.get_price()
@@ -265,16 +337,14 @@ class HangingOrdersTracker:
         return self._get_equivalent_orders()
 
     def is_order_id_in_hanging_orders(self, order_id: str) -> bool:
-        return any((o.order_id == order_id for o in self.strategy_current_hanging_orders))
+        return self.strategy_current_hanging_orders.contains_order_id(order_id)
 
     def is_order_id_in_completed_hanging_orders(self, order_id: str) -> bool:
-        return any((o.order_id == order_id for o in self.completed_hanging_orders))
+        return self.completed_hanging_orders.contains_order_id(order_id)
 
     def is_hanging_order_in_strategy_active_orders(self, order: HangingOrder) -> bool:
-        return any(all(order.trading_pair == o.trading_pair,
-                       order.is_buy == o.is_buy,
-                       order.price == o.price,
-                       order.amount == o.quantity) for o in self.strategy.active_orders)
+        active_orders_keys = {(o.trading_pair, o.is_buy, o.price, o.quantity) for o in self.strategy.active_orders}
+        return (order.trading_pair, order.is_buy, order.price, order.amount) in active_orders_keys
 
     def is_potential_hanging_order(self, order: LimitOrder) -> bool:
         """Checks if the order is registered as a hanging order."""
@@ -304,7 +374,7 @@ class HangingOrdersTracker:
             self.logger().info(f"Need to cancel: {orders_to_cancel}")
 
         executed_orders = self._execute_orders_in_strategy(orders_to_create)
-        self.strategy_current_hanging_orders = self.strategy_current_hanging_orders.union(executed_orders)
+        self.strategy_current_hanging_orders.update(executed_orders)
 
     def _execute_orders_in_strategy(self, candidate_orders: Set[HangingOrder]):
         new_hanging_orders = set()
@@ -343,8 +413,11 @@ class HangingOrdersTracker:
         return new_hanging_orders
 
     def _cancel_multiple_orders_in_strategy(self, order_ids: List[str]):
+        if not order_ids:
+            return
+        active_order_ids = {o.client_order_id for o in self.strategy.active_orders}
         for order_id in order_ids:
-            if any(o.client_order_id == order_id for o in self.strategy.active_orders):
+            if order_id in active_order_ids:
                 self.strategy.cancel_order(order_id)
                 self.orders_being_cancelled.add(order_id)
 
@@ -22,6 +22,10 @@ class MarketTradingPairTuple(NamedTuple):
     def order_book(self) -> OrderBook:
         return self.market.get_order_book(self.trading_pair)
 
+    @property
+    def top_of_book_version(self) -> int:
+        return self.order_book.top_of_book_version
+
     @property
     def quote_balance(self) -> Decimal:
         return self.market.get_balance(self.quote_asset)
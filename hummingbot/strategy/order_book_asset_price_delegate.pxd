@@ -5,3 +5,5 @@ cdef class OrderBookAssetPriceDelegate(AssetPriceDelegate):
     cdef:
         ExchangeBase _market
         str _trading_pair
+        object _mid_price
+        object _mid_price_version
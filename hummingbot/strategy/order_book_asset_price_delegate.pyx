@@ -8,10 +8,17 @@ cdef class OrderBookAssetPriceDelegate(AssetPriceDelegate):
         super().__init__()
         self._market = market
         self._trading_pair = trading_pair
+        self._mid_price = None
+        self._mid_price_version = None
 
     cdef object c_get_mid_price(self):
-        return (self._market.c_get_price(self._trading_pair, True) +
-                self._market.c_get_price(self._trading_pair, False))/Decimal('2')
+        # The mid price is only recalculated when the top of the book changed since the last call
+        version = self.top_of_book_version
+        if self._mid_price is None or version != self._mid_price_version:
+            self._mid_price = (self._market.c_get_price(self._trading_pair, True) +
+                               self._market.c_get_price(self._trading_pair, False))/Decimal('2')
+            self._mid_price_version = version
+        return self._mid_price
 
     @property
     def ready(self) -> bool:
@@ -20,6 +27,10 @@ cdef class OrderBookAssetPriceDelegate(AssetPriceDelegate):
     def get_price_by_type(self, price_type: PriceType) -> Decimal:
         return self._market.get_price_by_type(self._trading_pair, price_type)
 
+    @property
+    def top_of_book_version(self) -> int:
+        return self._market.c_get_order_book(self._trading_pair).top_of_book_version
+
     @property
     def market(self) -> ExchangeBase:
         return self._market
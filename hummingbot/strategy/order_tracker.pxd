@@ -14,6 +14,12 @@ cdef class OrderTracker(TimeIterator):
         object _shadow_gc_requests
         object _in_flight_cancels
         object _in_flight_pending_created
+        bint _exclude_in_flight_cancels
+        dict _active_limit_orders
+        dict _active_bids
+        dict _active_asks
+        dict _active_views
+        object _cancel_expiry_requests
 
     cdef dict c_get_limit_orders(self)
     cdef dict c_get_market_orders(self)
@@ -33,3 +39,6 @@ cdef class OrderTracker(TimeIterator):
     cdef c_check_and_cleanup_shadow_records(self)
     cdef c_add_create_order_pending(self, str order_id)
     cdef c_remove_create_order_pending(self, str order_id)
+    cdef c_add_active_limit_order(self, object market_pair, LimitOrder limit_order)
+    cdef c_remove_active_limit_order(self, object market_pair, str order_id)
+    cdef c_reactivate_expired_cancels(self)
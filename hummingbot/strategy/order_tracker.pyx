@@ -26,6 +26,9 @@ cdef class OrderTracker(TimeIterator):
 
     CANCEL_EXPIRY_DURATION = 60.0
 
+    # Orders with an in flight cancel are not part of the active orders views
+    EXCLUDE_IN_FLIGHT_CANCELS = True
+
     def __init__(self):
         super().__init__()
         self._tracked_limit_orders = {}
@@ -36,15 +39,26 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_gc_requests = deque()
         self._in_flight_pending_created = set()
         self._in_flight_cancels = OrderedDict()
+        self._exclude_in_flight_cancels = self.EXCLUDE_IN_FLIGHT_CANCELS
+        # The active orders are kept per market pair (and per side) as orders are tracked and cancelled, and the
+        # lists returned by the active orders properties are cached until the active orders change
+        self._active_limit_orders = {}
+        self._active_bids = {}
+        self._active_asks = {}
+        self._active_views = {}
+        self._cancel_expiry_requests = deque()
 
     @property
     def active_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        limit_orders = []
-        for market_pair, orders_map in self._tracked_limit_orders.items():
-            for limit_order in orders_map.values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append((market_pair.market, limit_order))
+        """
+        The returned list is shared between calls until the active orders change, it should not be modified
+        """
+        limit_orders = self._active_views.get("active_limit_orders")
+        if limit_orders is None:
+            limit_orders = [(market_pair.market, limit_order)
+                            for market_pair, orders_map in self._active_limit_orders.items()
+                            for limit_order in orders_map.values()]
+            self._active_views["active_limit_orders"] = limit_orders
         return limit_orders
 
     @property
@@ -59,24 +73,45 @@ cdef class OrderTracker(TimeIterator):
 
     @property
     def market_pair_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
-        market_pair_to_orders = {}
-        market_pairs = self._tracked_limit_orders.keys()
-        for market_pair in market_pairs:
-            limit_orders = []
-            for limit_order in self._tracked_limit_orders[market_pair].values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append(limit_order)
-            market_pair_to_orders[market_pair] = limit_orders
-        return market_pair_to_orders
+        """
+        The returned dictionary is shared between calls until the active orders change, it should not be modified
+        """
+        return self._market_pair_to_active_orders_view("market_pair_to_active_orders", self._active_limit_orders)
+
+    @property
+    def market_pair_to_active_bids(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
+        return self._market_pair_to_active_orders_view("market_pair_to_active_bids", self._active_bids)
+
+    @property
+    def market_pair_to_active_asks(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
+        return self._market_pair_to_active_orders_view("market_pair_to_active_asks", self._active_asks)
 
     @property
     def active_bids(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if limit_order.is_buy]
+        return self._active_limit_orders_view("active_bids", self._active_bids)
 
     @property
     def active_asks(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if not limit_order.is_buy]
+        return self._active_limit_orders_view("active_asks", self._active_asks)
+
+    def _active_limit_orders_view(self, view_name: str, active_orders: Dict) -> List[Tuple[ConnectorBase, LimitOrder]]:
+        limit_orders = self._active_views.get(view_name)
+        if limit_orders is None:
+            limit_orders = [(market_pair.market, limit_order)
+                            for market_pair, orders_map in active_orders.items()
+                            for limit_order in orders_map.values()]
+            self._active_views[view_name] = limit_orders
+        return limit_orders
+
+    def _market_pair_to_active_orders_view(self,
+                                           view_name: str,
+                                           active_orders: Dict) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
+        market_pair_to_orders = self._active_views.get(view_name)
+        if market_pair_to_orders is None:
+            market_pair_to_orders = {market_pair: list(orders_map.values())
+                                     for market_pair, orders_map in active_orders.items()}
+            self._active_views[view_name] = market_pair_to_orders
+        return market_pair_to_orders
 
     @property
     def tracked_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
@@ -125,6 +160,7 @@ cdef class OrderTracker(TimeIterator):
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
+        self.c_reactivate_expired_cancels()
         self.c_check_and_cleanup_shadow_records()
 
     cdef dict c_get_limit_orders(self):
@@ -174,6 +210,11 @@ cdef class OrderTracker(TimeIterator):
 
         # Track the cancel.
         self._in_flight_cancels[order_id] = self._current_timestamp
+        if self._exclude_in_flight_cancels and self.c_has_in_flight_cancel(order_id):
+            market_pair = self._order_id_to_market_pair.get(order_id)
+            if market_pair is not None:
+                self.c_remove_active_limit_order(market_pair, order_id)
+            self._cancel_expiry_requests.append((self._current_timestamp + self.CANCEL_EXPIRY_DURATION, order_id))
         return True
 
     def check_and_track_cancel(self, order_id: str) -> bool:
@@ -232,6 +273,8 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_tracked_limit_orders[market_pair][order_id] = limit_order
         self._order_id_to_market_pair[order_id] = market_pair
         self._shadow_order_id_to_market_pair[order_id] = market_pair
+        if not (self._exclude_in_flight_cancels and self.c_has_in_flight_cancel(order_id)):
+            self.c_add_active_limit_order(market_pair, limit_order)
 
     def start_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, price: Decimal,
                                    quantity: Decimal):
@@ -242,6 +285,7 @@ cdef class OrderTracker(TimeIterator):
             del self._tracked_limit_orders[market_pair][order_id]
             if len(self._tracked_limit_orders[market_pair]) < 1:
                 del self._tracked_limit_orders[market_pair]
+            self.c_remove_active_limit_order(market_pair, order_id)
             self._shadow_gc_requests.append((
                 self._current_timestamp + self.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION,
                 market_pair,
@@ -312,3 +356,42 @@ cdef class OrderTracker(TimeIterator):
 
     def remove_create_order_pending(self, order_id: str):
         self.c_remove_create_order_pending(order_id)
+
+    cdef c_add_active_limit_order(self, object market_pair, LimitOrder limit_order):
+        cdef:
+            dict side_orders = self._active_bids if limit_order.is_buy else self._active_asks
+
+        if market_pair not in self._active_limit_orders:
+            self._active_limit_orders[market_pair] = {}
+        if market_pair not in side_orders:
+            side_orders[market_pair] = {}
+        self._active_limit_orders[market_pair][limit_order.client_order_id] = limit_order
+        side_orders[market_pair][limit_order.client_order_id] = limit_order
+        self._active_views.clear()
+
+    cdef c_remove_active_limit_order(self, object market_pair, str order_id):
+        cdef:
+            dict orders_map
+
+        for active_orders in (self._active_limit_orders, self._active_bids, self._active_asks):
+            orders_map = active_orders.get(market_pair)
+            if orders_map is not None and order_id in orders_map:
+                del orders_map[order_id]
+                if len(orders_map) < 1:
+                    del active_orders[market_pair]
+                self._active_views.clear()
+
+    cdef c_reactivate_expired_cancels(self):
+        """
+        Orders whose cancel expired without the order being stopped are active again
+        """
+        cdef:
+            double current_timestamp = self._current_timestamp
+            LimitOrder limit_order
+
+        while len(self._cancel_expiry_requests) > 0 and self._cancel_expiry_requests[0][0] <= current_timestamp:
+            _, order_id = self._cancel_expiry_requests.popleft()
+            market_pair = self._order_id_to_market_pair.get(order_id)
+            limit_order = self.c_get_limit_order(market_pair, order_id) if market_pair is not None else None
+            if limit_order is not None and not self.c_has_in_flight_cancel(order_id):
+                self.c_add_active_limit_order(market_pair, limit_order)
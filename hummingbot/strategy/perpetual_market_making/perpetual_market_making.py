@@ -299,11 +299,11 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
 
     @property
     def active_buys(self) -> List[LimitOrder]:
-        return [o for o in self.active_orders if o.is_buy]
+        return self._sb_order_tracker.market_pair_to_active_bids.get(self._market_info, [])
 
     @property
     def active_sells(self) -> List[LimitOrder]:
-        return [o for o in self.active_orders if not o.is_buy]
+        return self._sb_order_tracker.market_pair_to_active_asks.get(self._market_info, [])
 
     @property
     def logging_options(self) -> int:
@@ -337,7 +337,7 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
         price = self.get_price()
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
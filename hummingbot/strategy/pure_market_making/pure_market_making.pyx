@@ -144,6 +144,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._reference_price = None
+        self._reference_price_key = None
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -412,6 +414,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     def get_price(self) -> Decimal:
         price_provider = self._asset_price_delegate or self._market_info
+        reference_price_key = None
+        if self._price_type in (PriceType.MidPrice, PriceType.BestBid, PriceType.BestAsk, PriceType.InventoryCost):
+            # These prices only depend on the top of the book, so they are reused until it changes
+            top_of_book_version = price_provider.top_of_book_version
+            if top_of_book_version is not None:
+                reference_price_key = (id(price_provider), self._price_type, top_of_book_version)
+                if reference_price_key == self._reference_price_key:
+                    return self._reference_price
+
         if self._price_type is PriceType.LastOwnTrade:
             price = self._last_own_trade_price
         elif self._price_type is PriceType.InventoryCost:
@@ -422,6 +433,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if price.is_nan():
             price = price_provider.get_price_by_type(PriceType.MidPrice)
 
+        self._reference_price = price
+        self._reference_price_key = reference_price_key
         return price
 
     def get_mid_price(self) -> Decimal:
@@ -453,11 +466,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     @property
     def active_buys(self) -> List[LimitOrder]:
-        return [o for o in self.active_orders if o.is_buy]
+        return self._sb_order_tracker.market_pair_to_active_bids.get(self._market_info, [])
 
     @property
     def active_sells(self) -> List[LimitOrder]:
-        return [o for o in self.active_orders if not o.is_buy]
+        return self._sb_order_tracker.market_pair_to_active_asks.get(self._market_info, [])
 
     @property
     def active_non_hanging_orders(self) -> List[LimitOrder]:
@@ -577,7 +590,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id and
                         not self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id)])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
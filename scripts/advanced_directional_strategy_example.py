@@ -121,7 +121,7 @@ class AdvancedDirectionalStrategyExample(ScriptStrategyBase):
     def get_signal(self):
         values = {}
         for candle_name, candle in self.candles.items():
-            candle_df = candle.candles_df
+            candle_df = candle.candles_df.copy()
             # Let's add some technical indicators
             candle_df.ta.bbands(length=21, append=True)
             candle_df.ta.rsi(length=21, append=True)
@@ -181,7 +181,7 @@ class AdvancedDirectionalStrategyExample(ScriptStrategyBase):
             values = {}
             columns_to_show = ["timestamp", "open", "low", "high", "close", "volume", "BBP_21_2.0", "RSI_21_SMA_10"]
             for candle_name, candles in self.candles.items():
-                candles_df = candles.candles_df
+                candles_df = candles.candles_df.copy()
                 # Let's add some technical indicators
                 candles_df.ta.bbands(length=21, append=True)
                 candles_df.ta.rsi(length=21, append=True)
@@ -76,7 +76,7 @@ class CandlesExample(ScriptStrategyBase):
         if self.all_candles_ready:
             lines.extend(["\n############################################ Market Data ############################################\n"])
             for candles in [self.eth_1w_candles, self.eth_1m_candles, self.eth_1h_candles]:
-                candles_df = candles.candles_df
+                candles_df = candles.candles_df.copy()
                 # Let's add some technical indicators
                 candles_df.ta.rsi(length=14, append=True)
                 candles_df.ta.bbands(length=20, std=2, append=True)
@@ -89,7 +89,7 @@ class SimpleDirectionalStrategyExample(ScriptStrategyBase):
         self.clean_and_store_executors()
 
     def get_signal(self):
-        candle_df = self.eth_1m_candles.candles_df
+        candle_df = self.eth_1m_candles.candles_df.copy()
         # Let's add some technical indicators
         candle_df.ta.rsi(length=21, append=True)
         rsi_value = candle_df.iat[-1, -1]
@@ -134,7 +134,7 @@ class SimpleDirectionalStrategyExample(ScriptStrategyBase):
                 "\n############################################ Market Data ############################################\n"])
             lines.extend([f"Value: {self.get_signal()}"])
             columns_to_show = ["timestamp", "open", "low", "high", "close", "volume", "RSI_21"]
-            candles_df = self.eth_1m_candles.candles_df
+            candles_df = self.eth_1m_candles.candles_df.copy()
             # Let's add some technical indicators
             candles_df.ta.rsi(length=21, append=True)
             candles_df["timestamp"] = pd.to_datetime(candles_df["timestamp"], unit="ms")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+"""
+Compares the admission cost of AsyncThrottler and WindowedAsyncThrottler while the task logs grow, and the latency
+a blocked request waits past the time its capacity frees with the polling and the scheduled throttlers.
+Run with: python test/debug/debug_async_throttler_benchmark.py
+"""
+
+import asyncio
+import time
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.windowed_async_throttler import ScheduledAsyncThrottler, WindowedAsyncThrottler
+
+POOL_ID = "POOL"
+ENDPOINT_IDS = [f"/endpoint_{i}" for i in range(10)]
+
+
+def rate_limits(pool_limit: int) -> List[RateLimit]:
+    limits = [RateLimit(limit_id=POOL_ID, limit=pool_limit, time_interval=60)]
+    limits.extend(RateLimit(limit_id=endpoint_id, limit=pool_limit, time_interval=60,
+                            linked_limits=[LinkedLimitWeightPair(POOL_ID, 1)])
+                  for endpoint_id in ENDPOINT_IDS)
+    return limits
+
+
+async def run_requests(throttler: AsyncThrottlerBase, no_requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(no_requests):
+        async with throttler.execute_task(limit_id=ENDPOINT_IDS[i % len(ENDPOINT_IDS)]):
+            pass
+    return time.perf_counter() - start
+
+
+async def blocked_request_delay(throttler: AsyncThrottlerBase, no_requests: int) -> float:
+    # POOL allows a request every 0.25s, so the ideal total time is (no_requests - 1) * 0.25s
+    start = time.perf_counter()
+    for _ in range(no_requests):
+        async with throttler.execute_task(limit_id=POOL_ID):
+            pass
+    return (time.perf_counter() - start - (no_requests - 1) * 0.25) / (no_requests - 1)
+
+
+def main():
+    ev_loop = asyncio.get_event_loop()
+    print(f"{'requests':>10} {'AsyncThrottler (s)':>20} {'WindowedAsyncThrottler (s)':>28} {'speedup':>8}")
+    for no_requests in (100, 500, 1000, 2000):
+        limits = rate_limits(pool_limit=no_requests * 2)
+        baseline = ev_loop.run_until_complete(run_requests(AsyncThrottler(rate_limits=limits), no_requests))
+        windowed = ev_loop.run_until_complete(run_requests(WindowedAsyncThrottler(rate_limits=limits), no_requests))
+        print(f"{no_requests:>10} {baseline:>20.4f} {windowed:>28.4f} {baseline / windowed:>7.1f}x")
+
+    limits = [RateLimit(limit_id=POOL_ID, limit=1, time_interval=0.25)]
+    print(f"\n{'throttler':>26} {'avg wake-up delay (ms)':>24}")
+    for throttler_class in (AsyncThrottler, WindowedAsyncThrottler, ScheduledAsyncThrottler):
+        throttler = throttler_class(rate_limits=limits, safety_margin_pct=0)
+        delay = ev_loop.run_until_complete(blocked_request_delay(throttler, 9))
+        print(f"{throttler_class.__name__:>26} {delay * 1000:>24.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+"""
+Compares the per-tick cost of updating the candle indicators incrementally with CandlesIndicators against
+recomputing them over the whole candles dataframe with pandas_ta, as the scripts do on every tick.
+Run with: python test/debug/debug_candles_indicators_benchmark.py
+"""
+
+import time
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_indicators import (
+    ATR,
+    EMA,
+    MACD,
+    RSI,
+    BollingerBands,
+    CandlesIndicators,
+)
+
+START_TIMESTAMP = 1672981200000.0
+INTERVAL_MS = 60000
+TICKS = 500
+
+
+def candle(timestamp: float, close: float):
+    return [timestamp, close, close + 0.5, close - 0.5, close, 10, 1000, 5, 5, 500]
+
+
+def filled_candles(max_records: int) -> BinanceSpotCandles:
+    candles = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=max_records)
+    closes = 100 + np.cumsum(np.random.normal(0, 1, max_records))
+    for i, close in enumerate(closes):
+        candles._candles.append(candle(START_TIMESTAMP + i * INTERVAL_MS, close))
+    return candles
+
+
+def tick(candles: BinanceSpotCandles, i: int):
+    # Every fourth tick opens a new candle, the others update the open one
+    last_timestamp = candles._candles[-1][0]
+    close = candles._candles[-1][4] + np.random.normal(0, 0.3)
+    if i % 4 == 0:
+        candles._candles.append(candle(last_timestamp + INTERVAL_MS, close))
+    else:
+        candles._candles.update_last(candle(last_timestamp, close))
+
+
+def incremental_tick_time(max_records: int) -> float:
+    candles = filled_candles(max_records)
+    indicators = CandlesIndicators(candles, [EMA(10), RSI(14), ATR(14), BollingerBands(20, 2), MACD(12, 26, 9)])
+    indicators.update()
+    start = time.perf_counter()
+    for i in range(TICKS):
+        tick(candles, i)
+        indicators.current_values
+    return (time.perf_counter() - start) / TICKS
+
+
+def pandas_ta_tick_time(max_records: int) -> float:
+    import pandas_ta  # noqa: F401
+
+    candles = filled_candles(max_records)
+    start = time.perf_counter()
+    for i in range(TICKS):
+        tick(candles, i)
+        candles_df = candles.candles_df
+        candles_df.ta.ema(length=10, append=True)
+        candles_df.ta.rsi(length=14, append=True)
+        candles_df.ta.atr(length=14, append=True)
+        candles_df.ta.bbands(length=20, std=2, append=True)
+        candles_df.ta.macd(fast=12, slow=26, signal=9, append=True)
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    print(f"{'candles':>8} {'pandas_ta (ms/tick)':>20} {'incremental (ms/tick)':>22} {'speedup':>8}")
+    for max_records in (150, 500, 1000, 5000):
+        incremental = incremental_tick_time(max_records) * 1e3
+        try:
+            recompute = pandas_ta_tick_time(max_records) * 1e3
+        except ImportError:
+            print(f"{max_records:>8} {'n/a':>20} {incremental:>22.4f} {'n/a':>8}")
+            continue
+        print(f"{max_records:>8} {recompute:>20.4f} {incremental:>22.4f} {recompute / incremental:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+"""
+Measures the replay throughput of ReplayExchange driven by a backtest clock, in order book events per minute, and
+compares it with applying the same data as OrderBookMessage objects, as the live order book tracker does.
+Run with: python test/debug/debug_replay_exchange_benchmark.py
+"""
+
+import time
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map, fee_overrides_dict
+from hummingbot.connector.exchange.paper_trade.replay_exchange import ReplayExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_event_log import (
+    ASK_SIDE,
+    BID_SIDE,
+    ORDER_BOOK_EVENT_DTYPE,
+    order_book_events_to_messages,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+TRADING_PAIR = "BTC-USDT"
+START_TIMESTAMP = 1672981200.0
+DURATION = 3600
+SNAPSHOT_LEVELS = 50
+DIFF_LEVELS = 4
+TRADE_EVERY = 10
+
+
+def synthetic_events(diff_messages: int) -> np.ndarray:
+    """
+    A snapshot followed by diff messages changing levels around a random walk mid price, with a trade every
+    TRADE_EVERY diffs.
+    """
+    mid_prices = 20000 + np.cumsum(np.random.normal(0, 0.5, diff_messages))
+    message_timestamps = np.linspace(START_TIMESTAMP + 0.01, START_TIMESTAMP + DURATION, diff_messages)
+
+    snapshot = np.empty(2 * SNAPSHOT_LEVELS, dtype=ORDER_BOOK_EVENT_DTYPE)
+    snapshot["timestamp"] = START_TIMESTAMP
+    snapshot["update_id"] = 1
+    snapshot["type"] = OrderBookMessageType.SNAPSHOT.value
+    snapshot["side"][:SNAPSHOT_LEVELS] = BID_SIDE
+    snapshot["side"][SNAPSHOT_LEVELS:] = ASK_SIDE
+    snapshot["price"][:SNAPSHOT_LEVELS] = 19999.5 - np.arange(SNAPSHOT_LEVELS)
+    snapshot["price"][SNAPSHOT_LEVELS:] = 20000.5 + np.arange(SNAPSHOT_LEVELS)
+    snapshot["amount"] = 1
+
+    diffs = np.empty(diff_messages * DIFF_LEVELS, dtype=ORDER_BOOK_EVENT_DTYPE)
+    offsets = np.tile(np.array([-1.5, -0.5, 0.5, 1.5]), diff_messages)
+    diffs["timestamp"] = np.repeat(message_timestamps, DIFF_LEVELS)
+    diffs["update_id"] = np.repeat(np.arange(2, diff_messages + 2), DIFF_LEVELS)
+    diffs["type"] = OrderBookMessageType.DIFF.value
+    diffs["side"] = np.where(offsets < 0, BID_SIDE, ASK_SIDE)
+    diffs["price"] = np.round(np.repeat(mid_prices, DIFF_LEVELS)) + offsets
+    diffs["amount"] = np.random.uniform(0, 2, len(diffs))
+
+    trade_indexes = np.arange(0, diff_messages, TRADE_EVERY)
+    trades = np.empty(len(trade_indexes), dtype=ORDER_BOOK_EVENT_DTYPE)
+    trades["timestamp"] = message_timestamps[trade_indexes]
+    trades["update_id"] = np.arange(len(trades))
+    trades["type"] = OrderBookMessageType.TRADE.value
+    trades["side"] = np.where(trade_indexes % 2 == 0, TradeType.BUY.value, TradeType.SELL.value)
+    trades["price"] = np.round(mid_prices[trade_indexes])
+    trades["amount"] = 0.1
+
+    events = np.concatenate([snapshot, diffs, trades])
+    return events[np.argsort(events["timestamp"], kind="stable")]
+
+
+def replay_exchange_time(events: np.ndarray) -> float:
+    exchange = ReplayExchange(ClientConfigAdapter(ClientConfigMap()), {TRADING_PAIR: events}, "binance")
+    clock = Clock(ClockMode.BACKTEST, start_time=START_TIMESTAMP - 1, end_time=START_TIMESTAMP + DURATION)
+    clock.add_iterator(exchange)
+    start = time.perf_counter()
+    clock.backtest_til(START_TIMESTAMP + DURATION)
+    elapsed = time.perf_counter() - start
+    assert exchange.replayed_events == len(events)
+    return elapsed
+
+
+def order_book_messages_time(events: np.ndarray) -> float:
+    messages = list(order_book_events_to_messages(events, TRADING_PAIR))
+    order_book = CompositeOrderBook()
+    start = time.perf_counter()
+    for message in messages:
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            order_book.apply_snapshot_message(message)
+        elif message.type is OrderBookMessageType.DIFF:
+            order_book.apply_diffs_message(message)
+        else:
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=TRADING_PAIR,
+                timestamp=message.timestamp,
+                price=float(message.content["price"]),
+                amount=float(message.content["amount"]),
+                type=TradeType.SELL if message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+            ))
+    return time.perf_counter() - start
+
+
+def main():
+    fee_overrides_config_map.update(fee_overrides_dict())
+    print(f"{'events':>10} {'messages (M events/min)':>24} {'replay (M events/min)':>22} {'speedup':>8}")
+    for diff_messages in (100_000, 500_000, 1_000_000):
+        events = synthetic_events(diff_messages)
+        replay = len(events) / replay_exchange_time(events) * 60 / 1e6
+        messages = len(events) / order_book_messages_time(events) * 60 / 1e6
+        print(f"{len(events):>10} {messages:>24.2f} {replay:>22.2f} {replay / messages:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+"""
+Compares the cost of TimeSynchronizer.time() and of signing an authenticated Binance request when the offset is
+calculated from the samples with numpy on every call (previous implementation) and when it is cached.
+Run with: python test/debug/debug_time_synchronizer_benchmark.py
+"""
+
+import time
+
+import numpy
+
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+
+ITERATIONS = 100_000
+
+
+class NumpyTimeSynchronizer(TimeSynchronizer):
+    """
+    Calculates the offset with numpy on every call, as TimeSynchronizer did before caching it
+    """
+
+    @property
+    def time_offset_ms(self) -> float:
+        median = numpy.median(self._time_offset_ms)
+        weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+        return numpy.mean([median, weighted_average])
+
+
+def time_per_call(function) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        function()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    params = {"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "quantity": "0.001", "price": "20000"}
+    print(f"{'synchronizer':>24} {'time() (us)':>12} {'signed request (us)':>20}")
+    for synchronizer in (NumpyTimeSynchronizer(), TimeSynchronizer(), TimeSynchronizer(extrapolate_drift=True)):
+        for sample in range(5):
+            synchronizer.add_time_offset_ms_sample(250 + sample, sample_time=sample * 10)
+        auth = BinanceAuth(api_key="apiKey", secret_key="secretKey", time_provider=synchronizer)
+        name = type(synchronizer).__name__ + (" (drift)" if synchronizer.drift else "")
+        time_cost = time_per_call(synchronizer.time)
+        signing_cost = time_per_call(lambda: auth.add_auth_to_params(params))
+        print(f"{name:>24} {time_cost:>12.3f} {signing_cost:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
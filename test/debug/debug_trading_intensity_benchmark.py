@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+
+"""
+Compares the time per tick of TradingIntensityIndicator with the previous implementation (quotes kept in a list of
+dicts matched to trades with nested loops, intensities aggregated again and the curve fitted from scratch every tick).
+Uses the trades recorded by the order book event recorder when a data directory is given, synthetic trades otherwise.
+Run with: python test/debug/debug_trading_intensity_benchmark.py [--data-dir DIR --trading-pair PAIR]
+"""
+
+import argparse
+import time
+import warnings
+from decimal import Decimal
+from typing import List, Tuple
+
+import numpy as np
+from scipy.optimize import OptimizeWarning, curve_fit
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_event_recorder import OrderBookEventReader
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+Tick = Tuple[float, float, List[OrderBookTradeEvent]]
+
+
+class MidPriceDelegate:
+    def __init__(self):
+        self.mid_price = Decimal("0")
+
+    def get_price_by_type(self, _):
+        return self.mid_price
+
+
+class PreviousTradingIntensityIndicator:
+    """
+    The previous TradingIntensityIndicator algorithm.
+    """
+
+    def __init__(self, price_delegate: MidPriceDelegate, sampling_length: int):
+        self._alpha = 0
+        self._kappa = 0
+        self._trade_samples = {}
+        self._current_trade_sample = []
+        self._price_delegate = price_delegate
+        self._sampling_length = sampling_length
+        self._last_quotes = []
+
+    @property
+    def current_value(self) -> Tuple[float, float]:
+        return self._alpha, self._kappa
+
+    def register_trade(self, trade):
+        self._current_trade_sample.append(trade)
+
+    def calculate(self, timestamp):
+        price = self._price_delegate.get_price_by_type(None)
+        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+
+        latest_processed_quote_idx = None
+        for trade in self._current_trade_sample:
+            for i, quote in enumerate(self._last_quotes):
+                if quote["timestamp"] < trade.timestamp:
+                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
+                        latest_processed_quote_idx = i
+                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
+                        self._trade_samples[quote["timestamp"] + 1] = []
+                    self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    break
+
+        self._current_trade_sample = []
+        if latest_processed_quote_idx is not None:
+            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+
+        if len(self._trade_samples.keys()) > self._sampling_length:
+            timestamps = list(self._trade_samples.keys())
+            timestamps.sort()
+            timestamps = timestamps[-self._sampling_length:]
+            self._trade_samples = {timestamp: self._trade_samples[timestamp] for timestamp in timestamps}
+
+        if len(self._trade_samples.keys()) == self._sampling_length:
+            self.estimate_intensity()
+
+    def estimate_intensity(self):
+        trades_consolidated = {}
+        price_levels = []
+        for timestamp in self._trade_samples.keys():
+            for trade in self._trade_samples[timestamp]:
+                if trade['price_level'] not in trades_consolidated.keys():
+                    trades_consolidated[trade['price_level']] = 0
+                    price_levels += [trade['price_level']]
+                trades_consolidated[trade['price_level']] += trade['amount']
+        price_levels = sorted(price_levels, reverse=True)
+        lambdas = [trades_consolidated[price_level] for price_level in price_levels]
+        lambdas_adj = [10**-10 if x == 0 else x for x in lambdas]
+        try:
+            params = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                               price_levels,
+                               lambdas_adj,
+                               p0=(self._alpha, self._kappa),
+                               method='dogbox',
+                               bounds=([0, 0], [np.inf, np.inf]))
+            self._kappa = float(params[0][1])
+            self._alpha = float(params[0][0])
+        except (RuntimeError, ValueError):
+            pass
+
+
+def recorded_ticks(data_directory: str, trading_pair: str) -> List[Tick]:
+    """
+    One tick per second of recorded data, with the mid price of the order book and the trades of the second.
+    """
+    order_book = OrderBook()
+    ticks = []
+    tick_trades = []
+    tick_timestamp = None
+    synced = False
+    for message in OrderBookEventReader(data_directory).iter_messages(trading_pair):
+        timestamp = float(np.ceil(message.timestamp))
+        if tick_timestamp is not None and timestamp > tick_timestamp and synced:
+            ticks.append((tick_timestamp, (order_book.get_price(True) + order_book.get_price(False)) / 2, tick_trades))
+            tick_trades = []
+        tick_timestamp = timestamp
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            order_book.apply_snapshot_message(message)
+            synced = True
+        elif message.type is OrderBookMessageType.DIFF:
+            order_book.apply_diffs_message(message)
+        else:
+            tick_trades.append(OrderBookTradeEvent(
+                trading_pair=trading_pair,
+                timestamp=message.timestamp,
+                price=float(message.content["price"]),
+                amount=float(message.content["amount"]),
+                type=TradeType.SELL if message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+            ))
+    return ticks
+
+
+def synthetic_ticks(ticks_count: int, trades_per_tick: int) -> List[Tick]:
+    """
+    A random walk mid price, with trades at exponentially distributed distances from it (kappa = 2).
+    """
+    mid_prices = 100 + np.cumsum(np.random.normal(0, 0.05, ticks_count))
+    ticks = []
+    for i, mid_price in enumerate(mid_prices):
+        timestamp = 1672981200.0 + i
+        distances = np.round(np.random.exponential(0.5, trades_per_tick), 2)
+        sides = np.random.choice([-1, 1], trades_per_tick)
+        trades = [OrderBookTradeEvent(trading_pair="BTC-USDT",
+                                      timestamp=timestamp + 0.5,
+                                      price=float(mid_price + side * distance),
+                                      amount=float(amount),
+                                      type=TradeType.BUY if side > 0 else TradeType.SELL)
+                  for distance, side, amount in zip(distances, sides, np.random.uniform(0.1, 1, trades_per_tick))]
+        ticks.append((timestamp, float(mid_price), trades))
+    return ticks
+
+
+def time_per_tick(indicator, price_delegate: MidPriceDelegate, ticks: List[Tick]) -> float:
+    start = time.perf_counter()
+    for timestamp, mid_price, trades in ticks:
+        for trade in trades:
+            indicator.register_trade(trade)
+        price_delegate.mid_price = Decimal(str(mid_price))
+        indicator.calculate(timestamp)
+    return (time.perf_counter() - start) / len(ticks)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data-dir", type=str, required=False)
+    parser.add_argument("--trading-pair", type=str, required=False)
+    parser.add_argument("--sampling-length", type=int, default=200)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", OptimizeWarning)
+    np.random.seed(3141592653)
+    ticks_sets = ([(f"recorded {args.trading_pair}", recorded_ticks(args.data_dir, args.trading_pair))]
+                  if args.data_dir is not None
+                  else [(f"{trades} trades/tick", synthetic_ticks(1000, trades)) for trades in (5, 20, 100)])
+
+    print(f"{'data':>20} {'previous (ms/tick)':>19} {'current (ms/tick)':>18} {'interval 10 (ms/tick)':>22} "
+          f"{'speedup':>8}  previous (alpha, kappa) / current (alpha, kappa)")
+    for name, ticks in ticks_sets:
+        price_delegate = MidPriceDelegate()
+        previous = PreviousTradingIntensityIndicator(price_delegate, args.sampling_length)
+        previous_time = time_per_tick(previous, price_delegate, ticks)
+        current = TradingIntensityIndicator(OrderBook(), price_delegate, args.sampling_length)
+        current_time = time_per_tick(current, price_delegate, ticks)
+        spaced = TradingIntensityIndicator(OrderBook(), price_delegate, args.sampling_length, estimation_interval=10)
+        spaced_time = time_per_tick(spaced, price_delegate, ticks)
+        print(f"{name:>20} {previous_time * 1e3:>19.3f} {current_time * 1e3:>18.3f} {spaced_time * 1e3:>22.3f} "
+              f"{previous_time / current_time:>7.1f}x  "
+              f"({previous.current_value[0]:.4f}, {previous.current_value[1]:.4f}) / "
+              f"({current.current_value[0]:.4f}, {current.current_value[1]:.4f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class TickProfileCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_start_attaches_profiler_to_running_clock(self):
+        self.app.clock = Clock(ClockMode.REALTIME)
+
+        self.app.set_tick_profiling("start")
+
+        self.assertIsNotNone(self.app.clock_profiler)
+        self.assertIs(self.app.clock_profiler, self.app.clock.profiler)
+
+    def test_stop_detaches_profiler(self):
+        self.app.clock = Clock(ClockMode.REALTIME)
+        self.app.set_tick_profiling("start")
+
+        self.app.set_tick_profiling("stop")
+
+        self.assertIsNone(self.app.clock_profiler)
+        self.assertIsNone(self.app.clock.profiler)
+
+    def test_reset_clears_metrics(self):
+        self.app.set_tick_profiling("start")
+        self.app.clock_profiler.record_tick(lag=0.001, elapsed=0.001, missed_ticks=1)
+
+        self.app.set_tick_profiling("reset")
+
+        self.assertEqual(0, self.app.clock_profiler.ticks)
+
+    def test_invalid_option_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.app.set_tick_profiling("pause")
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_report(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.tick_profile()
+        self.app.set_tick_profiling("start")
+        self.app.clock_profiler.record_iterator_tick(TimeIterator(), 0.002)
+        self.app.clock_profiler.record_tick(lag=0.001, elapsed=0.002, missed_ticks=3)
+        self.app.tick_profile()
+
+        self.assertEqual(2, len(captures))
+        self.assertEqual("Tick profiling is not enabled, run 'tick_profile start' to enable it.", captures[0])
+        self.assertIn("Ticks: 1    Missed ticks: 3", captures[1])
+        self.assertIn("TimeIterator", captures[1])
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.parameter_sweep import ParameterSweepRunner, parameter_combinations
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_event_recorder import OrderBookEventRecorder
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class ParameterSweepTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640001000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.data_directory = os.path.join(self.temp_directory.name, "data")
+        self.strategy_file_path = os.path.join(self.temp_directory.name, "conf_pure_mm.yml")
+        with open(self.strategy_file_path, "w") as file:
+            file.write("strategy: pure_market_making\n"
+                       "exchange: binance_paper_trade\n"
+                       f"market: {self.trading_pair}\n"
+                       "bid_spread: 1\n"
+                       "ask_spread: 1\n"
+                       "order_amount: 1\n"
+                       "order_refresh_time: 60\n")
+
+        recorder = OrderBookEventRecorder(self.data_directory)
+        recorder.start()
+        recorder.record_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": 1,
+            "bids": [["99", "10"], ["98", "10"]],
+            "asks": [["101", "10"], ["102", "10"]],
+        }, timestamp=self.start_timestamp))
+        recorder.record_message(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.SELL.value),
+            "trade_id": 2,
+            "update_id": 2,
+            "price": "98.9",
+            "amount": "5",
+        }, timestamp=self.start_timestamp + 5))
+        recorder.stop()
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+        super().tearDown()
+
+    def test_parameter_combinations(self):
+        combinations = parameter_combinations({"bid_spread": [1, 2], "order_amount": [Decimal("1"), Decimal("2")]})
+
+        self.assertEqual([
+            {"bid_spread": 1, "order_amount": Decimal("1")},
+            {"bid_spread": 1, "order_amount": Decimal("2")},
+            {"bid_spread": 2, "order_amount": Decimal("1")},
+            {"bid_spread": 2, "order_amount": Decimal("2")},
+        ], combinations)
+        self.assertEqual([{}], parameter_combinations({}))
+
+    def test_sweep_runs_every_combination_on_the_recorded_data(self):
+        runner = ParameterSweepRunner(
+            strategy_file_path=self.strategy_file_path,
+            parameter_grid={"bid_spread": [Decimal("0.5"), Decimal("2")]},
+            data_directory=self.data_directory,
+            balances={"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")},
+            end_timestamp=self.start_timestamp + 10,
+            max_workers=2,
+        )
+
+        results = runner.run().set_index("bid_spread")
+
+        self.assertEqual(["", ""], results["Error"].tolist())
+        # Only the bid at 0.5% below the 100 mid price (99.5) is crossed by the trade at 98.9
+        self.assertEqual(1, results.loc[Decimal("0.5"), "Fills"])
+        self.assertEqual(1, results.loc[Decimal("0.5"), "Buys"])
+        # The binance fee is paid in the received base asset
+        self.assertAlmostEqual(10.999, results.loc[Decimal("0.5"), "End base"])
+        self.assertEqual(0, results.loc[Decimal("2"), "Fills"])
+        self.assertEqual(10, results.loc[Decimal("2"), "End base"])
+        self.assertEqual(Decimal("0.5"), results.index[0])
+
+    def test_invalid_parameters_reported_in_the_results(self):
+        runner = ParameterSweepRunner(
+            strategy_file_path=self.strategy_file_path,
+            parameter_grid={"bid_spread": [Decimal("-1")]},
+            data_directory=self.data_directory,
+            balances={"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")},
+            max_workers=1,
+        )
+
+        results = runner.run()
+
+        self.assertIn("bid_spread", results["Error"].iloc[0])
+        self.assertEqual(0, results["Fills"].iloc[0])
@@ -34,6 +34,9 @@ class BinanceOrderBookTests(TestCase):
         self.assertEqual(4.000002, snapshot_message.asks[0].price)
         self.assertEqual(12.0, snapshot_message.asks[0].amount)
         self.assertEqual(1, snapshot_message.asks[0].update_id)
+        self.assertTrue(snapshot_message.has_rows_array)
+        self.assertEqual([[4.0, 431.0, 1.0]], snapshot_message.bids_array.tolist())
+        self.assertEqual([[4.000002, 12.0, 1.0]], snapshot_message.asks_array.tolist())
 
     def test_diff_message_from_exchange(self):
         diff_msg = BinanceOrderBook.diff_message_from_exchange(
@@ -74,6 +77,9 @@ class BinanceOrderBookTests(TestCase):
         self.assertEqual(0.0026, diff_msg.asks[0].price)
         self.assertEqual(100.0, diff_msg.asks[0].amount)
         self.assertEqual(2, diff_msg.asks[0].update_id)
+        self.assertTrue(diff_msg.has_rows_array)
+        self.assertEqual([[0.0024, 10.0, 2.0]], diff_msg.bids_array.tolist())
+        self.assertEqual([[0.0026, 100.0, 2.0]], diff_msg.asks_array.tolist())
 
     def test_trade_message_from_exchange(self):
         trade_update = {
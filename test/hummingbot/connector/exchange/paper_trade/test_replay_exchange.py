@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map, fee_overrides_dict
+from hummingbot.connector.exchange.paper_trade.replay_exchange import ReplayExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_event_log import (
+    load_order_book_events,
+    order_book_messages_to_events,
+    save_order_book_events,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+
+class ReplayExchangeTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640001000.0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        fee_overrides_config_map.update(fee_overrides_dict())
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.events = order_book_messages_to_events([
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": self.trading_pair,
+                "update_id": 1,
+                "bids": [["99", "10"], ["98", "10"]],
+                "asks": [["101", "10"], ["102", "10"]],
+            }, timestamp=self.start_timestamp),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": self.trading_pair,
+                "update_id": 2,
+                "bids": [],
+                "asks": [["100.5", "5"]],
+            }, timestamp=self.start_timestamp + 1.5),
+            OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": self.trading_pair,
+                "trade_type": float(TradeType.SELL.value),
+                "trade_id": 3,
+                "update_id": 3,
+                "price": "97",
+                "amount": "1",
+            }, timestamp=self.start_timestamp + 10),
+        ])
+        self.exchange = ReplayExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            order_book_events={self.trading_pair: self.events},
+            exchange_name="binance",
+        )
+        self.exchange.set_balance("COINALPHA", Decimal("10"))
+        self.exchange.set_balance("HBOT", Decimal("1000"))
+        self.clock = Clock(ClockMode.BACKTEST,
+                           start_time=self.exchange.start_timestamp,
+                           end_time=self.exchange.end_timestamp + 1)
+        self.clock.add_iterator(self.exchange)
+
+    def test_exchange_is_ready_with_the_replayed_trading_pairs(self):
+        self.assertTrue(self.exchange.ready)
+        self.assertEqual([self.trading_pair], self.exchange.trading_pairs)
+        self.assertEqual("binance", self.exchange.name)
+        self.assertEqual(self.start_timestamp, self.exchange.start_timestamp)
+        self.assertEqual(self.start_timestamp + 10, self.exchange.end_timestamp)
+
+    def test_tick_replays_events_up_to_the_tick_timestamp(self):
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        order_book = self.exchange.get_order_book(self.trading_pair)
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+        self.assertEqual(4, self.exchange.replayed_events)
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(100.5, order_book.get_price(True))
+        self.assertEqual(5, self.exchange.replayed_events)
+        self.assertFalse(self.exchange.replay_finished)
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+        self.assertEqual(6, self.exchange.replayed_events)
+        self.assertTrue(self.exchange.replay_finished)
+
+    def test_replayed_trade_fills_crossed_limit_order(self):
+        order_filled_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, order_filled_logger)
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("98.5"))
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.assertEqual(0, len(order_filled_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+        self.assertEqual(1, len(order_filled_logger.event_log))
+        fill_event = order_filled_logger.event_log[0]
+        self.assertEqual(order_id, fill_event.order_id)
+        self.assertEqual(Decimal("98.5"), fill_event.price)
+        self.assertEqual(Decimal("1"), fill_event.amount)
+
+    def test_replay_from_memory_mapped_events_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, f"{self.trading_pair}.npy")
+            save_order_book_events(file_path, self.events)
+            exchange = ReplayExchange(
+                client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                order_book_events={self.trading_pair: load_order_book_events(file_path)},
+                exchange_name="binance",
+            )
+
+            exchange.replay_order_books(self.start_timestamp + 2)
+
+            order_book = exchange.get_order_book(self.trading_pair)
+            self.assertEqual(99, order_book.get_price(False))
+            self.assertEqual(100.5, order_book.get_price(True))
+            self.assertEqual(5, exchange.replayed_events)
+            del exchange
+
+    def test_strategy_runs_unchanged_on_replayed_data(self):
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(self.exchange, self.trading_pair, "COINALPHA", "HBOT"),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=60,
+        )
+        self.clock.add_iterator(strategy)
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+
+        self.assertEqual(1, len(strategy.active_buys))
+        self.assertEqual(1, len(strategy.active_sells))
+        self.assertEqual(Decimal("99"), strategy.active_buys[0].price)
@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Any, Awaitable, Dict, List
+
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
+from hummingbot.core.data_type.common import TradeType
+
+
+class MockGatewayClient:
+    def __init__(self):
+        self.requests: List[Decimal] = []
+        self.response_delay = 0.01
+        self.error = None
+
+    async def get_price(self, chain: str, network: str, connector: str, base_asset: str, quote_asset: str,
+                        amount: Decimal, side: TradeType) -> Dict[str, Any]:
+        self.requests.append(amount)
+        await asyncio.sleep(self.response_delay)
+        if self.error is not None:
+            raise self.error
+        return {"price": str(len(self.requests)), "gasLimit": 1, "gasPrice": 1, "gasCost": "0.1",
+                "gasPriceToken": "ETH"}
+
+
+class GatewayQuoteCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = MockGatewayClient()
+        self.cache = GatewayQuoteCache(ttl=60)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def get_price(self, amount: Decimal, side: TradeType = TradeType.BUY):
+        return self.cache.get_price(self.client, "ethereum", "mainnet", "uniswap", "WETH", "USDC", amount, side)
+
+    def test_concurrent_lookups_share_one_request(self):
+        responses = self.async_run_with_timeout(asyncio.gather(*[self.get_price(Decimal("1")) for _ in range(3)]))
+
+        self.assertEqual(1, len(self.client.requests))
+        self.assertTrue(all(response["price"] == "1" for response in responses))
+        self.assertEqual(1, self.cache.stats.misses)
+        self.assertEqual(2, self.cache.stats.coalesced)
+        self.assertEqual(1, self.cache.stats.request_latency.count)
+
+    def test_cached_quotes_are_reused_until_expired(self):
+        self.async_run_with_timeout(self.get_price(Decimal("1")))
+        response = self.async_run_with_timeout(self.get_price(Decimal("1")))
+        self.assertEqual("1", response["price"])
+        self.assertEqual(1, self.cache.stats.hits)
+
+        # Other side
+        response = self.async_run_with_timeout(self.get_price(Decimal("1"), TradeType.SELL))
+        self.assertEqual("2", response["price"])
+
+        self.cache.ttl = 0
+        response = self.async_run_with_timeout(self.get_price(Decimal("1")))
+        self.assertEqual("3", response["price"])
+        self.assertEqual(3, self.cache.stats.misses)
+        self.assertAlmostEqual(0.25, self.cache.stats.hit_rate)
+
+    def test_amounts_in_the_same_bucket_share_quotes(self):
+        self.assertEqual(Decimal("1235"), self.cache.amount_bucket(Decimal("1234.5678")))
+        self.assertEqual(Decimal("0.001235"), self.cache.amount_bucket(Decimal("0.0012345678")))
+
+        self.async_run_with_timeout(self.get_price(Decimal("1000.01")))
+        self.async_run_with_timeout(self.get_price(Decimal("1000.02")))
+        self.async_run_with_timeout(self.get_price(Decimal("1001")))
+
+        # The quotes are requested for the amount of the caller
+        self.assertEqual([Decimal("1000.01"), Decimal("1001")], self.client.requests)
+
+    def test_new_block_expires_cached_quotes(self):
+        self.cache.update_block_number("ethereum", "mainnet", 100)
+        self.async_run_with_timeout(self.get_price(Decimal("1")))
+        self.cache.update_block_number("ethereum", "mainnet", 99)
+        self.async_run_with_timeout(self.get_price(Decimal("1")))
+        self.assertEqual(1, len(self.client.requests))
+
+        self.cache.update_block_number("ethereum", "mainnet", 101)
+        response = self.async_run_with_timeout(self.get_price(Decimal("1")))
+
+        self.assertEqual("2", response["price"])
+        self.assertEqual(1, self.cache.stats.block_expirations)
+        self.assertEqual(101, self.cache.block_number("ethereum", "mainnet"))
+
+    def test_errors_are_raised_to_all_callers_and_not_cached(self):
+        self.client.error = IOError("Gateway error")
+        results = self.async_run_with_timeout(
+            asyncio.gather(self.get_price(Decimal("1")), self.get_price(Decimal("1")), return_exceptions=True)
+        )
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+        self.assertEqual(1, self.cache.stats.errors)
+
+        self.client.error = None
+        response = self.async_run_with_timeout(self.get_price(Decimal("1")))
+        self.assertEqual("2", response["price"])
+        self.assertEqual(2, len(self.client.requests))
@@ -1091,3 +1091,153 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _create_order(self, client_order_id: str, exchange_order_id: str = None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+
+    def test_order_views_follow_order_state_transitions(self):
+        self.tracker.lost_order_count_limit = 0
+        active_order = self._create_order("OID1", "EOID1")
+        cached_order = self._create_order("OID2", "EOID2")
+        lost_order = self._create_order("OID3", "EOID3")
+        all_orders = self.tracker.all_orders
+        fillable_orders = self.tracker.all_fillable_orders
+        updatable_orders = self.tracker.all_updatable_orders
+
+        for order in (active_order, cached_order, lost_order):
+            self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(cached_order.client_order_id)
+        self.async_run_with_timeout(self.tracker.process_order_not_found(lost_order.client_order_id))
+
+        self.assertEqual({"OID1": active_order, "OID2": cached_order}, all_orders)
+        self.assertEqual({"OID1": active_order, "OID2": cached_order, "OID3": lost_order}, fillable_orders)
+        self.assertEqual({"OID1": active_order, "OID3": lost_order}, updatable_orders)
+        self.assertEqual(["EOID1", "EOID2", "EOID3"], list(self.tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertEqual(lost_order, self.tracker.all_updatable_orders_by_exchange_order_id["EOID3"])
+        self.assertNotIn("EOID2", self.tracker.all_updatable_orders_by_exchange_order_id)
+        self.assertEqual(cached_order, self.tracker.fetch_order(exchange_order_id="EOID2"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID3"))
+        self.assertEqual(lost_order, self.tracker.fetch_lost_order(exchange_order_id="EOID3"))
+        self.assertIsNone(self.tracker.fetch_lost_order(exchange_order_id="EOID1"))
+
+    def test_exchange_order_id_assigned_after_tracking_is_indexed(self):
+        order = self._create_order("OID1")
+        self.tracker.start_tracking_order(order)
+
+        self.assertNotIn(None, self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+        order.update_exchange_order_id("EOID1")
+
+        self.assertEqual(order, self.tracker.all_fillable_orders_by_exchange_order_id["EOID1"])
+        self.assertEqual(order, self.tracker.all_updatable_orders_by_exchange_order_id.get("EOID1"))
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_expired_cached_order_not_found_by_exchange_order_id(self):
+        tracker = ClientOrderTracker(self.connector)
+        order = self._create_order("OID1", "EOID1")
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIn("EOID1", tracker.all_fillable_orders_by_exchange_order_id)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertNotIn("EOID1", tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertNotIn("OID1", tracker.all_fillable_orders)
+        self.assertEqual(0, len(tracker.all_fillable_orders))
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.MAX_CACHE_SIZE", 2)
+    def test_exchange_order_id_index_pruned_when_orders_leave_the_cache(self):
+        tracker = ClientOrderTracker(self.connector)
+        for i in range(10):
+            order = self._create_order(f"OID{i}", f"EOID{i}")
+            tracker.start_tracking_order(order)
+            tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertLessEqual(len(tracker._orders_by_exchange_order_id), 4)
+        self.assertEqual(["EOID8", "EOID9"], list(tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertNotIn("EOID0", tracker.all_fillable_orders_by_exchange_order_id)
+
+    def test_iterating_order_views_while_orders_change(self):
+        for i in range(3):
+            self.tracker.start_tracking_order(self._create_order(f"OID{i}", f"EOID{i}"))
+
+        for client_order_id in self.tracker.all_updatable_orders:
+            self.tracker.stop_tracking_order(client_order_id)
+
+        self.assertEqual(0, len(self.tracker.all_updatable_orders))
+        self.assertEqual(3, len(self.tracker.all_fillable_orders))
+
+    def test_iterating_order_view_values_and_items_while_orders_change(self):
+        self.tracker.lost_order_count_limit = 0
+        orders = [self._create_order(f"OID{i}", f"EOID{i}") for i in range(3)]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+        self.async_run_with_timeout(self.tracker.process_order_not_found("OID2"))
+
+        iterated_orders = []
+        for order in self.tracker.all_updatable_orders.values():
+            iterated_orders.append(order)
+            # Removes the orders not iterated yet too
+            self.tracker.stop_tracking_order("OID0")
+            self.tracker.stop_tracking_order("OID1")
+            self.tracker._lost_orders.pop("OID2", None)
+        self.assertEqual(orders, iterated_orders)
+        self.assertEqual(0, len(self.tracker.all_updatable_orders))
+
+        iterated_ids = []
+        for exchange_order_id, order in self.tracker.all_fillable_orders_by_exchange_order_id.items():
+            iterated_ids.append(exchange_order_id)
+            self.tracker._cached_orders.clear()
+        self.assertEqual(["EOID0", "EOID1"], iterated_ids)
+        self.assertEqual(0, len(self.tracker.all_fillable_orders))
+
+    def test_lost_orders_return_copy_and_cached_orders_return_read_only_view(self):
+        self.tracker.lost_order_count_limit = 0
+        order = self._create_order("OID1", "EOID1")
+        self.tracker.start_tracking_order(order)
+        self.async_run_with_timeout(self.tracker.process_order_not_found("OID1"))
+
+        lost_orders = self.tracker.lost_orders
+        lost_orders.clear()
+        cached_orders = self.tracker.cached_orders
+        with self.assertRaises(TypeError):
+            cached_orders["OID2"] = order
+
+        self.assertEqual({"OID1": order}, self.tracker.lost_orders)
+        self.assertNotIn("OID2", self.tracker.cached_orders)
+
+        cached_order = self._create_order("OID3", "EOID3")
+        self.tracker.start_tracking_order(cached_order)
+        self.tracker.stop_tracking_order(cached_order.client_order_id)
+
+        self.assertEqual({"OID3": cached_order}, dict(cached_orders))
+
+    def test_order_views_length_follows_tracked_orders(self):
+        orders = [self._create_order(f"OID{i}", f"EOID{i}") for i in range(3)]
+        orders.append(self._create_order("OID3", None))
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order("OID0")
+
+        self.assertEqual(4, len(self.tracker.all_fillable_orders))
+        self.assertEqual(3, len(self.tracker.all_updatable_orders))
+        self.assertEqual(3, len(self.tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertEqual(2, len(self.tracker.all_updatable_orders_by_exchange_order_id))
+
+        orders[3].update_exchange_order_id("EOID3")
+
+        self.assertEqual(4, len(self.tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertEqual(3, len(self.tracker.all_updatable_orders_by_exchange_order_id))
@@ -1,3 +1,6 @@
+import csv
+import os
+import tempfile
 import time
 from decimal import Decimal
 from unittest import TestCase
@@ -14,9 +17,11 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -49,6 +54,44 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def _create_file_db_manager(self, db_dir: str) -> SQLConnectionManager:
+        # The write behind thread needs a database shared between connections
+        with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock:
+            engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir, 'test_DB.sqlite')}")
+            return SQLConnectionManager(
+                ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+            )
+
+    def _create_and_fill_events(self):
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_events = [OrderFilledEvent(
+            timestamp=1642020000 + i,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=Decimal("0.5"),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=f"TradeId{i}"
+        ) for i in range(2)]
+        return create_event, fill_events
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -266,3 +309,167 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    def test_status_update_of_unknown_order_does_not_save_market_states(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        self.tracking_states = {"order": "tracked"}
+        cancel_event = OrderCancelledEvent(timestamp=1642020000, order_id="OID1-1642010000000000")
+
+        recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self, cancel_event)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(MarketState).all()))
+
+        create_event, _ = self._create_and_fill_events()
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        self.tracking_states = {"order": "cancelled"}
+        recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self, cancel_event)
+
+        with self.manager.get_new_session() as session:
+            market_state = session.query(MarketState).one()
+            saved_state = market_state.saved_state
+            order = session.query(Order).one()
+            last_status = order.last_status
+
+        self.assertEqual({"order": "cancelled"}, saved_state)
+        self.assertEqual(MarketEvent.OrderCancelled.name, last_status)
+
+    def test_fills_appended_to_csv_through_persistent_file(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path="test_config.yml",
+            strategy_name=self.strategy_name
+        )
+        create_event, fill_events = self._create_and_fill_events()
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=data_dir):
+                with patch.object(MarketsRecorder, "_csv_matches_header", wraps=MarketsRecorder._csv_matches_header) \
+                        as header_check_mock:
+                    # Existing file with the expected header
+                    with open(os.path.join(data_dir, "trades_test_config.csv"), "w", newline="") as csv_file:
+                        csv.writer(csv_file).writerow(TradeFill.attribute_names_for_file_export() + ["age"])
+
+                    recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+                    for fill_event in fill_events:
+                        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+                    recorder.stop()
+
+                self.assertEqual(1, header_check_mock.call_count)
+                with open(os.path.join(data_dir, "trades_test_config.csv"), newline="") as csv_file:
+                    rows = list(csv.reader(csv_file))
+
+        self.assertEqual(3, len(rows))
+        self.assertEqual(["TradeId0", "TradeId1"], [row[0] for row in rows[1:]])
+
+    def test_write_behind_events_flushed_on_stop(self):
+        with tempfile.TemporaryDirectory() as db_dir:
+            manager = self._create_file_db_manager(db_dir)
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path="test_config.yml",
+                strategy_name=self.strategy_name,
+                write_behind=True,
+            )
+            recorder.start()
+            create_event, fill_events = self._create_and_fill_events()
+
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=db_dir):
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+                for fill_event in fill_events:
+                    recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+                # Nothing is written on the event loop
+                with manager.get_new_session() as session:
+                    self.assertEqual(0, len(session.query(Order).all()))
+
+                recorder.stop()
+
+            with manager.get_new_session() as session:
+                orders = session.query(Order).all()
+                order_status = orders[0].status
+                trade_fills = orders[0].trade_fills
+                market_states = session.query(MarketState).all()
+
+            with open(os.path.join(db_dir, "trades_test_config.csv"), newline="") as csv_file:
+                csv_rows = list(csv.reader(csv_file))
+
+        self.assertIsNone(recorder._writer_thread)
+        self.assertEqual(1, len(orders))
+        self.assertEqual(3, len(order_status))
+        self.assertEqual(2, len(trade_fills))
+        self.assertEqual(1, len(market_states))
+        self.assertEqual(self.display_name, market_states[0].market)
+        self.assertEqual(3, len(csv_rows))
+
+    def test_write_behind_market_states_saved_once_per_batch(self):
+        with tempfile.TemporaryDirectory() as db_dir:
+            manager = self._create_file_db_manager(db_dir)
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path="test_config.yml",
+                strategy_name=self.strategy_name,
+                write_behind=True,
+            )
+            recorder.start()
+            create_event, fill_events = self._create_and_fill_events()
+            self.tracking_states = {"order": "tracked"}
+
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=db_dir):
+                with patch.object(recorder, "_save_market_states", wraps=recorder._save_market_states) \
+                        as save_mock:
+                    recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+                    for fill_event in fill_events:
+                        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+                    recorder.stop()
+
+            with manager.get_new_session() as session:
+                market_state = session.query(MarketState).one()
+                saved_state = market_state.saved_state
+
+        save_mock.assert_called_once()
+        self.assertEqual({"order": "tracked"}, saved_state)
+
+    def test_write_behind_failed_event_does_not_discard_the_batch(self):
+        with tempfile.TemporaryDirectory() as db_dir:
+            manager = self._create_file_db_manager(db_dir)
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path="test_config.yml",
+                strategy_name=self.strategy_name,
+                write_behind=True,
+            )
+            recorder.start()
+            create_event, fill_events = self._create_and_fill_events()
+
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=db_dir):
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+                # The duplicated fill fails, the other events of the batch are written
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_events[0])
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_events[0])
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_events[1])
+                recorder.stop()
+
+            with manager.get_new_session() as session:
+                orders = session.query(Order).all()
+                trade_fills = session.query(TradeFill).all()
+                market_states = session.query(MarketState).all()
+
+            with open(os.path.join(db_dir, "trades_test_config.csv"), newline="") as csv_file:
+                csv_rows = list(csv.reader(csv_file))
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(2, len(trade_fills))
+        self.assertEqual(1, len(market_states))
+        # Only the committed fills are written to the CSV file
+        self.assertEqual(3, len(csv_rows))
+        self.assertEqual(["TradeId0", "TradeId1"], [row[0] for row in csv_rows[1:]])
@@ -75,3 +75,64 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_offset_calculated_only_when_samples_change(self, seconds_counter_mock):
+        seconds_counter_mock.return_value = 100
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+        time_provider.add_time_offset_ms_sample(3000)
+
+        with patch.object(time_provider, "_update_offset") as update_offset_mock:
+            for _ in range(3):
+                self.assertEqual(100 + (2000 + 2500) / 2 * 1e-3, time_provider.time())
+            update_offset_mock.assert_not_called()
+
+        time_provider.add_time_offset_ms_sample(5000)
+        self.assertEqual((3000 + (1000 + 9000 + 25000) / 9) / 2, time_provider.time_offset_ms)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time")
+    def test_clear_samples_returns_to_local_time(self, time_mock, seconds_counter_mock):
+        time_mock.return_value = 1640000000.0
+        seconds_counter_mock.return_value = 100
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+
+        time_provider.clear_time_offset_ms_samples()
+
+        self.assertEqual(1640000000.0, time_provider.time())
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_time_extrapolated_with_clock_drift(self, seconds_counter_mock):
+        # The server clock gains 0.1 ms per second over the local clock
+        time_provider = TimeSynchronizer(extrapolate_drift=True)
+        for sample_time in [0, 10, 20, 30, 40]:
+            time_provider.add_time_offset_ms_sample(500 + sample_time * 0.1, sample_time=sample_time)
+
+        seconds_counter_mock.return_value = 100
+
+        self.assertAlmostEqual(100e-6, time_provider.drift)
+        self.assertAlmostEqual(510, time_provider.time_offset_ms)
+        self.assertAlmostEqual(100 + 0.51, time_provider.time())
+
+    def test_clock_drift_not_estimated_with_samples_too_close(self):
+        time_provider = TimeSynchronizer(extrapolate_drift=True)
+        time_provider.add_time_offset_ms_sample(500, sample_time=0)
+        time_provider.add_time_offset_ms_sample(501, sample_time=1)
+
+        self.assertEqual(0, time_provider.drift)
+
+    def test_clock_drift_estimation_is_capped(self):
+        time_provider = TimeSynchronizer(extrapolate_drift=True)
+        time_provider.add_time_offset_ms_sample(500, sample_time=0)
+        time_provider.add_time_offset_ms_sample(600, sample_time=10)
+
+        self.assertEqual(TimeSynchronizer.MAX_CLOCK_DRIFT, time_provider.drift)
+
+    def test_clock_drift_not_extrapolated_by_default(self):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(500, sample_time=0)
+        time_provider.add_time_offset_ms_sample(501, sample_time=20)
+
+        self.assertEqual(0, time_provider.drift)
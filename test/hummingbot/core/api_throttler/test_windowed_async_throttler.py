@@ -0,0 +1,334 @@
+import asyncio
+import sys
+import time
+import unittest
+from typing import Dict, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.windowed_async_throttler import (
+    RateLimitWindow,
+    ScheduledAsyncThrottler,
+    WindowedAsyncRequestContext,
+    WindowedAsyncThrottler,
+    to_microseconds,
+)
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class WindowedAsyncThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = WindowedAsyncThrottler(rate_limits=self.rate_limits)
+        self._req_counters: Dict[str, int] = {limit.limit_id: 0 for limit in self.rate_limits}
+
+    async def execute_requests(self, no_request: int, limit_id: str, throttler: WindowedAsyncThrottler):
+        for _ in range(no_request):
+            async with throttler.execute_task(limit_id=limit_id):
+                self._req_counters[limit_id] += 1
+
+    def test_window_expires_only_elapsed_entries(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=1.0)
+        window = RateLimitWindow(rate_limit=rate_limit, safety_margin_pct=0.05)
+        window.append(to_microseconds(100.0), 2)
+        window.append(to_microseconds(100.5), 3)
+
+        window.expire(to_microseconds(101.05))
+        self.assertEqual(5, window.capacity_used)
+
+        window.expire(to_microseconds(101.06))
+        self.assertEqual(3, window.capacity_used)
+        self.assertEqual(1, len(window.entries))
+
+        window.expire(to_microseconds(102.0))
+        self.assertEqual(0, window.capacity_used)
+        self.assertEqual(0, len(window.entries))
+
+    def test_window_next_available(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=1.0)
+        window = RateLimitWindow(rate_limit=rate_limit, safety_margin_pct=0)
+        window.append(to_microseconds(100.0), 1)
+        window.append(to_microseconds(100.5), 1)
+
+        now = to_microseconds(100.6)
+        self.assertEqual(now, window.next_available(now, 1))
+        self.assertEqual(to_microseconds(101.0) + 1, window.next_available(now, 2))
+        self.assertEqual(to_microseconds(101.5) + 1, window.next_available(now, 3))
+        # A weight above the limit is checked again once the window has been fully renewed
+        self.assertEqual(now + to_microseconds(1.0), window.next_available(now, 4))
+
+    def test_within_capacity_singular_non_weighted_task(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertTrue(context.within_capacity())
+
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_within_capacity_pool_non_weighted_task(self):
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_PATH_URL).within_capacity())
+
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        # The linked pool limit is exhausted even though TEST_PATH_URL itself was never used
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_PATH_URL).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        # Weighted Task 1 and Task 2 already executed, resulting in a used capacity of 6/10
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        # However Task 2(weight=1) will not exceed the capacity(7/10)
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_acquire_logs_request_and_linked_limits(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).acquire())
+
+        self.assertEqual(1, self.throttler._limit_windows[TEST_WEIGHTED_TASK_1_ID].capacity_used)
+        self.assertEqual(5, self.throttler._limit_windows[TEST_WEIGHTED_POOL_ID].capacity_used)
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, self.throttler))
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(context.acquire(), 1.0)
+            )
+        self.assertEqual(1, self._req_counters[TEST_POOL_ID])
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = WindowedAsyncThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+
+        self.ev_loop.run_until_complete(context.acquire())
+        self.assertEqual(0, len(throttler._limit_windows))
+
+    def test_set_rate_limits_keeps_logged_usage(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_PATH_URL, self.throttler))
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=5.0)])
+
+        # The limit removed is not tracked anymore, the request logged in the pool still counts
+        self.assertEqual([TEST_POOL_ID], list(self.throttler._limit_windows))
+        self.assertEqual(2, self.throttler._limit_windows[TEST_POOL_ID].rate_limit.limit)
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, self.throttler))
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    @patch("hummingbot.core.api_throttler.windowed_async_throttler.WindowedAsyncRequestContext._time")
+    def test_set_rate_limits_expires_entries_with_new_time_interval(self, time_mock):
+        time_mock.return_value = 1640000000.0
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, self.throttler))
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=1.0)])
+
+        time_mock.return_value = 1640000001.0
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+        time_mock.return_value = 1640000001.5
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    @patch("hummingbot.core.api_throttler.windowed_async_throttler.WindowedAsyncRequestContext._time")
+    def test_within_capacity_for_limits_with_milliseconds_interval(self, time_mock):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=3, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=2, time_interval=0.2)
+        specific_limit = RateLimit(limit_id="specific_limit", limit=sys.maxsize, time_interval=1, linked_limits=[
+            LinkedLimitWeightPair(per_second_limit.limit_id),
+            LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+        ])
+        per_second_window = RateLimitWindow(per_second_limit, safety_margin_pct=0)
+        per_millisecond_window = RateLimitWindow(per_millisecond_limit, safety_margin_pct=0)
+        specific_window = RateLimitWindow(specific_limit, safety_margin_pct=0)
+
+        context = WindowedAsyncRequestContext(
+            windows=[(specific_window, 1), (per_millisecond_window, 1), (per_second_window, 1)],
+            rate_limit=specific_limit,
+            related_limits=[(per_millisecond_limit, 1), (per_second_limit, 1)],
+            lock=asyncio.Lock(),
+            safety_margin_pct=0,
+        )
+
+        # Scenario where one specific task was executed at 0 milliseconds
+        time_mock.return_value = 1640000000.0000
+        self.ev_loop.run_until_complete(context.acquire())
+
+        time_mock.return_value = 1640000000.0100
+        self.assertTrue(context.within_capacity())
+
+        # Add one more occurrence of the same task but at millisecond 1
+        time_mock.return_value = 1640000000.1000
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.1900
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2000
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2100
+        self.assertTrue(context.within_capacity())
+        self.assertEqual(1, per_millisecond_window.capacity_used)
+        self.assertEqual(2, per_second_window.capacity_used)
+
+
+class ScheduledAsyncThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1000, time_interval=0.1,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = ScheduledAsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0)
+        self.executed: List[str] = []
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def execute_request(self, name: str, limit_id: str = TEST_PATH_URL, priority=None):
+        async with self.throttler.execute_task(limit_id=limit_id, priority=priority):
+            self.executed.append(name)
+
+    def test_blocked_request_wakes_up_when_capacity_frees(self):
+        self.async_run_with_timeout(self.execute_request("first"))
+        start = time.time()
+
+        self.async_run_with_timeout(self.execute_request("second"))
+
+        elapsed = time.time() - start
+        self.assertEqual(["first", "second"], self.executed)
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.15)
+
+    def test_waiters_served_in_fifo_order(self):
+        async def run_requests():
+            await asyncio.gather(*[self.execute_request(name) for name in ("first", "second", "third")])
+
+        self.async_run_with_timeout(run_requests())
+
+        self.assertEqual(["first", "second", "third"], self.executed)
+        self.assertEqual(0, self.throttler.waiting_requests)
+
+    def test_higher_priority_waiter_served_first(self):
+        async def run_requests():
+            await self.execute_request("consume_capacity")
+            tasks = [asyncio.ensure_future(self.execute_request("balance_1")),
+                     asyncio.ensure_future(self.execute_request("balance_2"))]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.ensure_future(self.execute_request("cancel", priority=10)))
+            await asyncio.gather(*tasks)
+
+        self.async_run_with_timeout(run_requests())
+
+        self.assertEqual(["consume_capacity", "cancel", "balance_1", "balance_2"], self.executed)
+
+    def test_limit_priorities_used_by_default(self):
+        self.throttler = ScheduledAsyncThrottler(rate_limits=self.rate_limits,
+                                                 safety_margin_pct=0,
+                                                 limit_priorities={TEST_POOL_ID: 5})
+
+        self.assertEqual(5, self.throttler.execute_task(limit_id=TEST_POOL_ID).priority)
+        self.assertEqual(0, self.throttler.execute_task(limit_id=TEST_PATH_URL).priority)
+        self.assertEqual(1, self.throttler.execute_task(limit_id=TEST_POOL_ID, priority=1).priority)
+
+    def test_cancelled_waiter_does_not_block_queue(self):
+        async def run_requests():
+            await self.execute_request("consume_capacity")
+            cancelled = asyncio.ensure_future(self.execute_request("cancelled"))
+            waiting = asyncio.ensure_future(self.execute_request("waiting"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await waiting
+
+        self.async_run_with_timeout(run_requests())
+
+        self.assertEqual(["consume_capacity", "waiting"], self.executed)
+        self.assertEqual(0, self.throttler.waiting_requests)
+
+    def test_requests_without_configured_limit_are_not_queued(self):
+        async def run_requests():
+            await self.execute_request("consume_capacity")
+            blocked = asyncio.ensure_future(self.execute_request("blocked"))
+            await asyncio.sleep(0)
+            await self.execute_request("unlimited", limit_id="unknown_limit_id")
+            await blocked
+
+        self.async_run_with_timeout(run_requests())
+
+        self.assertEqual(["consume_capacity", "unlimited", "blocked"], self.executed)
+
+    def test_blocked_request_does_not_stall_unrelated_limits(self):
+        self.throttler = ScheduledAsyncThrottler(
+            rate_limits=[RateLimit(limit_id="A", limit=1, time_interval=10),
+                         RateLimit(limit_id="B", limit=100, time_interval=1)],
+            safety_margin_pct=0)
+
+        async def run_requests():
+            await self.execute_request("a_1", limit_id="A")
+            blocked = asyncio.ensure_future(self.execute_request("a_2", limit_id="A"))
+            await asyncio.sleep(0)
+            start = time.time()
+            await self.execute_request("b_1", limit_id="B")
+            elapsed = time.time() - start
+            blocked.cancel()
+            return elapsed
+
+        elapsed = self.async_run_with_timeout(run_requests())
+
+        self.assertEqual(["a_1", "b_1"], self.executed)
+        self.assertLess(elapsed, 0.05)
+        self.assertEqual(0, self.throttler.waiting_requests)
+
+    def test_unrelated_limit_admitted_while_other_limit_waiter_queued(self):
+        self.throttler = ScheduledAsyncThrottler(
+            rate_limits=[RateLimit(limit_id="A", limit=1, time_interval=10),
+                         RateLimit(limit_id="B", limit=1, time_interval=0.1)],
+            safety_margin_pct=0)
+
+        async def run_requests():
+            await self.execute_request("a_1", limit_id="A")
+            await self.execute_request("b_1", limit_id="B")
+            blocked_a = asyncio.ensure_future(self.execute_request("a_2", limit_id="A"))
+            blocked_b = asyncio.ensure_future(self.execute_request("b_2", limit_id="B"))
+            await asyncio.sleep(0)
+            await blocked_b
+            blocked_a.cancel()
+
+        self.async_run_with_timeout(run_requests())
+
+        self.assertEqual(["a_1", "b_1", "b_2"], self.executed)
@@ -3,6 +3,10 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType, order_book_rows_array
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +54,122 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_numpy_diffs_with_explicit_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64),
+                                        np.array([[2, 1, 1]], dtype=np.float64),
+                                        3)
+        self.assertEqual(3, order_book.snapshot_uid)
+
+        order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.float64), 5)
+        self.assertEqual(5, order_book.last_diff_uid)
+
+        order_book.apply_numpy_diffs(np.array([[1, 0, 6]], dtype=np.float64), np.array([[2, 3, 7]], dtype=np.float64))
+        self.assertEqual(7, order_book.last_diff_uid)
+        self.assertEqual([], list(order_book.bid_entries()))
+        self.assertEqual([(2.0, 3.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
+
+    def test_apply_messages_with_pre_parsed_arrays(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids_array": order_book_rows_array([["10", "1"], ["9", "2"]], 1),
+            "asks_array": order_book_rows_array([["11", "1"]], 1),
+        }, timestamp=1)
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids_array": order_book_rows_array([["10", "0"]], 2),
+            "asks_array": order_book_rows_array([["12", "5"]], 2),
+        }, timestamp=2)
+        order_book = OrderBook()
+
+        order_book.apply_snapshot_message(snapshot)
+        order_book.apply_diffs_message(diff)
+
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual([(9.0, 2.0, 1)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual([(11.0, 1.0, 1), (12.0, 5.0, 2)], [tuple(row) for row in order_book.ask_entries()])
+        self.assertEqual(9.0, order_book.get_price(False))
+
+    def test_price_level_index_matches_default_book(self):
+        rng = np.random.default_rng(42)
+        default_book = OrderBook()
+        indexed_book = OrderBook(price_level_index=True)
+        self.assertFalse(default_book.uses_price_level_index)
+        self.assertTrue(indexed_book.uses_price_level_index)
+
+        bids_array = np.array([[100 - i, 1 + i, 1] for i in range(1, 50)], dtype=np.float64)
+        asks_array = np.array([[100 + i, 1 + i, 1] for i in range(1, 50)], dtype=np.float64)
+        for order_book in (default_book, indexed_book):
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for update_id in range(2, 500):
+            bid_prices = rng.integers(40, 105, size=5)
+            ask_prices = rng.integers(95, 160, size=5)
+            amounts = rng.choice([0, 0.5, 1, 2.5], size=10)
+            new_bids = np.array([[price, amount, update_id] for price, amount in zip(bid_prices, amounts[:5])],
+                                dtype=np.float64)
+            new_asks = np.array([[price, amount, update_id] for price, amount in zip(ask_prices, amounts[5:])],
+                                dtype=np.float64)
+            for order_book in (default_book, indexed_book):
+                order_book.apply_numpy_diffs(new_bids, new_asks)
+
+            self.assertEqual(list(default_book.bid_entries()), list(indexed_book.bid_entries()))
+            self.assertEqual(list(default_book.ask_entries()), list(indexed_book.ask_entries()))
+
+        for is_buy in (True, False):
+            self.assertEqual(default_book.get_price(is_buy), indexed_book.get_price(is_buy))
+            for volume in (0.1, 3, 20, 1000):
+                np.testing.assert_equal(default_book.get_price_for_volume(is_buy, volume).result_price,
+                                        indexed_book.get_price_for_volume(is_buy, volume).result_price)
+                np.testing.assert_equal(default_book.get_vwap_for_volume(is_buy, volume).result_price,
+                                        indexed_book.get_vwap_for_volume(is_buy, volume).result_price)
+
+    def test_price_level_index_updates_level_in_place(self):
+        order_book = OrderBook(price_level_index=True)
+        order_book.apply_snapshot([OrderBookRow(10, 1, 1), OrderBookRow(9, 1, 1)], [OrderBookRow(11, 1, 1)], 1)
+
+        order_book.apply_diffs([OrderBookRow(10, 3, 2), OrderBookRow(9, 0, 2)], [OrderBookRow(11, 2, 2)], 2)
+
+        self.assertEqual([OrderBookRow(10, 3, 2)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(11, 2, 2)], list(order_book.ask_entries()))
+
+        # A crossing bid truncates the older ask; the index must not keep the removed level
+        order_book.apply_diffs([OrderBookRow(12, 1, 3)], [], 3)
+        order_book.apply_diffs([], [OrderBookRow(11, 5, 4)], 4)
+
+        self.assertEqual([OrderBookRow(11, 5, 4)], list(order_book.ask_entries()))
+        self.assertEqual([OrderBookRow(10, 3, 2)], list(order_book.bid_entries()))
+
+    def test_top_of_book_version_and_event(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangedEvent, event_logger)
+        initial_version = order_book.top_of_book_version
+
+        order_book.apply_snapshot([OrderBookRow(10, 1, 1)], [OrderBookRow(11, 1, 1)], 1)
+        snapshot_version = order_book.top_of_book_version
+        self.assertGreater(snapshot_version, initial_version)
+        self.assertEqual(1, len(event_logger.event_log))
+
+        # Changes below the top of the book don't change the version
+        order_book.apply_diffs([OrderBookRow(9, 1, 2)], [OrderBookRow(12, 1, 2)], 2)
+        self.assertEqual(snapshot_version, order_book.top_of_book_version)
+        self.assertEqual(1, len(event_logger.event_log))
+
+        order_book.apply_diffs([OrderBookRow(10.5, 1, 3)], [], 3)
+        self.assertGreater(order_book.top_of_book_version, snapshot_version)
+        self.assertEqual(2, len(event_logger.event_log))
+        event = event_logger.event_log[-1]
+        self.assertEqual(10.5, event.best_bid)
+        self.assertEqual(11, event.best_ask)
+        self.assertEqual(order_book.top_of_book_version, event.top_of_book_version)
+
+        # Versions are never shared between order book instances
+        self.assertNotEqual(OrderBook().top_of_book_version, OrderBook().top_of_book_version)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_event_log import (
+    ASK_SIDE,
+    BID_SIDE,
+    ORDER_BOOK_EVENT_DTYPE,
+    load_order_book_events,
+    order_book_events_to_messages,
+    order_book_message_starts,
+    order_book_messages_to_events,
+    save_order_book_events,
+    sort_order_book_events,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class OrderBookEventLogTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def _messages(self):
+        return [
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": self.trading_pair,
+                "update_id": 1,
+                "bids": [["99", "1"], ["98", "2"]],
+                "asks": [["101", "1"]],
+            }, timestamp=1000.0),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": self.trading_pair,
+                "update_id": 2,
+                "bids": [["99", "0"]],
+                "asks": [["100.5", "3"]],
+            }, timestamp=1000.5),
+            OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": self.trading_pair,
+                "trade_type": float(TradeType.SELL.value),
+                "trade_id": 7,
+                "update_id": 7,
+                "price": "98",
+                "amount": "0.5",
+            }, timestamp=1001.0),
+        ]
+
+    def test_messages_to_events(self):
+        events = order_book_messages_to_events(self._messages())
+
+        self.assertEqual(ORDER_BOOK_EVENT_DTYPE, events.dtype)
+        self.assertEqual(6, len(events))
+        self.assertEqual([1000.0, 1000.0, 1000.0, 1000.5, 1000.5, 1001.0], events["timestamp"].tolist())
+        self.assertEqual([1, 1, 1, 2, 2, 7], events["update_id"].tolist())
+        self.assertEqual([BID_SIDE, BID_SIDE, ASK_SIDE, BID_SIDE, ASK_SIDE, TradeType.SELL.value],
+                         events["side"].tolist())
+        self.assertEqual([99, 98, 101, 99, 100.5, 98], events["price"].tolist())
+        self.assertEqual([1, 2, 1, 0, 3, 0.5], events["amount"].tolist())
+
+    def test_message_starts(self):
+        messages = self._messages()
+        messages.append(messages[-1])
+        events = order_book_messages_to_events(messages)
+
+        self.assertEqual([0, 3, 5, 6], order_book_message_starts(events).tolist())
+        self.assertEqual([], order_book_message_starts(np.empty(0, dtype=ORDER_BOOK_EVENT_DTYPE)).tolist())
+
+    def test_events_to_messages_round_trip(self):
+        events = order_book_messages_to_events(self._messages())
+
+        snapshot, diff, trade = list(order_book_events_to_messages(events, self.trading_pair))
+
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+        self.assertEqual(1000.0, snapshot.timestamp)
+        self.assertEqual(1, snapshot.update_id)
+        self.assertTrue(snapshot.has_rows_array)
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], snapshot.bids_array.tolist())
+        self.assertEqual([[101, 1, 1]], snapshot.asks_array.tolist())
+        self.assertEqual(OrderBookMessageType.DIFF, diff.type)
+        self.assertEqual([[99, 0, 2]], diff.bids_array.tolist())
+        self.assertEqual([[100.5, 3, 2]], diff.asks_array.tolist())
+        self.assertEqual(OrderBookMessageType.TRADE, trade.type)
+        self.assertEqual(7, trade.trade_id)
+        self.assertEqual(float(TradeType.SELL.value), trade.content["trade_type"])
+        self.assertEqual(98, trade.content["price"])
+        self.assertEqual(0.5, trade.content["amount"])
+
+    def test_sort_events_keeps_order_of_events_with_same_timestamp(self):
+        messages = self._messages()
+        events = order_book_messages_to_events([messages[2], messages[0]])
+
+        sorted_events = sort_order_book_events(events)
+
+        self.assertEqual([1000.0, 1000.0, 1000.0, 1001.0], sorted_events["timestamp"].tolist())
+        self.assertEqual([99, 98, 101, 98], sorted_events["price"].tolist())
+        self.assertIs(sorted_events, sort_order_book_events(sorted_events))
+
+    def test_save_and_load_events(self):
+        events = order_book_messages_to_events(self._messages())
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, f"{self.trading_pair}.npy")
+            save_order_book_events(file_path, events)
+            loaded_events = load_order_book_events(file_path)
+
+            self.assertIsInstance(loaded_events, np.memmap)
+            self.assertEqual(events.tolist(), loaded_events.tolist())
+            del loaded_events
+
+            np.save(file_path, np.zeros(3))
+            with self.assertRaises(ValueError):
+                load_order_book_events(file_path, memory_map=False)
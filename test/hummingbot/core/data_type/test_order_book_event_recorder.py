@@ -0,0 +1,171 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_event_log import order_book_events_to_messages
+from hummingbot.core.data_type.order_book_event_recorder import OrderBookEventReader, OrderBookEventRecorder
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+class OrderBookEventRecorderTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temp_directory.name
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+        super().tearDown()
+
+    def _snapshot_message(self, timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": 1,
+            "bids": [["99", "1"], ["98", "2"]],
+            "asks": [["101", "1"]],
+        }, timestamp=timestamp)
+
+    def _diff_message(self, update_id: int, timestamp: float, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=timestamp)
+
+    def _trade_message(self, trade_id: int, timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.BUY.value),
+            "trade_id": trade_id,
+            "update_id": trade_id,
+            "price": "101",
+            "amount": "0.5",
+        }, timestamp=timestamp)
+
+    def _record_two_chunks(self, recorder: OrderBookEventRecorder):
+        recorder.record_message(self._snapshot_message(1000))
+        recorder.record_message(self._diff_message(2, 1001, [["99", "0"]], []))
+        recorder.record_message(self._trade_message(10, 1002))
+        recorder.record_message(self._diff_message(3, 1003, [], [["100.5", "4"]]))
+        recorder.record_message(self._diff_message(4, 1004, [["97", "1"]], []))
+
+    def test_messages_written_in_chunks_starting_with_snapshots(self):
+        recorder = OrderBookEventRecorder(self.directory, chunk_messages=3)
+        recorder.start()
+        self._record_two_chunks(recorder)
+        recorder.stop()
+
+        reader = OrderBookEventReader(self.directory)
+        self.assertEqual([self.trading_pair], reader.trading_pairs)
+        self.assertEqual(5, recorder.recorded_messages)
+        self.assertEqual(2, recorder.written_chunks)
+        self.assertEqual(0, recorder.dropped_messages)
+        chunk_files = reader.chunk_files(self.trading_pair)
+        self.assertEqual([1000.0, 1003.0], [reader.chunk_start_timestamp(file_path) for file_path in chunk_files])
+        self.assertFalse(any(name.endswith(".tmp") for name in os.listdir(os.path.dirname(chunk_files[0]))))
+
+        # The second chunk starts with the state of the order book after the first chunk
+        second_chunk_messages = list(reader.iter_messages(self.trading_pair, start_timestamp=1003.5))
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF, OrderBookMessageType.DIFF],
+                         [message.type for message in second_chunk_messages])
+        self.assertEqual([[98, 2, 2]], second_chunk_messages[0].bids_array.tolist())
+        self.assertEqual([[101, 1, 2]], second_chunk_messages[0].asks_array.tolist())
+        self.assertEqual(1003, second_chunk_messages[0].timestamp)
+
+    def test_reader_returns_the_recorded_messages(self):
+        recorder = OrderBookEventRecorder(self.directory, chunk_messages=3)
+        recorder.start()
+        self._record_two_chunks(recorder)
+        recorder.stop()
+
+        reader = OrderBookEventReader(self.directory)
+        messages = list(reader.iter_messages(self.trading_pair, end_timestamp=1002))
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF, OrderBookMessageType.TRADE],
+                         [message.type for message in messages])
+        self.assertEqual(10, messages[2].trade_id)
+
+        events = reader.read_events(self.trading_pair)
+        self.assertEqual(9, len(events))
+        self.assertTrue(np.all(np.diff(events["timestamp"]) >= 0))
+        order_book = OrderBook()
+        for message in reader.iter_messages(self.trading_pair):
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.apply_snapshot_message(message)
+            elif message.type is OrderBookMessageType.DIFF:
+                order_book.apply_diffs_message(message)
+        self.assertEqual([(98, 2), (97, 1)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(100.5, 4), (101, 1)], [(row.price, row.amount) for row in order_book.ask_entries()])
+
+        self.assertEqual(0, len(reader.read_events("OTHER-PAIR")))
+
+    def test_chunk_submitted_when_chunk_duration_reached(self):
+        recorder = OrderBookEventRecorder(self.directory, chunk_duration=60)
+
+        recorder.record_message(self._snapshot_message(1000))
+        recorder.record_message(self._trade_message(1, 1030))
+        self.assertEqual(0, recorder.pending_chunks)
+
+        recorder.record_message(self._trade_message(2, 1060))
+        self.assertEqual(1, recorder.pending_chunks)
+
+    def test_chunks_dropped_when_writer_falls_behind(self):
+        recorder = OrderBookEventRecorder(self.directory, chunk_messages=1, max_pending_chunks=2)
+
+        for trade_id in range(5):
+            recorder.record_message(self._trade_message(trade_id, 1000 + trade_id))
+
+        self.assertEqual(2, recorder.pending_chunks)
+        self.assertEqual(3, recorder.dropped_messages)
+
+    def test_record_order_book_state(self):
+        recorder = OrderBookEventRecorder(self.directory)
+        recorder.start()
+        order_book = OrderBook()
+        order_book.apply_snapshot_message(self._snapshot_message(1000))
+
+        recorder.record_order_book(self.trading_pair, order_book, 1000)
+        recorder.stop()
+
+        snapshot, = list(OrderBookEventReader(self.directory).iter_messages(self.trading_pair))
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+        self.assertEqual(1, snapshot.update_id)
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], snapshot.bids_array.tolist())
+        self.assertEqual([[101, 1, 1]], snapshot.asks_array.tolist())
+
+    def test_writer_resyncs_on_next_snapshot_after_dropped_chunk(self):
+        recorder = OrderBookEventRecorder(self.directory, chunk_messages=1, max_pending_chunks=1)
+
+        def record_and_write(message: OrderBookMessage):
+            recorder.record_message(message)
+            recorder.start()
+            recorder.stop()
+
+        recorder.record_message(self._snapshot_message(1000))
+        # Dropped, the writer queue is full
+        recorder.record_message(self._diff_message(2, 1001, [["99", "0"]], []))
+        self.assertEqual(1, recorder.dropped_messages)
+        recorder.start()
+        recorder.stop()
+        record_and_write(self._diff_message(3, 1002, [], [["100.5", "4"]]))
+        snapshot = self._snapshot_message(1003)
+        snapshot.content["update_id"] = 4
+        record_and_write(snapshot)
+        record_and_write(self._diff_message(5, 1004, [["97", "1"]], []))
+
+        reader = OrderBookEventReader(self.directory)
+        chunk_types = [[message.type for message in order_book_events_to_messages(chunk, self.trading_pair)]
+                       for chunk in reader.iter_chunks(self.trading_pair)]
+        self.assertEqual([
+            [OrderBookMessageType.SNAPSHOT],
+            # The chunk following the dropped one does not start with the order book copy missing the dropped diff
+            [OrderBookMessageType.DIFF],
+            [OrderBookMessageType.SNAPSHOT],
+            [OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF],
+        ], chunk_types)
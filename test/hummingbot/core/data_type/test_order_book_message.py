@@ -1,8 +1,10 @@
 import time
 import unittest
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
-    OrderBookMessageType
+    OrderBookMessageType, order_book_rows_array
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -119,6 +121,40 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_rows_arrays_built_from_entries(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 10,
+                "asks": [("1.5", "2"), ("3", "4")],
+                "bids": [],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertFalse(msg.has_rows_array)
+        asks_array = msg.asks_array
+        self.assertEqual(np.float64, asks_array.dtype)
+        self.assertEqual([[1.5, 2.0, 10.0], [3.0, 4.0, 10.0]], asks_array.tolist())
+        self.assertIs(asks_array, msg.asks_array)
+        self.assertEqual((0, 3), msg.bids_array.shape)
+
+    def test_bids_and_asks_from_pre_parsed_arrays(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "update_id": 7,
+                "asks_array": order_book_rows_array([["1", "2", "ignored"], ["3", "4", "ignored"]], 7),
+                "bids_array": order_book_rows_array([["0.5", "6"]], 7),
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertTrue(msg.has_rows_array)
+        self.assertEqual([[1.0, 2.0, 7.0], [3.0, 4.0, 7.0]], msg.asks_array.tolist())
+        self.assertEqual([OrderBookRow(1.0, 2.0, 7), OrderBookRow(3.0, 4.0, 7)], msg.asks)
+        self.assertEqual([OrderBookRow(0.5, 6.0, 7)], msg.bids)
+
     def test_has_update_id(self):
         update_id = "someId"
 
@@ -0,0 +1,203 @@
+import asyncio
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_event_recorder import OrderBookEventReader, OrderBookEventRecorder
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTest(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.tracking_task = None
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _create_tracker(self, coalesce_diffs: bool) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=MagicMock(),
+                                   trading_pairs=[self.trading_pair],
+                                   coalesce_diffs=coalesce_diffs)
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 1)
+        tracker._order_books[self.trading_pair] = order_book
+        tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        return tracker
+
+    def _diff_message(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id))
+
+    def _queue_diffs(self, tracker: OrderBookTracker):
+        queue = tracker._tracking_message_queues[self.trading_pair]
+        queue.put_nowait(self._diff_message(2, [["10", "1"], ["9", "2"]], [["11", "1"]]))
+        queue.put_nowait(self._diff_message(3, [["10", "0"]], [["11", "3"], ["12", "1"]]))
+        queue.put_nowait(self._diff_message(4, [["9", "5"]], [["12", "0"]]))
+
+    def _run_tracking(self, tracker: OrderBookTracker):
+        self.tracking_task = self.ev_loop.create_task(tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+    def test_diffs_coalesced_when_queue_backed_up(self):
+        tracker = self._create_tracker(coalesce_diffs=True)
+        self._queue_diffs(tracker)
+
+        self._run_tracking(tracker)
+
+        order_book = tracker.order_books[self.trading_pair]
+        self.assertEqual([(9.0, 5.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(11.0, 3.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(3, tracker.coalesced_diff_messages[self.trading_pair])
+        self.assertEqual(1, tracker.coalesced_diff_batches[self.trading_pair])
+        self.assertEqual(3, len(tracker._past_diffs_windows[self.trading_pair]))
+
+    def test_coalesced_result_matches_sequential_application(self):
+        coalescing_tracker = self._create_tracker(coalesce_diffs=True)
+        sequential_tracker = self._create_tracker(coalesce_diffs=False)
+        self._queue_diffs(coalescing_tracker)
+        self._queue_diffs(sequential_tracker)
+
+        self._run_tracking(coalescing_tracker)
+        self.tracking_task.cancel()
+        self._run_tracking(sequential_tracker)
+
+        coalesced_book = coalescing_tracker.order_books[self.trading_pair]
+        sequential_book = sequential_tracker.order_books[self.trading_pair]
+        self.assertEqual(list(sequential_book.bid_entries()), list(coalesced_book.bid_entries()))
+        self.assertEqual(list(sequential_book.ask_entries()), list(coalesced_book.ask_entries()))
+        self.assertEqual(0, len(sequential_tracker.coalesced_diff_messages))
+
+    def test_snapshot_in_queue_stops_coalescing(self):
+        tracker = self._create_tracker(coalesce_diffs=True)
+        queue = tracker._tracking_message_queues[self.trading_pair]
+        queue.put_nowait(self._diff_message(2, [["10", "1"]], []))
+        queue.put_nowait(self._diff_message(3, [["9", "1"]], []))
+        queue.put_nowait(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 5, "bids": [["8", "1"]], "asks": [["13", "1"]]},
+            timestamp=5.0))
+        queue.put_nowait(self._diff_message(6, [["7", "1"]], []))
+
+        self._run_tracking(tracker)
+
+        order_book = tracker.order_books[self.trading_pair]
+        self.assertEqual(5, order_book.snapshot_uid)
+        self.assertEqual(6, order_book.last_diff_uid)
+        self.assertEqual(7.0, list(order_book.bid_entries())[-1].price)
+        self.assertEqual([13.0], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(2, tracker.coalesced_diff_messages[self.trading_pair])
+
+    @staticmethod
+    def _levels(order_book: OrderBook):
+        return ([(row.price, row.amount) for row in order_book.bid_entries()],
+                [(row.price, row.amount) for row in order_book.ask_entries()])
+
+    def _replay_recording(self, directory: str) -> OrderBook:
+        order_book = OrderBook()
+        for message in OrderBookEventReader(directory).iter_messages(self.trading_pair):
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.apply_snapshot_message(message)
+            elif message.type is OrderBookMessageType.DIFF:
+                order_book.apply_diffs_message(message)
+        return order_book
+
+    def test_applied_messages_are_recorded(self):
+        tracker = self._create_tracker(coalesce_diffs=False)
+        tracker._order_books[self.trading_pair].apply_snapshot([], [], 3)
+        tracker._order_books_initialized.set()
+        with tempfile.TemporaryDirectory() as directory:
+            tracker.recorder = OrderBookEventRecorder(directory)
+            tracker._order_book_diff_stream.put_nowait(self._diff_message(2, [["10", "1"]], []))
+            tracker._order_book_diff_stream.put_nowait(self._diff_message(4, [["9", "1"]], []))
+            tracker._order_book_snapshot_stream.put_nowait(OrderBookMessage(
+                OrderBookMessageType.SNAPSHOT,
+                {"trading_pair": self.trading_pair, "update_id": 5, "bids": [["8", "1"]], "asks": [["13", "1"]]},
+                timestamp=5.0))
+            tracker._order_book_trade_stream.put_nowait(OrderBookMessage(
+                OrderBookMessageType.TRADE,
+                {"trading_pair": self.trading_pair, "trade_type": float(TradeType.BUY.value), "trade_id": 1,
+                 "update_id": 1, "price": "13", "amount": "1"},
+                timestamp=6.0))
+            tasks = [self.ev_loop.create_task(tracker._order_book_diff_router()),
+                     self.ev_loop.create_task(tracker._order_book_snapshot_router()),
+                     self.ev_loop.create_task(tracker._emit_trade_event_loop())]
+            self._run_tracking(tracker)
+            for task in tasks:
+                task.cancel()
+
+            # The diff older than the order book snapshot is rejected and not recorded
+            self.assertEqual(3, tracker.recorder.recorded_messages)
+            tracker.recorder.start()
+            tracker.recorder.stop()
+            messages = list(OrderBookEventReader(directory).iter_messages(self.trading_pair))
+            self.assertEqual([OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT, OrderBookMessageType.TRADE],
+                             [message.type for message in messages])
+            self.assertEqual(4, messages[0].update_id)
+            # The snapshot is recorded with the past diffs restored on it
+            self.assertEqual([[9, 1], [8, 1]], messages[1].bids_array[:, :2].tolist())
+
+            order_book = tracker.order_books[self.trading_pair]
+            replayed_order_book = self._replay_recording(directory)
+            self.assertEqual(self._levels(order_book), self._levels(replayed_order_book))
+
+    def test_initial_order_book_recorded_before_saved_diffs(self):
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        initial_order_book = OrderBook()
+        initial_order_book.apply_snapshot([OrderBookRow(10, 1, 5)], [OrderBookRow(12, 1, 5)], 5)
+        tracker._data_source.get_new_order_book = AsyncMock(return_value=initial_order_book)
+        tracker._sleep = AsyncMock()
+        # Diffs received before the order book is initialized, the first one is older than its snapshot
+        tracker._saved_message_queues[self.trading_pair].extend([
+            self._diff_message(4, [["10", "0"]], []),
+            self._diff_message(6, [["9", "2"]], [["12", "0"]]),
+        ])
+        with tempfile.TemporaryDirectory() as directory:
+            tracker.recorder = OrderBookEventRecorder(directory)
+            self.async_run_with_timeout(tracker._init_order_books())
+            self.tracking_task = tracker._tracking_tasks[self.trading_pair]
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+            order_book = tracker.order_books[self.trading_pair]
+            self.assertEqual([(10.0, 1.0), (9.0, 2.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+            self.assertEqual([], list(order_book.ask_entries()))
+
+            tracker.recorder.start()
+            tracker.recorder.stop()
+            messages = list(OrderBookEventReader(directory).iter_messages(self.trading_pair))
+            self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF],
+                             [message.type for message in messages])
+            self.assertEqual(6.0, messages[0].timestamp)
+            replayed_order_book = self._replay_recording(directory)
+            self.assertEqual(self._levels(order_book), self._levels(replayed_order_book))
+
+    def test_saved_diffs_kept_without_recorder(self):
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        initial_order_book = OrderBook()
+        initial_order_book.apply_snapshot([OrderBookRow(10, 1, 5)], [OrderBookRow(12, 1, 5)], 5)
+        tracker._data_source.get_new_order_book = AsyncMock(return_value=initial_order_book)
+        tracker._sleep = AsyncMock()
+        saved_diffs = [self._diff_message(4, [["10", "0"]], []), self._diff_message(6, [["9", "2"]], [])]
+        tracker._saved_message_queues[self.trading_pair].extend(saved_diffs)
+        tracker._track_single_book = AsyncMock()
+
+        self.async_run_with_timeout(tracker._init_order_books())
+
+        # Connectors with different update id bases for snapshots and diffs rely on all the saved diffs being applied
+        self.assertEqual(saved_diffs, list(tracker._saved_message_queues[self.trading_pair]))
@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import TokenGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -82,6 +82,45 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_find_rate_through_multiple_hops(self):
+        prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "EUR-GBP": Decimal("0.5"),
+                  "ETH-EUR": Decimal("1000")}
+
+        self.assertEqual(Decimal("150"), find_rate(prices, "HBOT-EUR"))
+        self.assertEqual(Decimal("0.15"), find_rate(prices, "HBOT-WETH"))
+        self.assertEqual(Decimal("1"), find_rate(prices, "WETH-ETH"))
+        self.assertIsNone(find_rate(prices, "HBOT-ZBOT"))
+
+    def test_token_graph_caches_paths(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        graph = TokenGraph(prices)
+
+        self.assertEqual(["HBOT", "AAVE", "GBP"], graph.neighbors("USDT"))
+        self.assertEqual(Decimal("2"), find_rate(prices, "HBOT-AAVE", token_graph=graph))
+        self.assertEqual([("HBOT-USDT", False), ("AAVE-USDT", True)], graph._paths["HBOT-AAVE"])
+
+        # The same pairs with new prices keep the graph and its cached paths
+        new_prices = {"HBOT-USDT": Decimal("120"), "AAVE-USDT": Decimal("60"), "USDT-GBP": Decimal("0.75")}
+        self.assertIs(graph, graph.update_prices(new_prices))
+        self.assertIn("HBOT-AAVE", graph._paths)
+        self.assertEqual(Decimal("2"), find_rate(new_prices, "HBOT-AAVE", token_graph=graph))
+
+        new_pairs_prices = {"HBOT-USDT": Decimal("120"), "AAVE-GBP": Decimal("45")}
+        new_graph = graph.update_prices(new_pairs_prices)
+        self.assertIsNot(graph, new_graph)
+        self.assertIsNone(find_rate(new_pairs_prices, "HBOT-AAVE", token_graph=new_graph))
+
+    def test_rate_oracle_token_graph_refreshed_with_stored_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={self.trading_pair: Decimal("10")}))
+        rate_oracle._prices = {self.trading_pair: Decimal("10")}
+
+        self.assertEqual(Decimal("0.1"), rate_oracle.get_pair_rate(f"{self.global_token}-{self.target_token}"))
+        self.assertIsNone(rate_oracle.get_pair_rate(f"{self.target_token}-USDT"))
+
+        rate_oracle._prices["HBOT-USDT"] = Decimal("2")
+
+        self.assertEqual(Decimal("20"), rate_oracle.get_pair_rate(f"{self.target_token}-USDT"))
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
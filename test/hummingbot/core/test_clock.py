@@ -7,6 +7,7 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.clock_profiler import ClockProfiler
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -112,6 +113,19 @@ class ClockUnitTest(unittest.TestCase):
 
         self.assertGreaterEqual(self.clock_realtime.current_timestamp, self.realtime_end_timestamp)
 
+    def test_run_til_with_profiler(self):
+        time_iterator: TimeIterator = TimeIterator()
+        self.clock_realtime.add_iterator(time_iterator)
+        profiler = ClockProfiler()
+        self.clock_realtime.profiler = profiler
+
+        with self.clock_realtime:
+            self.ev_loop.run_until_complete(self.clock_realtime.run_til(self.realtime_end_timestamp))
+
+        self.assertGreater(profiler.ticks, 0)
+        self.assertEqual(profiler.ticks, profiler.iterator_latencies["TimeIterator"].count)
+        self.assertGreaterEqual(profiler.tick_lag.max, 0)
+
     def test_backtest(self):
         # Note: Technically you do not execute `backtest()` when in REALTIME mode
 
@@ -0,0 +1,108 @@
+import unittest
+
+from hummingbot.core.clock_profiler import ClockProfiler, LatencyHistogram
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.mean)
+        self.assertEqual(0, histogram.percentile(50))
+
+    def test_add_values_to_buckets(self):
+        histogram = LatencyHistogram(buckets=(1, 10, 100))
+
+        for value in (0.5, 1, 2, 20, 200):
+            histogram.add(value)
+
+        self.assertEqual([2, 1, 1, 1], histogram.bucket_counts)
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(223.5 / 5, histogram.mean)
+        self.assertEqual(200, histogram.max)
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram(buckets=(1, 10, 100))
+
+        for _ in range(98):
+            histogram.add(0.5)
+        histogram.add(5)
+        histogram.add(50)
+
+        self.assertEqual(1, histogram.percentile(50))
+        self.assertEqual(10, histogram.percentile(99))
+        self.assertEqual(50, histogram.percentile(100))
+
+    def test_percentile_capped_by_max_value(self):
+        histogram = LatencyHistogram(buckets=(1, 10, 100))
+        histogram.add(2)
+
+        self.assertEqual(2, histogram.percentile(50))
+
+
+class ClockProfilerTest(unittest.TestCase):
+
+    def test_record_iterator_ticks(self):
+        profiler = ClockProfiler()
+        iterator = TimeIterator()
+        other_iterator = TimeIterator()
+
+        profiler.record_iterator_tick(iterator, 0.001)
+        profiler.record_iterator_tick(iterator, 0.003)
+        profiler.record_iterator_tick(other_iterator, 0.002)
+
+        self.assertEqual(1, len(profiler.iterator_latencies))
+        histogram = profiler.iterator_latencies["TimeIterator"]
+        self.assertEqual(3, histogram.count)
+        self.assertAlmostEqual(2, histogram.mean)
+
+    def test_record_ticks(self):
+        profiler = ClockProfiler()
+
+        profiler.record_tick(lag=0.0005, elapsed=0.002, missed_ticks=0)
+        profiler.record_tick(lag=0.0015, elapsed=0.004, missed_ticks=2)
+
+        self.assertEqual(2, profiler.ticks)
+        self.assertEqual(2, profiler.missed_ticks)
+        self.assertAlmostEqual(1, profiler.tick_lag.mean)
+        self.assertAlmostEqual(3, profiler.tick_latency.mean)
+
+    def test_reset(self):
+        profiler = ClockProfiler()
+        profiler.record_iterator_tick(TimeIterator(), 0.001)
+        profiler.record_tick(lag=0.001, elapsed=0.001, missed_ticks=1)
+
+        profiler.reset()
+
+        self.assertEqual(0, profiler.ticks)
+        self.assertEqual(0, profiler.missed_ticks)
+        self.assertEqual({}, profiler.iterator_latencies)
+
+    def test_iterators_df_sorted_by_total_time(self):
+        profiler = ClockProfiler()
+
+        class SlowIterator(TimeIterator):
+            pass
+
+        profiler.record_iterator_tick(TimeIterator(), 0.001)
+        profiler.record_iterator_tick(SlowIterator(), 0.01)
+
+        iterators_df = profiler.iterators_df()
+
+        self.assertEqual(["SlowIterator", "TimeIterator"], list(iterators_df["Iterator"]))
+        self.assertAlmostEqual(0.01, iterators_df["Total (s)"].iloc[0])
+
+    def test_report(self):
+        profiler = ClockProfiler()
+        profiler.record_iterator_tick(TimeIterator(), 0.001)
+        profiler.record_tick(lag=0.001, elapsed=0.001, missed_ticks=1)
+
+        report = profiler.report()
+
+        self.assertEqual(1, report["ticks"])
+        self.assertEqual(1, report["missed_ticks"])
+        self.assertEqual(1, report["tick_lag"]["count"])
+        self.assertEqual(1, report["iterators"]["TimeIterator"]["count"])
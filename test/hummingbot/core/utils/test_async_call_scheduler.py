@@ -0,0 +1,158 @@
+import asyncio
+import unittest
+from typing import Awaitable, List
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+
+
+class AsyncCallSchedulerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.scheduler = AsyncCallScheduler(call_interval=0)
+
+    def tearDown(self) -> None:
+        self.scheduler.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    async def delayed_result(result: str, delay: float, calls: List[str]) -> str:
+        calls.append(f"start {result}")
+        await asyncio.sleep(delay)
+        calls.append(f"end {result}")
+        return result
+
+    def test_default_lane_executes_one_call_at_a_time(self):
+        calls = []
+
+        results = self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.schedule_async_call(self.delayed_result("first", 0.05, calls), 1),
+            self.scheduler.schedule_async_call(self.delayed_result("second", 0, calls), 1),
+        ))
+
+        self.assertEqual(["first", "second"], results)
+        self.assertEqual(["start first", "end first", "start second", "end second"], calls)
+
+    def test_slow_call_does_not_block_other_lanes(self):
+        calls = []
+
+        results = self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.schedule_async_call(self.delayed_result("slow", 0.1, calls), 1, lane="slow_lane"),
+            self.scheduler.schedule_async_call(self.delayed_result("fast", 0, calls), 1, lane="fast_lane"),
+        ))
+
+        self.assertEqual(["slow", "fast"], results)
+        self.assertEqual(["start slow", "start fast", "end fast", "end slow"], calls)
+        self.assertEqual([AsyncCallScheduler.DEFAULT_LANE, "slow_lane", "fast_lane"], self.scheduler.lanes)
+
+    def test_lane_concurrency(self):
+        calls = []
+        self.scheduler.configure_lane("lane", concurrency=2)
+
+        self.async_run_with_timeout(asyncio.gather(*[
+            self.scheduler.schedule_async_call(self.delayed_result(str(i), 0.05, calls), 1, lane="lane")
+            for i in range(3)
+        ]))
+
+        self.assertEqual(["start 0", "start 1", "end 0", "end 1", "start 2", "end 2"], calls)
+
+    def test_reconfiguring_lane_lets_in_flight_calls_finish(self):
+        calls = []
+        self.scheduler.configure_lane("lane", concurrency=1)
+        slow_call = self.ev_loop.create_task(
+            self.scheduler.schedule_async_call(self.delayed_result("slow", 0.1, calls), 1, lane="lane"))
+        self.async_run_with_timeout(asyncio.sleep(0.02))
+        self.assertEqual(["start slow"], calls)
+
+        self.scheduler.configure_lane("lane", concurrency=2)
+        results = self.async_run_with_timeout(asyncio.gather(
+            slow_call,
+            self.scheduler.schedule_async_call(self.delayed_result("fast", 0, calls), 1, lane="lane"),
+        ))
+
+        self.assertEqual(["slow", "fast"], results)
+        self.assertEqual(["start slow", "start fast", "end fast", "end slow"], calls)
+        self.assertEqual(2, self.scheduler.lane_metrics["lane"].completed_calls)
+        self.assertEqual(2, len(self.scheduler._lanes["lane"].worker_tasks))
+
+    def test_lane_call_interval(self):
+        self.scheduler.configure_lane("paced_lane", call_interval=0.1)
+        calls = []
+        start = self.ev_loop.time()
+
+        self.async_run_with_timeout(asyncio.gather(*[
+            self.scheduler.schedule_async_call(self.delayed_result(str(i), 0, calls), 1, lane="paced_lane")
+            for i in range(3)
+        ]))
+
+        self.assertGreaterEqual(self.ev_loop.time() - start, 0.2)
+
+    def test_configure_lane_with_invalid_concurrency_raises_error(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.configure_lane("lane", concurrency=0)
+
+    def test_lane_metrics(self):
+        calls = []
+
+        async def failing_call():
+            raise IOError("Test error")
+
+        self.async_run_with_timeout(asyncio.gather(
+            self.scheduler.schedule_async_call(self.delayed_result("first", 0.05, calls), 1, lane="lane"),
+            self.scheduler.schedule_async_call(self.delayed_result("second", 0, calls), 1, lane="lane"),
+            self.scheduler.schedule_async_call(failing_call(), 1, lane="lane"),
+            return_exceptions=True,
+        ))
+
+        metrics = self.scheduler.lane_metrics["lane"]
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertEqual(0, metrics.in_flight_calls)
+        self.assertEqual(2, metrics.completed_calls)
+        self.assertEqual(1, metrics.failed_calls)
+        self.assertGreaterEqual(metrics.max_wait_time, 0.05)
+        self.assertGreaterEqual(metrics.max_call_time, 0.05)
+        self.assertLess(metrics.average_call_time, metrics.max_call_time)
+        self.assertEqual(0, self.scheduler.lane_metrics[AsyncCallScheduler.DEFAULT_LANE].completed_calls)
+
+    def test_queue_depth_of_waiting_calls(self):
+        calls = []
+        first_call = asyncio.ensure_future(
+            self.scheduler.schedule_async_call(self.delayed_result("first", 0.1, calls), 1, lane="lane"))
+        second_call = asyncio.ensure_future(
+            self.scheduler.schedule_async_call(self.delayed_result("second", 0, calls), 1, lane="lane"))
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        metrics = self.scheduler.lane_metrics["lane"]
+        self.assertEqual(1, metrics.queue_depth)
+        self.assertEqual(1, metrics.in_flight_calls)
+
+        self.async_run_with_timeout(asyncio.gather(first_call, second_call))
+
+    def test_call_timeout_reported_as_failed_call(self):
+        calls = []
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(
+                self.scheduler.schedule_async_call(self.delayed_result("slow", 0.2, calls), 0.05, lane="lane"))
+
+        self.assertEqual(1, self.scheduler.lane_metrics["lane"].failed_calls)
+
+    def test_call_async_executes_function_in_lane(self):
+        result = self.async_run_with_timeout(self.scheduler.call_async(lambda x: x * 2, 21, lane="lane"))
+
+        self.assertEqual(42, result)
+        self.assertEqual(1, self.scheduler.lane_metrics["lane"].completed_calls)
+
+    def test_stop_cancels_lane_workers(self):
+        self.async_run_with_timeout(self.scheduler.call_async(lambda: None, lane="lane"))
+        self.assertTrue(self.scheduler.started)
+
+        self.scheduler.stop()
+
+        self.assertFalse(self.scheduler.started)
+        self.assertIsNone(self.scheduler.coro_scheduler_task)
@@ -312,6 +312,41 @@ class TestBinanceSpotCandles(unittest.TestCase):
         self.assertEqual(self.data_feed.candles_df.shape[0], 2)
         self.assertEqual(self.data_feed.candles_df.shape[1], 10)
 
+    def test_candles_df_cached_until_candles_change(self):
+        self.data_feed._candles.append([1672981200000.0, 16823.24, 16823.63, 16792.12, 16810.18, 6230.44034, 1.0,
+                                        1.0, 1.0, 1.0])
+        cached_df = self.data_feed.candles_df
+
+        # The same DataFrame is returned until the candles change
+        self.assertIs(cached_df, self.data_feed.candles_df)
+        self.assertEqual(10, cached_df.shape[1])
+
+        self.data_feed._candles.update_last([1672981200000.0, 16823.24, 16823.63, 16792.12, 16815.5, 6230.44034, 1.0,
+                                             1.0, 1.0, 1.0])
+
+        self.assertEqual(16815.5, self.data_feed.candles_df["close"].iloc[-1])
+        self.assertIsNot(cached_df, self.data_feed._candles_df)
+        self.assertEqual(16815.5, self.data_feed.candles_array[-1][4])
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_process_websocket_messages_updates_last_candle(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.data_feed._candles.append([1672981200000.0, 16823.24, 16823.63, 16792.12, 16810.18, 6230.44034, 1.0,
+                                        1.0, 1.0, 1.0])
+        message = self.get_candles_ws_data_mock_1()
+        message["k"]["t"] = 1672981200000
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(message))
+
+        self.listening_task = self.ev_loop.create_task(self.data_feed.listen_for_subscriptions())
+
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, len(self.data_feed._candles))
+        self.assertEqual(float(message["k"]["c"]), self.data_feed.candles_df["close"].iloc[-1])
+
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
         raise exception
@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = CandlesBuffer(maxlen=3, n_columns=2)
+
+    def test_append_until_full_drops_oldest(self):
+        for timestamp in range(5):
+            self.buffer.append([timestamp, timestamp * 10])
+
+        self.assertEqual(3, len(self.buffer))
+        np.testing.assert_array_equal([[2, 20], [3, 30], [4, 40]], self.buffer.array)
+        self.assertEqual(2, self.buffer[0][0])
+        self.assertEqual(4, self.buffer[-1][0])
+
+    def test_array_is_read_only_view_of_storage(self):
+        for timestamp in range(4):
+            self.buffer.append([timestamp, 0])
+
+        array = self.buffer.array
+
+        self.assertFalse(array.flags.writeable)
+        self.assertTrue(array.flags.c_contiguous)
+        self.assertTrue(np.shares_memory(array, self.buffer._storage))
+
+    def test_update_last_replaces_newest_candle(self):
+        self.buffer.append([1, 10])
+        self.buffer.append([2, 20])
+        version = self.buffer.version
+
+        self.buffer.update_last([2, 25])
+
+        np.testing.assert_array_equal([[1, 10], [2, 25]], self.buffer.array)
+        self.assertGreater(self.buffer.version, version)
+
+    def test_update_last_on_empty_buffer_raises(self):
+        with self.assertRaises(IndexError):
+            self.buffer.update_last([1, 10])
+
+    def test_extendleft_prepends_older_candles(self):
+        self.buffer.append([3, 30])
+
+        self.buffer.extendleft([[2, 20], [1, 10]])
+
+        np.testing.assert_array_equal([[1, 10], [2, 20], [3, 30]], self.buffer.array)
+
+        # When full the newest candle is dropped, as in a deque
+        self.buffer.appendleft([0, 0])
+        np.testing.assert_array_equal([[0, 0], [1, 10], [2, 20]], self.buffer.array)
+
+    def test_pop_and_clear(self):
+        self.buffer.append([1, 10])
+        self.buffer.append([2, 20])
+
+        np.testing.assert_array_equal([2, 20], self.buffer.pop())
+        self.assertEqual(1, len(self.buffer))
+
+        self.buffer.clear()
+        self.assertEqual(0, len(self.buffer))
+        self.assertEqual((0, 2), self.buffer.array.shape)
+        with self.assertRaises(IndexError):
+            self.buffer[0]
@@ -0,0 +1,158 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_indicators import (
+    ATR,
+    EMA,
+    MACD,
+    RSI,
+    BollingerBands,
+    CandlesIndicators,
+)
+
+
+class CandlesIndicatorsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.candles_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=100)
+        self.indicators = CandlesIndicators(
+            self.candles_feed,
+            [EMA(10), RSI(14), ATR(14), BollingerBands(20, 2), MACD(12, 26, 9)])
+        self.random = np.random.RandomState(42)
+        self.close = 100.0
+
+    def _candle(self, timestamp: float, close: float):
+        high = close + self.random.uniform(0, 1)
+        low = close - self.random.uniform(0, 1)
+        return [timestamp, close, high, low, close, 10, 1000, 5, 5, 500]
+
+    def _stream_candles(self, n_candles: int, updates_per_candle: int = 3):
+        for i in range(n_candles):
+            timestamp = 1672981200000.0 + i * 60000
+            self.close += self.random.normal(0, 1)
+            self.candles_feed._candles.append(self._candle(timestamp, self.close))
+            self.indicators.update()
+            for _ in range(updates_per_candle):
+                self.close += self.random.normal(0, 0.3)
+                self.candles_feed._candles.update_last(self._candle(timestamp, self.close))
+                self.indicators.update()
+
+    @staticmethod
+    def _ema(close: pd.Series, length: int) -> pd.Series:
+        close = close.copy()
+        if len(close) < length:
+            return close * np.nan
+        seed = close.iloc[0:length].mean()
+        close.iloc[:length - 1] = np.nan
+        close.iloc[length - 1] = seed
+        return close.ewm(span=length, adjust=False).mean()
+
+    @staticmethod
+    def _rma(values: pd.Series, length: int) -> pd.Series:
+        return values.ewm(alpha=1.0 / length, min_periods=length).mean()
+
+    def _expected_indicators(self, candles_df: pd.DataFrame) -> pd.DataFrame:
+        close, high, low = candles_df["close"], candles_df["high"], candles_df["low"]
+        expected = pd.DataFrame(index=candles_df.index)
+        expected["EMA_10"] = self._ema(close, 10)
+
+        change = close.diff()
+        gains = self._rma(change.clip(lower=0), 14)
+        losses = self._rma(-change.clip(upper=0), 14)
+        expected["RSI_14"] = 100 * gains / (gains + losses)
+
+        previous_close = close.shift(1)
+        true_range = pd.concat([high - low, high - previous_close, previous_close - low], axis=1).abs().max(axis=1)
+        true_range.iloc[0] = np.nan
+        expected["ATRr_14"] = self._rma(true_range, 14)
+
+        mean = close.rolling(20).mean()
+        deviation = 2 * close.rolling(20).std(ddof=0)
+        expected["BBL_20_2.0"] = mean - deviation
+        expected["BBM_20_2.0"] = mean
+        expected["BBU_20_2.0"] = mean + deviation
+        expected["BBB_20_2.0"] = 100 * (2 * deviation) / mean
+        expected["BBP_20_2.0"] = (close - (mean - deviation)) / (2 * deviation)
+
+        macd = self._ema(close, 12) - self._ema(close, 26)
+        signal = self._ema(macd.loc[macd.first_valid_index():], 9).reindex(macd.index)
+        expected["MACD_12_26_9"] = macd
+        expected["MACDh_12_26_9"] = macd - signal
+        expected["MACDs_12_26_9"] = signal
+        return expected
+
+    def _assert_matches_recalculation(self):
+        candles_df = self.indicators.candles_df
+        expected = self._expected_indicators(candles_df)
+        self.assertEqual(self.indicators.names, list(expected.columns))
+        np.testing.assert_allclose(expected.to_numpy(), candles_df[self.indicators.names].to_numpy(), rtol=1e-9)
+
+    def test_names(self):
+        self.assertEqual(["EMA_10", "RSI_14", "ATRr_14", "BBL_20_2.0", "BBM_20_2.0", "BBU_20_2.0", "BBB_20_2.0",
+                          "BBP_20_2.0", "MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9"], self.indicators.names)
+
+    def test_no_candles(self):
+        self.assertEqual(0, len(self.indicators.values_array))
+        self.assertTrue(all(np.isnan(value) for value in self.indicators.current_values.values()))
+
+    def test_incremental_values_match_recalculation(self):
+        self._stream_candles(60)
+
+        self.assertEqual(60, len(self.indicators.values_array))
+        self._assert_matches_recalculation()
+
+    def test_open_candle_update_only_recalculates_last_values(self):
+        self._stream_candles(40)
+        closed_values = self.indicators.values_array[:-1].copy()
+
+        self.close += 5
+        self.candles_feed._candles.update_last(self._candle(self.candles_feed._candles[-1][0], self.close))
+
+        np.testing.assert_array_equal(closed_values, self.indicators.values_array[:-1])
+        self._assert_matches_recalculation()
+        self.assertEqual(self.indicators.values_array[-1][0], self.indicators.current_values["EMA_10"])
+
+    def test_several_candles_closed_between_updates(self):
+        self._stream_candles(30)
+        for i in range(30, 35):
+            self.close += self.random.normal(0, 1)
+            self.candles_feed._candles.append(self._candle(1672981200000.0 + i * 60000, self.close))
+
+        self._assert_matches_recalculation()
+
+    def test_values_recalculated_when_historical_candles_loaded(self):
+        historical = []
+        for i in range(30):
+            self.close += self.random.normal(0, 1)
+            historical.append(self._candle(1672981200000.0 + i * 60000, self.close))
+        self.close += self.random.normal(0, 1)
+        self.candles_feed._candles.append(self._candle(1672981200000.0 + 30 * 60000, self.close))
+        self.indicators.update()
+
+        self.candles_feed._candles.extendleft(historical[::-1])
+
+        self.assertEqual(31, len(self.indicators.values_array))
+        self._assert_matches_recalculation()
+
+    def test_values_follow_candles_when_buffer_is_full(self):
+        self._stream_candles(130, updates_per_candle=1)
+
+        self.assertEqual(100, len(self.indicators.values_array))
+        candles_df = self.indicators.candles_df
+        self.assertEqual(100, len(candles_df))
+        np.testing.assert_array_equal(self.indicators.values_array, candles_df[self.indicators.names].to_numpy())
+        # The candles DataFrame shared by the feed callers is not modified
+        self.assertEqual(CandlesBase.columns, list(self.candles_feed.candles_df.columns))
+
+    def test_values_reset_when_candles_cleared(self):
+        self._stream_candles(10)
+
+        self.candles_feed._candles.clear()
+        self.candles_feed._candles.append(self._candle(1672981200000.0 + 50 * 60000, self.close))
+
+        self.assertEqual(1, len(self.indicators.values_array))
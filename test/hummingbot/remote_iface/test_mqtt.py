@@ -43,6 +43,8 @@ class RemoteIfaceMQTTTests(TestCase):
             'balance/limit',
             'balance/paper',
             'command_shortcuts',
+            'tick_profile',
+            'strategy_latency',
         ]
         cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         cls.START_URI = 'hbot/$instance_id/start'
@@ -54,6 +56,8 @@ class RemoteIfaceMQTTTests(TestCase):
         cls.BALANCE_LIMIT_URI = 'hbot/$instance_id/balance/limit'
         cls.BALANCE_PAPER_URI = 'hbot/$instance_id/balance/paper'
         cls.COMMAND_SHORTCUT_URI = 'hbot/$instance_id/command_shortcuts'
+        cls.TICK_PROFILE_URI = 'hbot/$instance_id/tick_profile'
+        cls.STRATEGY_LATENCY_URI = 'hbot/$instance_id/strategy_latency'
         cls.fake_mqtt_broker = FakeMQTTBroker()
 
     @classmethod
@@ -620,6 +624,60 @@ class RemoteIfaceMQTTTests(TestCase):
         self.ev_loop.run_until_complete(self.wait_for_rcv(topic, msg, msg_key='data'))
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
 
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_command_tick_profile(self,
+                                       mock_mqtt):
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.TICK_PROFILE_URI), {'action': 'start'})
+        topic = f"test_reply/hbot/{self.instance_id}/tick_profile"
+        self.ev_loop.run_until_complete(self.wait_for_rcv(topic))
+        response = self.fake_mqtt_broker.received_msgs[topic][0]['data']
+        self.assertEqual(200, response['status'])
+        self.assertEqual(0, response['data']['ticks'])
+        self.assertIsNotNone(self.hbapp.clock_profiler)
+
+        self.hbapp.clock_profiler.record_tick(lag=0.001, elapsed=0.002, missed_ticks=1)
+        report = self.hbapp.clock_profiler.report()
+        self.assertEqual(1, report["ticks"])
+        self.assertEqual(1, report["missed_ticks"])
+        self.hbapp.set_tick_profiling("stop")
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_command_tick_profile_stop(self,
+                                            mock_mqtt):
+        self.hbapp.set_tick_profiling("start")
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.TICK_PROFILE_URI), {'action': 'stop'})
+        topic = f"test_reply/hbot/{self.instance_id}/tick_profile"
+        msg = {'status': 200,
+               'msg': 'Tick profiling stopped.',
+               'data': {}}
+        self.ev_loop.run_until_complete(self.wait_for_rcv(topic, msg, msg_key='data'))
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+        self.assertIsNone(self.hbapp.clock_profiler)
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_command_tick_profile_failure(self,
+                                               mock_mqtt):
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.TICK_PROFILE_URI), {})
+        topic = f"test_reply/hbot/{self.instance_id}/tick_profile"
+        msg = {'status': 400,
+               'msg': 'Tick profiling is not enabled - please run "tick_profile start" first',
+               'data': {}}
+        self.ev_loop.run_until_complete(self.wait_for_rcv(topic, msg, msg_key='data'))
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_command_strategy_latency_failure(self,
+                                                   mock_mqtt):
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        self.fake_mqtt_broker.publish_to_subscription(self.get_topic_for(self.STRATEGY_LATENCY_URI), {})
+        topic = f"test_reply/hbot/{self.instance_id}/strategy_latency"
+        msg = {'status': 400, 'msg': 'No strategy is currently running!', 'data': {}}
+        self.ev_loop.run_until_complete(self.wait_for_rcv(topic, msg, msg_key='data'))
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+
     @patch("commlib.transports.mqtt.MQTTTransport")
     def test_mqtt_command_stop(self,
                                mock_mqtt):
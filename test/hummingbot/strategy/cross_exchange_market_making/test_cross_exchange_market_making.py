@@ -4,7 +4,7 @@ from copy import deepcopy
 from decimal import Decimal
 from math import ceil, floor
 from typing import Awaitable, List
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
 
@@ -1049,3 +1049,128 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.006"), ask_order.price)
         self.assertAlmostEqual(Decimal("1"), round(bid_order.quantity, 4))
         self.assertAlmostEqual(Decimal("1"), round(ask_order.quantity, 4))
+
+    def test_concurrent_market_pairs_are_processed_in_parallel(self):
+        second_maker_market: MockPaperExchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        second_maker_market.set_balanced_order_book(self.trading_pairs_maker[0], 1.0, 0.5, 1.5, 0.01, 10)
+        second_market_pair: MakerTakerMarketPair = MakerTakerMarketPair(
+            MarketTradingPairTuple(second_maker_market, *self.trading_pairs_maker),
+            MarketTradingPairTuple(self.taker_market, *self.trading_pairs_taker),
+        )
+        config_map_raw = deepcopy(self.config_map_raw)
+        config_map_raw.concurrent_market_pairs = True
+        strategy: CrossExchangeMarketMakingStrategy = CrossExchangeMarketMakingStrategy()
+        strategy.init_params(
+            config_map=ClientConfigAdapter(config_map_raw),
+            market_pairs=[self.market_pair, second_market_pair],
+            logging_options=self.logging_options,
+        )
+        calls = []
+
+        async def process_market_pair(timestamp, market_pair, active_orders):
+            calls.append(("start", market_pair))
+            await asyncio.sleep(0.01)
+            calls.append(("end", market_pair))
+
+        with patch.object(strategy, "process_market_pair", side_effect=process_market_pair):
+            self.async_run_with_timeout(strategy.main(self.start_timestamp))
+
+        self.assertEqual([("start", self.market_pair), ("start", second_market_pair)], calls[:2])
+        self.assertEqual(1, strategy.market_pair_cycle_latencies[self.market_pair].count)
+        self.assertEqual(1, strategy.market_pair_cycle_latencies[second_market_pair].count)
+        report = strategy.latency_report()["market_pair_cycles"]
+        self.assertEqual(1, report[f"{self.maker_market.display_name}:{self.trading_pairs_maker[0]}"]["count"])
+        self.assertIn("Cycle latency", strategy.format_status())
+
+    def test_hedges_go_before_queued_market_pair_cycles(self):
+        calls = []
+
+        async def process_market_pair(timestamp, market_pair, active_orders):
+            calls.append("cycle")
+            await asyncio.sleep(0.01)
+
+        async def check_and_hedge_orders(market_pair):
+            calls.append("hedge")
+
+        async def run_cycles_and_hedge():
+            running_cycle = asyncio.ensure_future(
+                self.strategy.process_market_pair_cycle(self.start_timestamp, self.market_pair, []))
+            await asyncio.sleep(0)
+            queued_cycle = asyncio.ensure_future(
+                self.strategy.process_market_pair_cycle(self.start_timestamp + 1, self.market_pair, []))
+            hedge = asyncio.ensure_future(self.strategy.hedge_market_pair(self.market_pair))
+            await asyncio.gather(running_cycle, queued_cycle, hedge)
+
+        with patch.object(self.strategy, "process_market_pair", side_effect=process_market_pair), \
+                patch.object(self.strategy, "check_and_hedge_orders", side_effect=check_and_hedge_orders):
+            self.async_run_with_timeout(run_cycles_and_hedge())
+
+        # The queued cycle is skipped since a hedge of the market pair was waiting for the lock
+        self.assertEqual(["cycle", "hedge"], calls)
+        self.assertEqual(1, self.strategy.market_pair_cycle_latencies[self.market_pair].count)
+
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_exchange_names")
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings")
+    def test_maker_fill_hedged_from_fill_event(self, get_connector_settings_mock, get_exchange_names_mock):
+        get_exchange_names_mock.return_value = set(self.get_mock_connector_settings().keys())
+        get_connector_settings_mock.return_value = self.get_mock_connector_settings()
+        self.config_map_raw.fast_hedge_enabled = True
+        self.clock.backtest_til(self.start_timestamp + 5)
+        if len(self.maker_order_created_logger.event_log) == 0:
+            self.async_run_with_timeout(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+
+        bid_order: LimitOrder = self.strategy.active_maker_bids[0][1]
+        self.simulate_maker_market_trade(False, Decimal("10.0"), bid_order.price * Decimal("0.99"))
+
+        # The taker order is placed while the fill event is processed, at the price computed in the last tick
+        self.assertEqual(1, len(self.maker_order_fill_logger.event_log))
+        self.assertEqual(1, len(self.strategy._taker_to_maker_order_ids))
+        self.assertEqual(1, self.strategy.hedge_latencies["fill_to_submit"].count)
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+        if len(self.taker_order_created_logger.event_log) == 0:
+            self.async_run_with_timeout(self.taker_order_created_logger.wait_for(SellOrderCreatedEvent))
+        if len(self.taker_order_fill_logger.event_log) == 0:
+            self.async_run_with_timeout(self.taker_order_fill_logger.wait_for(OrderFilledEvent))
+
+        taker_fill: OrderFilledEvent = self.taker_order_fill_logger.event_log[0]
+        self.assertEqual(TradeType.SELL, taker_fill.trade_type)
+        self.assertAlmostEqual(Decimal("0.9995"), taker_fill.price)
+        self.assertAlmostEqual(Decimal("3.0"), taker_fill.amount)
+        self.assertEqual(1, self.strategy.hedge_latencies["fill_to_ack"].count)
+        self.assertEqual(1, self.strategy.latency_report()["hedges"]["submit_to_ack"]["count"])
+        self.assertIn("Hedge latency", self.strategy.format_status())
+
+    def test_maker_fill_time_removed_when_fill_is_not_hedged(self):
+        self.strategy._maker_to_taker_order_ids["maker_order"] = []
+        fill_event = OrderFilledEvent(self.start_timestamp, "maker_order", self.trading_pairs_maker[0], TradeType.BUY,
+                                      OrderType.LIMIT, Decimal("1"), Decimal("0.0001"),
+                                      AddedToCostTradeFee(Decimal(0)), "maker_trade")
+
+        # The hedge attempt does not place any taker order (fill amount below the taker minimum)
+        with patch.object(self.strategy, "record_maker_fill", return_value=self.market_pair), \
+                patch.object(self.strategy, "check_and_hedge_orders", new=AsyncMock()):
+            self.strategy.did_fill_order(fill_event)
+            self.async_run_with_timeout(asyncio.gather(*self.strategy._hedge_maker_order_tasks))
+
+        self.assertEqual({}, self.strategy._maker_fill_times)
+        self.assertEqual(0, self.strategy.hedge_latencies["fill_to_submit"].count)
+
+    def test_hedge_acknowledged_while_being_placed(self):
+        self.strategy._maker_to_taker_order_ids["maker_order"] = []
+        self.strategy._maker_fill_times["maker_trade"] = 0
+
+        def sell_with_specific_market(*args, **kwargs):
+            self.strategy.did_create_sell_order(MagicMock(order_id="taker_order"))
+            return "taker_order"
+
+        with patch.object(self.strategy, "sell_with_specific_market", side_effect=sell_with_specific_market):
+            order_id = self.strategy.place_order(self.market_pair, False, False, Decimal("1"), Decimal("1"),
+                                                 "maker_order", "maker_trade")
+
+        self.assertEqual("taker_order", order_id)
+        self.assertEqual({}, self.strategy._maker_fill_times)
+        self.assertEqual({}, self.strategy._hedge_submit_times)
+        self.assertEqual(1, self.strategy.hedge_latencies["fill_to_submit"].count)
+        self.assertEqual(1, self.strategy.hedge_latencies["fill_to_ack"].count)
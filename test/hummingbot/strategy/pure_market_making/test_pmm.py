@@ -2,6 +2,7 @@ import unittest
 from decimal import Decimal
 from test.mock.mock_asset_price_delegate import MockAssetPriceDelegate
 from typing import List, Optional
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -961,6 +962,27 @@ class PMMUnitTest(unittest.TestCase):
         assert isinstance(mid_price, Decimal)
         assert isinstance(last_trade, Decimal)
 
+    def test_reference_price_reused_until_top_of_book_changes(self):
+        strategy = self.one_level_strategy
+        get_price_by_type = MarketTradingPairTuple.get_price_by_type
+
+        with patch.object(MarketTradingPairTuple, "get_price_by_type", autospec=True,
+                          side_effect=get_price_by_type) as get_price_by_type_mock:
+            first_price = strategy.get_price()
+            self.assertEqual(first_price, strategy.get_price())
+            self.assertEqual(1, get_price_by_type_mock.call_count)
+
+            self.market.set_balanced_order_book(
+                trading_pair=self.trading_pair,
+                mid_price=96,
+                min_price=1,
+                max_price=200,
+                price_step_size=1,
+                volume_step_size=10,
+            )
+            self.assertEqual(Decimal("96"), strategy.get_price())
+            self.assertEqual(2, get_price_by_type_mock.call_count)
+
     def test_external_exchange_price_source(self):
         strategy = self.one_level_strategy
         strategy.asset_price_delegate = self.order_book_asset_del
@@ -9,9 +9,10 @@ from hummingbot.core.event.events import (
     MarketEvent,
     OrderCancelledEvent,
 )
-from hummingbot.strategy.data_types import OrderType
+from hummingbot.strategy.data_types import HangingOrder, OrderType
 from hummingbot.strategy.hanging_orders_tracker import (
     CreatedPairOfOrders,
+    HangingOrdersSet,
     HangingOrdersTracker,
 )
 
@@ -504,3 +505,66 @@ class TestHangingOrdersTracker(unittest.TestCase):
         hanging_order = next((hanging_order for hanging_order in self.tracker.strategy_current_hanging_orders))
 
         self.assertEqual(order.client_order_id, hanging_order.order_id)
+
+    def test_hanging_order_ids_index_follows_the_tracked_orders(self):
+        buy_order = LimitOrder("Order-number-1", "BTC-USDT", True, "BTC", "USDT", Decimal(100), Decimal(1))
+        sell_order = LimitOrder("Order-number-2", "BTC-USDT", False, "BTC", "USDT", Decimal(101), Decimal(1))
+        self.tracker.add_as_hanging_order(buy_order)
+        self.tracker.add_as_hanging_order(sell_order)
+
+        self.assertTrue(self.tracker.is_order_id_in_hanging_orders(buy_order.client_order_id))
+        self.assertTrue(self.tracker.is_order_id_in_hanging_orders(sell_order.client_order_id))
+        self.assertFalse(self.tracker.is_order_id_in_hanging_orders("Order-number-3"))
+
+        self.tracker._did_complete_buy_order(MarketEvent.BuyOrderCompleted.value,
+                                             self,
+                                             BuyOrderCompletedEvent(
+                                                 timestamp=datetime.now().timestamp(),
+                                                 order_id=buy_order.client_order_id,
+                                                 base_asset="BTC",
+                                                 quote_asset="USDT",
+                                                 base_asset_amount=buy_order.quantity,
+                                                 quote_asset_amount=buy_order.quantity * buy_order.price,
+                                                 order_type=OrderType.LIMIT))
+        self.tracker._did_cancel_order(MarketEvent.OrderCancelled.value,
+                                       self,
+                                       OrderCancelledEvent(datetime.now().timestamp(), sell_order.client_order_id))
+
+        self.assertFalse(self.tracker.is_order_id_in_hanging_orders(buy_order.client_order_id))
+        self.assertFalse(self.tracker.is_order_id_in_hanging_orders(sell_order.client_order_id))
+        self.assertTrue(self.tracker.is_order_id_in_completed_hanging_orders(buy_order.client_order_id))
+        self.assertFalse(self.tracker.is_order_id_in_completed_hanging_orders(sell_order.client_order_id))
+        self.assertEqual(set(), self.tracker.original_orders)
+
+    def test_hanging_orders_set_indexes_the_stored_order_id(self):
+        hanging_order = HangingOrder("Order-number-1", "BTC-USDT", True, Decimal(100), Decimal(1), 0)
+        equivalent_order = HangingOrder("Order-number-2", "BTC-USDT", True, Decimal(100), Decimal(1), 0)
+        orders = HangingOrdersSet([hanging_order])
+
+        # Equivalent orders are not added again
+        orders.add(equivalent_order)
+        self.assertEqual(1, len(orders))
+        self.assertIs(hanging_order, orders.get_by_order_id("Order-number-1"))
+        self.assertFalse(orders.contains_order_id("Order-number-2"))
+
+        # Removing an equivalent order removes the stored one
+        orders.remove(equivalent_order)
+        self.assertEqual(0, len(orders))
+        self.assertFalse(orders.contains_order_id("Order-number-1"))
+
+    def test_assigned_hanging_orders_are_indexed(self):
+        hanging_order = HangingOrder("Order-number-1", "BTC-USDT", True, Decimal(100), Decimal(1), 0)
+
+        self.tracker.strategy_current_hanging_orders = {hanging_order}
+
+        self.assertIsInstance(self.tracker.strategy_current_hanging_orders, HangingOrdersSet)
+        self.assertTrue(self.tracker.is_order_id_in_hanging_orders("Order-number-1"))
+
+    def test_is_hanging_order_in_strategy_active_orders(self):
+        active_order = LimitOrder("Order-number-1", "BTC-USDT", True, "BTC", "USDT", Decimal(100), Decimal(1))
+        type(self.strategy).active_orders = PropertyMock(return_value=[active_order])
+
+        self.assertTrue(self.tracker.is_hanging_order_in_strategy_active_orders(
+            HangingOrder(None, "BTC-USDT", True, Decimal(100), Decimal(1), 0)))
+        self.assertFalse(self.tracker.is_hanging_order_in_strategy_active_orders(
+            HangingOrder(None, "BTC-USDT", False, Decimal(100), Decimal(1), 0)))
@@ -485,3 +485,58 @@ class OrderTrackerUnitTests(unittest.TestCase):
 
         # Check that check_and_cleanup_shadow_records clears shadow_limit_orders
         self.assertTrue(len(self.order_tracker.shadow_limit_orders) == 0)
+
+    def test_active_orders_views_are_updated_incrementally(self):
+        for order in self.limit_orders:
+            self.simulate_place_order(self.order_tracker, order, self.market_info)
+            self.simulate_order_created(self.order_tracker, order)
+
+        active_limit_orders = self.order_tracker.active_limit_orders
+        # The view is reused while the active orders do not change
+        self.assertIs(active_limit_orders, self.order_tracker.active_limit_orders)
+        self.assertEqual([order.client_order_id for order in self.limit_orders],
+                         [order.client_order_id for _, order in active_limit_orders])
+
+        bid_to_cancel = self.limit_orders[0]
+        ask_to_stop = self.limit_orders[1]
+        self.simulate_cancel_order(self.order_tracker, bid_to_cancel)
+        self.simulate_stop_tracking_order(self.order_tracker, ask_to_stop, self.market_info)
+
+        bids = self.order_tracker.market_pair_to_active_bids[self.market_info]
+        asks = self.order_tracker.market_pair_to_active_asks[self.market_info]
+        self.assertEqual(len(self.limit_orders) - 2, len(self.order_tracker.active_limit_orders))
+        self.assertEqual(len(self.limit_orders) - 2, len(self.order_tracker.market_pair_to_active_orders[self.market_info]))
+        self.assertNotIn(bid_to_cancel.client_order_id, [order.client_order_id for order in bids])
+        self.assertNotIn(ask_to_stop.client_order_id, [order.client_order_id for order in asks])
+        self.assertTrue(all(order.is_buy for order in bids))
+        self.assertFalse(any(order.is_buy for order in asks))
+        self.assertEqual(bids, [order for _, order in self.order_tracker.active_bids])
+        self.assertEqual(asks, [order for _, order in self.order_tracker.active_asks])
+
+    def test_order_is_active_again_when_the_cancel_expires(self):
+        order: LimitOrder = self.limit_orders[0]
+        self.simulate_place_order(self.order_tracker, order, self.market_info)
+        self.simulate_order_created(self.order_tracker, order)
+
+        self.simulate_cancel_order(self.order_tracker, order)
+        self.assertEqual(0, len(self.order_tracker.active_bids))
+
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION - self.clock_tick_size)
+        self.assertEqual(0, len(self.order_tracker.active_bids))
+
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION)
+        self.assertFalse(self.order_tracker.has_in_flight_cancel(order.client_order_id))
+        self.assertEqual(1, len(self.order_tracker.active_bids))
+        self.assertEqual(order.client_order_id, self.order_tracker.active_bids[0][1].client_order_id)
+
+    def test_stopped_order_is_not_active_when_the_cancel_expires(self):
+        order: LimitOrder = self.limit_orders[0]
+        self.simulate_place_order(self.order_tracker, order, self.market_info)
+        self.simulate_order_created(self.order_tracker, order)
+
+        self.simulate_cancel_order(self.order_tracker, order)
+        self.simulate_stop_tracking_order(self.order_tracker, order, self.market_info)
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION)
+
+        self.assertEqual(0, len(self.order_tracker.active_limit_orders))
+        self.assertEqual({}, self.order_tracker.market_pair_to_active_orders)
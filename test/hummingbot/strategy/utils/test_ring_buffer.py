@@ -107,3 +107,61 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_ordered_view_shares_the_buffer_memory(self):
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.add_value(i)
+
+        view = buffer.get_ordered_view()
+        self.assertTrue(np.array_equal(view, np.array([2, 3, 4, 5])))
+        self.assertFalse(view.flags.writeable)
+        self.assertFalse(view.flags.owndata)
+        self.assertEqual(4, buffer.size)
+
+        array = buffer.get_as_numpy_array()
+        buffer.add_value(6)
+        self.assertTrue(np.array_equal(buffer.get_ordered_view(), np.array([3, 4, 5, 6])))
+        self.assertTrue(np.array_equal(array, np.array([2, 3, 4, 5])))
+
+    def test_window_longer_than_int16_range(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i)
+
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.arange(10, length + 10)))
+        self.assertEqual(np.mean(np.arange(10, length + 10)), buffer.mean_value)
+
+    def test_running_stats_match_the_window_values(self):
+        np.random.seed(3141592653)
+        buffer = RingBuffer(50)
+        for value in np.random.normal(20000, 5, 1000):
+            buffer.add_value(value)
+            values = buffer.get_as_numpy_array()
+            self.assertAlmostEqual(np.mean(values), buffer.window_mean, 6)
+            self.assertAlmostEqual(np.var(values), buffer.window_variance, 6)
+            if buffer.is_full:
+                self.assertAlmostEqual(np.std(values), buffer.std_dev, 6)
+
+    def test_stats_are_nan_while_non_finite_values_are_in_the_window(self):
+        buffer = RingBuffer(3)
+        for value in (1, np.nan, 2):
+            buffer.add_value(value)
+        self.assertTrue(np.isnan(buffer.mean_value))
+        self.assertTrue(np.isnan(buffer.variance))
+
+        buffer.add_value(3)
+        buffer.add_value(4)
+        self.assertEqual(3, buffer.mean_value)
+        self.assertAlmostEqual(2 / 3, buffer.variance, 10)
+
+    def test_length_change_keeps_the_last_values(self):
+        buffer = RingBuffer(5)
+        for i in range(7):
+            buffer.add_value(i)
+
+        buffer.length = 3
+
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([4, 5, 6])))
+        self.assertEqual(5, buffer.mean_value)
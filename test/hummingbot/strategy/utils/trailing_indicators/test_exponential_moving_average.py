@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    BUFFER_LENGTH = 20
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_calculate_exponential_moving_average(self):
+        samples = np.random.normal(100, 10, 500)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            window = samples[max(i + 1 - self.BUFFER_LENGTH, 0):i + 1]
+            expected = pd.Series(window).ewm(span=self.BUFFER_LENGTH, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 8)
+
+    def test_non_finite_samples_ignored(self):
+        samples = [100, 101, np.nan, 103, 104]
+        indicator = ExponentialMovingAverageIndicator(3)
+
+        for sample in samples:
+            indicator.add_sample(sample)
+
+        expected = pd.Series(samples[-3:]).ewm(span=3, adjust=True).mean().iloc[-1]
+        self.assertAlmostEqual(expected, indicator.current_value, 8)
+
+    def test_sampling_length_change(self):
+        samples = np.random.normal(100, 10, 50)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for sample in samples:
+            indicator.add_sample(sample)
+
+        indicator.sampling_length = 10
+        indicator.add_sample(100)
+
+        expected = pd.Series(list(samples[-9:]) + [100]).ewm(span=10, adjust=True).mean().iloc[-1]
+        self.assertAlmostEqual(expected, indicator.current_value, 8)
+
+    def test_processing_length_must_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 2)
@@ -66,3 +66,13 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_volatility_updated_as_samples_leave_the_buffer(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 100)))
+        indicator = HistoricalVolatilityIndicator(10, 1)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            window = samples[max(i - 9, 0):i + 1]
+            expected = np.sqrt(np.var(np.diff(np.log(window)))) if window.size > 1 else 0
+            self.assertAlmostEqual(expected, indicator.current_value, 10)
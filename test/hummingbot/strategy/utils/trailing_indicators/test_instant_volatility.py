@@ -20,3 +20,17 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_updated_as_samples_leave_the_buffer(self):
+        samples = np.random.normal(100, 10, 200)
+        indicator = InstantVolatilityIndicator(20, 1)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            window = samples[max(i - 19, 0):i + 1]
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, indicator.current_value, 8)
+
+        indicator.sampling_length = 10
+        self.assertAlmostEqual(np.sqrt(np.sum(np.square(np.diff(samples[-10:]))) / 10),
+                               indicator._indicator_calculation(), 8)
@@ -9,7 +9,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
-from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
@@ -259,3 +259,50 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_trades_matched_to_the_last_quote_before_them(self):
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        trading_intensity_indicator.last_quotes = [{"timestamp": self.start_timestamp + 1, "price": 10},
+                                                   {"timestamp": self.start_timestamp, "price": 5}]
+
+        for timestamp, price in ((self.start_timestamp + 0.5, 6), (self.start_timestamp + 1.5, 12)):
+            trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT", timestamp=timestamp, price=price, amount=1, type=TradeType.BUY))
+        trading_intensity_indicator.calculate(self.start_timestamp + 2)
+
+        self.assertTrue(trading_intensity_indicator.is_sampling_buffer_full)
+        # Quotes older than the last one matched to a trade are discarded
+        self.assertEqual([self.start_timestamp + 2, self.start_timestamp + 1],
+                         [quote["timestamp"] for quote in trading_intensity_indicator.last_quotes])
+        self.assertEqual(float(self.price_delegate.get_price_by_type(PriceType.MidPrice)),
+                         trading_intensity_indicator.last_quotes[0]["price"])
+
+    def test_intensity_estimated_every_estimation_interval(self):
+        def curve_fn(t_, a_, b_):
+            return a_ * np.exp(-b_ * t_)
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2,
+                                                                estimation_interval=2)
+        mid_price = float(self.price_delegate.get_price_by_type(PriceType.MidPrice))
+        timestamp = self.start_timestamp
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": mid_price}]
+        values = []
+        for a in (2, 3, 4, 5):
+            timestamp += 1
+            for price_level in (1, 2, 3, 4):
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp - 0.5,
+                    price=mid_price + price_level,
+                    amount=curve_fn(price_level, a, 0.1),
+                    type=TradeType.BUY))
+            trading_intensity_indicator.calculate(timestamp)
+            values.append(trading_intensity_indicator.current_value)
+
+        # The buffer is full from the second calculation, and only holds the samples of the last two calculations
+        self.assertEqual((0, 0), values[0])
+        self.assertAlmostEqual(2 + 3, values[1][0], 6)
+        self.assertAlmostEqual(0.1, values[1][1], 6)
+        self.assertEqual(values[1], values[2])
+        self.assertAlmostEqual(4 + 5, values[3][0], 6)
+        self.assertAlmostEqual(0.1, values[3][1], 6)